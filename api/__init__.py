@@ -0,0 +1 @@
+# Pacote para a API HTTP local
\ No newline at end of file
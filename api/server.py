@@ -0,0 +1,456 @@
+"""
+API HTTP/JSON local sobre o TransactionService, usando apenas asyncio.
+
+O servidor mantém um único TransactionService (com a conta, os índices e
+os totais já carregados) e um ReportService com o cache de relatórios, de
+forma que cada requisição responde sem reler o arquivo de dados.
+
+Rotas:
+    GET  /balance[?at=YYYY-MM-DD]              saldo atual (ou ao final de uma data)
+    GET  /balance/series?start=&end=[&step=]   evolução do saldo, um ponto a cada step dias
+                                               (?projected=1: inclui as recorrentes previstas)
+    GET  /transactions?start=&end=&type=&category=&min=&max=&text=&prefix=&offset=&limit=
+    POST /transactions                         uma transação ou uma lista (lote atômico)
+    GET  /reports/monthly/<ano>/<mês>          relatório mensal (?transactions=0: só totais)
+    GET  /reports/range?start=YYYY-MM&end=YYYY-MM[&transactions=0]
+    GET  /reports/category/<receita|despesa>   totais por categoria
+    GET  /recurring                            regras de transações recorrentes
+    POST /recurring                            cadastra uma regra recorrente
+
+Todas as chamadas ao serviço acontecem na thread do laço de eventos e sem
+pontos de espera no meio: as gravações ficam serializadas e nunca são
+vistas pela metade, enquanto as leituras de várias conexões são atendidas
+de forma intercalada. A gravação em disco não bloqueia o laço quando o
+serviço usa write-behind (ver cli.py, subcomando 'serve').
+
+As rotas de recorrentes e as projeções usam o RecurringService do
+ReportService (se houver); as ocorrências vencidas são lançadas na primeira
+requisição de cada dia.
+"""
+import asyncio
+import json
+import re
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from models.recurring import RecurringRule
+from models.transaction import Transaction
+from services.query import TransactionQuery
+from services.report_service import ReportService
+from services.transaction_service import TransactionService
+
+
+# Tamanho máximo do cabeçalho e do corpo de uma requisição
+MAX_HEADER_SIZE = 16 * 1024
+MAX_BODY_SIZE = 1024 * 1024
+
+# Quantidade de transações por página nas listagens (padrão e máxima)
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+# Quantidade máxima de pontos de uma série de saldos (ex: dez anos, dia a dia)
+MAX_SERIES_POINTS = 5000
+
+# Segundos sem atividade antes de fechar uma conexão mantida aberta
+KEEP_ALIVE_TIMEOUT = 15.0
+
+Response = Tuple[int, Any]
+
+
+class ApiError(Exception):
+    """Erro de uma requisição, respondido com o status informado."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _report_to_dict(report: Dict[str, Any], params: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Converte um relatório mensal (com objetos Transaction) para JSON.
+
+    Com '?transactions=0' a lista de transações é omitida e só os totais
+    são enviados (bem mais barato para painéis).
+    """
+    if params.get('transactions') in ('0', 'false'):
+        return {key: value for key, value in report.items() if not key.endswith('transactions')}
+
+    # 'transactions' e, com recorrentes, 'projected_transactions'
+    return {key: [t.to_dict() for t in value] if key.endswith('transactions') else value
+            for key, value in report.items()}
+
+
+def _parse_transaction(item: Any) -> Transaction:
+    """
+    Cria uma transação a partir do corpo de uma requisição.
+
+    Args:
+        item: Objeto JSON com 'type', 'amount' e, opcionalmente, 'date'
+            (padrão: hoje), 'category' e 'description'
+
+    Returns:
+        Transação validada
+    """
+    if not isinstance(item, dict):
+        raise ValueError("cada transação deve ser um objeto JSON")
+
+    try:
+        return Transaction(
+            transaction_type=item['type'],
+            amount=item['amount'],
+            date=item.get('date'),
+            category=item.get('category', ""),
+            description=item.get('description', "")
+        )
+    except KeyError as e:
+        raise ValueError(f"campo ausente {e}") from None
+
+
+class ApiServer:
+    """
+    Servidor HTTP/1.1 mínimo (com conexões persistentes) para a API JSON.
+
+    dispatch() resolve uma requisição de forma síncrona e pode ser usado
+    sem sockets; start() aceita conexões com asyncio.start_server.
+    """
+
+    def __init__(self, transaction_service: TransactionService, report_service: ReportService):
+        """
+        Inicializa o servidor.
+
+        Args:
+            transaction_service: Serviço de transações (mantido carregado)
+            report_service: Serviço de relatórios (com cache)
+        """
+        self.transaction_service = transaction_service
+        self.report_service = report_service
+        self.recurring_service = report_service.recurring_service
+        # Dia do último lançamento das ocorrências recorrentes vencidas
+        self._posted_on: Optional[str] = None
+        self._routes: List[Tuple[str, 're.Pattern[str]', Callable[..., Response]]] = [
+            ('GET', re.compile(r'/balance'), self._get_balance),
+            ('GET', re.compile(r'/balance/series'), self._get_balance_series),
+            ('GET', re.compile(r'/transactions'), self._get_transactions),
+            ('POST', re.compile(r'/transactions'), self._post_transactions),
+            ('GET', re.compile(r'/reports/monthly/(\d{4})/(\d{1,2})'), self._get_monthly_report),
+            ('GET', re.compile(r'/reports/range'), self._get_range_report),
+            ('GET', re.compile(r'/reports/category/(\w+)'), self._get_category_report),
+            ('GET', re.compile(r'/recurring'), self._get_recurring),
+            ('POST', re.compile(r'/recurring'), self._post_recurring),
+        ]
+
+    def dispatch(self, method: str, target: str, body: bytes = b'') -> Response:
+        """
+        Resolve uma requisição.
+
+        Args:
+            method: Método HTTP
+            target: Caminho com a query string (ex: '/transactions?type=despesa')
+            body: Corpo da requisição
+
+        Returns:
+            Tupla (status HTTP, objeto a ser enviado em JSON)
+        """
+        url = urlsplit(target)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        path = url.path.rstrip('/') or '/'
+        allowed = []
+
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if match is None:
+                continue
+            if route_method != method:
+                allowed.append(route_method)
+                continue
+
+            try:
+                # Incorpora o que outros processos gravaram (verificação barata)
+                self.transaction_service.refresh()
+                self._post_due()
+                return handler(params, body, *match.groups())
+            except ApiError as e:
+                return e.status, {'error': e.message}
+            except ValueError as e:
+                return HTTPStatus.BAD_REQUEST, {'error': str(e)}
+            except Exception as e:
+                # Ex: falha ao gravar no disco; a conexão continua atendida
+                return HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)}
+
+        if allowed:
+            return HTTPStatus.METHOD_NOT_ALLOWED, {'error': f"use {', '.join(allowed)}"}
+        return HTTPStatus.NOT_FOUND, {'error': f"rota não encontrada: {path}"}
+
+    def _post_due(self) -> None:
+        """Lança as ocorrências recorrentes vencidas, uma vez por dia."""
+        today = datetime.now().strftime("%Y-%m-%d")
+
+        if self.recurring_service is not None and self._posted_on != today:
+            self.recurring_service.post_due(today)
+            self._posted_on = today
+
+    def _projected(self, params: Dict[str, str]) -> bool:
+        """Indica se a resposta deve incluir as transações recorrentes previstas."""
+        if params.get('projected', '0') in ('0', 'false', ''):
+            return False
+        if self.recurring_service is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, "transações recorrentes não configuradas")
+        return True
+
+    def _get_balance(self, params: Dict[str, str], body: bytes) -> Response:
+        """GET /balance[?at=YYYY-MM-DD]"""
+        if 'at' in params:
+            if self._projected(params):
+                balance = self.recurring_service.get_projected_balance(params['at'])
+            else:
+                balance = self.transaction_service.get_balance_at(params['at'])
+            return HTTPStatus.OK, {'date': params['at'], 'balance': balance}
+
+        return HTTPStatus.OK, {'balance': self.transaction_service.get_balance()}
+
+    def _get_balance_series(self, params: Dict[str, str], body: bytes) -> Response:
+        """GET /balance/series?start=YYYY-MM-DD&end=YYYY-MM-DD[&step=dias]"""
+        if 'start' not in params or 'end' not in params:
+            raise ValueError("informe start e end (formato: YYYY-MM-DD)")
+
+        step = int(params.get('step', 1))
+        start = datetime.strptime(params['start'], "%Y-%m-%d")
+        end = datetime.strptime(params['end'], "%Y-%m-%d")
+        if step >= 1 and (end - start).days // step + 1 > MAX_SERIES_POINTS:
+            raise ValueError(f"a série teria mais de {MAX_SERIES_POINTS} pontos; aumente step")
+
+        if self._projected(params):
+            series = self.recurring_service.get_projected_series(params['start'], params['end'], step)
+        else:
+            series = self.transaction_service.get_balance_series(params['start'], params['end'], step)
+        return HTTPStatus.OK, [{'date': day, 'balance': balance} for day, balance in series]
+
+    def _get_transactions(self, params: Dict[str, str], body: bytes) -> Response:
+        """GET /transactions (filtros combinados e paginação)"""
+        query = TransactionQuery(
+            start_date=params.get('start'),
+            end_date=params.get('end'),
+            transaction_type=params.get('type'),
+            category=params.get('category'),
+            min_amount=float(params['min']) if 'min' in params else None,
+            max_amount=float(params['max']) if 'max' in params else None,
+            text=params.get('text'),
+            prefix=params.get('prefix', '0') not in ('0', 'false', ''),
+        )
+        offset = int(params.get('offset', 0))
+        limit = min(int(params.get('limit', DEFAULT_LIMIT)), MAX_LIMIT)
+
+        if offset < 0 or limit < 1:
+            raise ValueError("offset deve ser >= 0 e limit deve ser >= 1")
+
+        selection = self.transaction_service.select_query(query)
+
+        return HTTPStatus.OK, {
+            'total': len(selection),
+            'offset': offset,
+            'limit': limit,
+            'transactions': [t.to_dict() for t in selection.page(offset, limit)],
+        }
+
+    def _post_transactions(self, params: Dict[str, str], body: bytes) -> Response:
+        """POST /transactions (uma transação ou um lote, gravado de uma vez)"""
+        try:
+            payload = json.loads(body or b'null')
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"JSON inválido: {e}") from None
+
+        items = payload if isinstance(payload, list) else [payload]
+        batch = []
+
+        for position, item in enumerate(items, start=1):
+            try:
+                batch.append(_parse_transaction(item))
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Transação {position} do lote inválida: {e}") from None
+
+        added = self.transaction_service.add_transactions(batch)
+
+        return HTTPStatus.CREATED, {'added': added, 'balance': self.transaction_service.get_balance()}
+
+    def _get_monthly_report(self, params: Dict[str, str], body: bytes,
+                            year: str, month: str) -> Response:
+        """GET /reports/monthly/<ano>/<mês>"""
+        if not 1 <= int(month) <= 12:
+            raise ValueError("Mês deve estar entre 1 e 12")
+
+        report = self.report_service.generate_monthly_report(int(year), int(month))
+        return HTTPStatus.OK, _report_to_dict(report, params)
+
+    def _get_range_report(self, params: Dict[str, str], body: bytes) -> Response:
+        """GET /reports/range?start=YYYY-MM&end=YYYY-MM"""
+        if 'start' not in params or 'end' not in params:
+            raise ValueError("informe start e end (formato: YYYY-MM)")
+
+        reports = self.report_service.generate_range_report(params['start'], params['end'])
+        return HTTPStatus.OK, [_report_to_dict(report, params) for report in reports]
+
+    def _get_category_report(self, params: Dict[str, str], body: bytes,
+                             transaction_type: str) -> Response:
+        """GET /reports/category/<receita|despesa>"""
+        if transaction_type not in ('receita', 'despesa'):
+            raise ApiError(HTTPStatus.NOT_FOUND, f"tipo de transação desconhecido: {transaction_type}")
+
+        return HTTPStatus.OK, self.report_service.generate_category_report(transaction_type)
+
+    def _get_recurring(self, params: Dict[str, str], body: bytes) -> Response:
+        """GET /recurring"""
+        if self.recurring_service is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, "transações recorrentes não configuradas")
+
+        return HTTPStatus.OK, [rule.to_dict() for rule in self.recurring_service.get_rules()]
+
+    def _post_recurring(self, params: Dict[str, str], body: bytes) -> Response:
+        """POST /recurring (as ocorrências já vencidas são lançadas em seguida)"""
+        if self.recurring_service is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, "transações recorrentes não configuradas")
+
+        try:
+            payload = json.loads(body or b'null')
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"JSON inválido: {e}") from None
+
+        if not isinstance(payload, dict):
+            raise ValueError("a regra deve ser um objeto JSON")
+
+        # O identificador e as ocorrências lançadas são controlados pelo serviço
+        fields = {key: value for key, value in payload.items() if key not in ('id', 'posted_until')}
+        try:
+            rule = RecurringRule.from_dict(fields)
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"regra inválida: {e}") from None
+
+        rule_id = self.recurring_service.add_rule(rule).rule_id
+        posted = self.recurring_service.post_due()
+        # As regras são relidas ao lançar: a cópia atual traz a última ocorrência lançada
+        rule = next(r for r in self.recurring_service.get_rules() if r.rule_id == rule_id)
+        return HTTPStatus.CREATED, {'rule': rule.to_dict(), 'posted': len(posted)}
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8080) -> asyncio.AbstractServer:
+        """
+        Começa a aceitar conexões.
+
+        Args:
+            host: Endereço de escuta (padrão: apenas a máquina local)
+            port: Porta TCP (0 escolhe uma porta livre)
+
+        Returns:
+            Servidor asyncio (use close() e wait_closed() para encerrar)
+        """
+        return await asyncio.start_server(self._handle_connection, host, port,
+                                          limit=MAX_HEADER_SIZE)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter) -> None:
+        """Atende as requisições de uma conexão até ela ser fechada."""
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), KEEP_ALIVE_TIMEOUT)
+                except ApiError as e:
+                    self._write_response(writer, e.status, {'error': e.message}, keep_alive=False)
+                    break
+
+                if request is None:
+                    break
+
+                method, target, body, keep_alive = request
+                status, payload = self.dispatch(method, target, body)
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, bytes, bool]]:
+        """
+        Lê uma requisição HTTP/1.x.
+
+        Returns:
+            Tupla (método, alvo, corpo, manter a conexão), ou None se o
+            cliente fechou a conexão
+        """
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError:
+            raise ApiError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "cabeçalho muito grande") from None
+
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ')
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "linha de requisição inválida") from None
+
+        headers = {}
+        for line in lines[1:]:
+            name, separator, value = line.partition(':')
+            if separator:
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Content-Length inválido") from None
+        if length > MAX_BODY_SIZE:
+            raise ApiError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "corpo muito grande")
+
+        body = await reader.readexactly(length) if length else b''
+        return method, target, body, keep_alive
+
+    def _write_response(self, writer: asyncio.StreamWriter, status: int, payload: Any,
+                        keep_alive: bool) -> None:
+        """Escreve uma resposta JSON."""
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        status = HTTPStatus(status)
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+
+
+async def _serve_forever(server: ApiServer, host: str, port: int) -> None:
+    """Aceita conexões até o processo ser interrompido."""
+    listener = await server.start(host, port)
+    addresses = ', '.join(f"{address[0]}:{address[1]}"
+                          for address in (sock.getsockname() for sock in listener.sockets))
+    print(f"API disponível em {addresses} (Ctrl+C para encerrar)")
+
+    async with listener:
+        await listener.serve_forever()
+
+
+def serve(transaction_service: TransactionService, report_service: ReportService,
+          host: str = '127.0.0.1', port: int = 8080) -> None:
+    """
+    Executa a API até o processo ser interrompido (Ctrl+C).
+
+    Args:
+        transaction_service: Serviço de transações
+        report_service: Serviço de relatórios
+        host: Endereço de escuta
+        port: Porta TCP
+    """
+    try:
+        asyncio.run(_serve_forever(ApiServer(transaction_service, report_service), host, port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,79 @@
+import random
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, Optional
+
+from models.money import to_cents, from_cents
+
+
+# Categorias usadas pelo gerador, da mais para a menos frequente
+DEFAULT_CATEGORIES = [
+    'Alimentação', 'Mercado', 'Transporte', 'Contas', 'Lazer', 'Saúde',
+    'Educação', 'Roupa', 'Aluguel', 'Salário', 'Freelance', 'Investimentos',
+    'Presentes', 'Viagem', 'Assinaturas', 'Pets', 'Casa', 'Impostos',
+    'Doações', 'Outros',
+]
+
+
+def generate_transactions(count: int, seed: int = 42, category_skew: float = 1.0,
+                          start_date: str = '2015-01-01', span_days: int = 3650,
+                          income_ratio: float = 0.2,
+                          categories: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Gera transações sintéticas de forma determinística.
+
+    As categorias seguem uma distribuição de Zipf: a categoria de posição k
+    tem peso 1 / k ** category_skew (0 gera uma distribuição uniforme).
+    As datas são uniformes no intervalo e não saem em ordem cronológica,
+    como acontece com lançamentos retroativos.
+
+    Args:
+        count: Quantidade de transações
+        seed: Semente do gerador pseudoaleatório
+        category_skew: Expoente da distribuição de categorias
+        start_date: Data inicial do intervalo (formato: YYYY-MM-DD)
+        span_days: Quantidade de dias do intervalo
+        income_ratio: Proporção de receitas
+        categories: Lista de categorias (padrão: DEFAULT_CATEGORIES)
+
+    Yields:
+        Transações no formato de dicionário usado pela persistência
+    """
+    rng = random.Random(seed)
+    categories = categories or DEFAULT_CATEGORIES
+    cum_weights = list(accumulate(1 / (rank ** category_skew)
+                                  for rank in range(1, len(categories) + 1)))
+    first_day = date.fromisoformat(start_date)
+
+    for number in range(1, count + 1):
+        transaction_type = 'receita' if rng.random() < income_ratio else 'despesa'
+        category = rng.choices(categories, cum_weights=cum_weights)[0]
+        day = first_day + timedelta(days=rng.randrange(span_days))
+
+        yield {
+            'type': transaction_type,
+            'amount': rng.randrange(100, 500000) / 100,
+            'date': day.isoformat(),
+            'category': category,
+            'description': f"{category} #{number}"
+        }
+
+
+def generate_account_data(count: int, **options: Any) -> Dict[str, Any]:
+    """
+    Gera os dados completos de uma conta (saldo e transações).
+
+    Args:
+        count: Quantidade de transações
+        options: Opções repassadas para generate_transactions
+
+    Returns:
+        Dicionário no formato salvo pelo FileHandler
+    """
+    transactions = list(generate_transactions(count, **options))
+    balance_cents = sum(
+        to_cents(t['amount']) if t['type'] == 'receita' else -to_cents(t['amount'])
+        for t in transactions
+    )
+
+    return {'balance': from_cents(balance_cents), 'transactions': transactions}
\ No newline at end of file
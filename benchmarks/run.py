@@ -0,0 +1,176 @@
+"""
+Executa os benchmarks de desempenho com dados sintéticos.
+
+Uso:
+    python -m benchmarks.run --sizes 10000 100000 1000000 --output resultados.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from benchmarks.generator import generate_account_data
+from models.transaction import Transaction
+from services.report_service import ReportService
+from services.storage import create_file_handler
+from services.transaction_service import TransactionService
+
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def _measure(function: Callable[[], Any], repeat: int) -> float:
+    """Executa a função 'repeat' vezes e retorna o menor tempo (em segundos)."""
+    best = float('inf')
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def run_benchmark(size: int, backend: str = 'json', repeat: int = 3, add_samples: int = 5,
+                  seed: int = 42, category_skew: float = 1.0,
+                  span_days: int = 3650) -> List[Dict[str, Any]]:
+    """
+    Mede as operações principais para uma quantidade de transações.
+
+    Args:
+        size: Quantidade de transações geradas
+        backend: Backend de armazenamento ('json', 'journal', 'sqlite', 'binary' ou 'partitioned')
+        repeat: Repetições de cada medição (é registrado o menor tempo)
+        add_samples: Quantidade de chamadas a add_transaction medidas
+        seed: Semente do gerador de dados
+        category_skew: Expoente da distribuição de categorias
+        span_days: Quantidade de dias cobertos pelas transações
+
+    Returns:
+        Lista de resultados, um por operação
+    """
+    data = generate_account_data(size, seed=seed, category_skew=category_skew,
+                                 span_days=span_days)
+    probe = data['transactions'][size // 2]
+    year, month = int(probe['date'][:4]), int(probe['date'][5:7])
+    results = []
+
+    def record(operation: str, seconds: float, calls: int = 1) -> None:
+        results.append({
+            'size': size,
+            'backend': backend,
+            'operation': operation,
+            'seconds': seconds,
+            'calls': calls,
+        })
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_handler = create_file_handler(os.path.join(temp_dir, 'transactions.json'), backend)
+        file_handler.save_data(data)
+        del data
+
+        record('FileHandler.load_data', _measure(file_handler.load_data, repeat))
+
+        service = TransactionService(file_handler)
+        # Sem cache: cada repetição recalcula o relatório (ver as linhas "(cache)")
+        report_service = ReportService(service, cache_size=0)
+        cached_report_service = ReportService(service)
+        record('TransactionService._load_account', _measure(service._load_account, repeat))
+
+        start = time.perf_counter()
+        for number in range(add_samples):
+            service.add_transaction(Transaction('despesa', 10.0, probe['date'],
+                                                probe['category'], f"benchmark #{number}"))
+        record('TransactionService.add_transaction',
+               (time.perf_counter() - start) / max(add_samples, 1), add_samples)
+
+        start_date = f"{year}-{month:02d}-01"
+        end_date = f"{year}-{month:02d}-28"
+        queries = {
+            'TransactionService.get_transactions_by_period':
+                lambda: service.get_transactions_by_period(start_date, end_date),
+            'TransactionService.get_transactions_by_type':
+                lambda: service.get_transactions_by_type('receita'),
+            'TransactionService.get_transactions_by_category':
+                lambda: service.get_transactions_by_category(probe['category']),
+            'ReportService.generate_monthly_report':
+                lambda: report_service.generate_monthly_report(year, month),
+            'ReportService.generate_category_report':
+                lambda: report_service.generate_category_report('despesa'),
+            'ReportService.generate_monthly_report (cache)':
+                lambda: cached_report_service.generate_monthly_report(year, month),
+            'ReportService.generate_category_report (cache)':
+                lambda: cached_report_service.generate_category_report('despesa'),
+        }
+
+        for operation, function in queries.items():
+            record(operation, _measure(function, repeat))
+
+        if hasattr(file_handler, 'close'):
+            file_handler.close()
+
+    return results
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Interpreta os argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(description="Benchmarks do Gestor Financeiro Pessoal")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="quantidades de transações a medir")
+    parser.add_argument('--backend', default='json',
+                        choices=['json', 'journal', 'sqlite', 'binary', 'partitioned'],
+                        help="backend de armazenamento")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="repetições de cada medição (registra o menor tempo)")
+    parser.add_argument('--add-samples', type=int, default=5,
+                        help="quantidade de chamadas a add_transaction medidas")
+    parser.add_argument('--seed', type=int, default=42, help="semente do gerador de dados")
+    parser.add_argument('--category-skew', type=float, default=1.0,
+                        help="expoente de Zipf da distribuição de categorias (0 = uniforme)")
+    parser.add_argument('--span-days', type=int, default=3650,
+                        help="quantidade de dias cobertos pelas transações")
+    parser.add_argument('--output', help="arquivo JSON de saída (padrão: saída padrão)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    """Executa os benchmarks e grava os resultados em JSON."""
+    args = parse_args(argv)
+    results = []
+
+    for size in args.sizes:
+        print(f"Medindo {size} transações ({args.backend})...", file=sys.stderr)
+        results.extend(run_benchmark(size, backend=args.backend, repeat=args.repeat,
+                                     add_samples=args.add_samples, seed=args.seed,
+                                     category_skew=args.category_skew,
+                                     span_days=args.span_days))
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'backend': args.backend,
+            'seed': args.seed,
+            'category_skew': args.category_skew,
+            'span_days': args.span_days,
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=4, ensure_ascii=False)
+    else:
+        json.dump(report, sys.stdout, indent=4, ensure_ascii=False)
+        print()
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
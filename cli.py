@@ -0,0 +1,382 @@
+"""
+Subcomandos não interativos, para uso em scripts e no cron.
+
+Exemplos:
+    python main.py balance
+    python main.py balance --at 2024-03-15
+    python main.py balance --start 2024-01-01 --end 2024-12-31 --step 7 --json
+    python main.py add despesa 45.90 --category Alimentação --description "Mercado"
+    python main.py list --start 2025-05-01 --end 2025-05-31 --type despesa --min 100
+    python main.py report monthly 2025 5
+    python main.py report category despesa --json
+    python main.py import extrato.csv --delimiter ";" --date-format %d/%m/%Y
+    python main.py export despesas-2025.csv --start 2025-01-01 --type despesa
+    python main.py serve --port 8080
+    python main.py recurring add despesa 1500 --start 2025-01-05 --category Moradia --description Aluguel
+    python main.py recurring post
+    python main.py balance --at 2026-12-31 --projected
+
+Os subcomandos não importam a interface interativa e usam a carga adiada do
+TransactionService: 'balance' e 'add' não carregam o histórico quando o
+backend permite. O subcomando 'serve' mantém a conta carregada e grava em
+segundo plano (write-behind) enquanto atende a API HTTP.
+
+'recurring post' lança as ocorrências vencidas das transações recorrentes
+(ex: diariamente pelo cron); com --projected, 'balance' e 'report monthly'
+incluem as ocorrências previstas, ainda não lançadas.
+"""
+import argparse
+import json
+import sys
+from datetime import datetime
+from typing import Any, Dict, List
+
+from config.settings import API_HOST, API_PORT, RECURRING_FILE_PATH, REPORT_CACHE_SIZE
+from models.recurring import FREQUENCIES, RecurringRule
+from models.transaction import Transaction
+from services.file_handler import FileHandler
+from services.transaction_service import TransactionService
+from services.query import TransactionQuery
+from services.report_service import ReportService
+from services.import_service import ImportService
+from services.export_service import ExportService, EXPORT_FORMATS
+from services.recurring_service import RecurringService
+
+
+def _valid_date(value: str) -> str:
+    """Valida uma data no formato YYYY-MM-DD (tipo para o argparse)."""
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"data inválida: {value!r} (use YYYY-MM-DD)") from None
+    return value
+
+
+def add_subcommands(parser: argparse.ArgumentParser) -> None:
+    """
+    Registra os subcomandos no parser principal.
+
+    Args:
+        parser: Parser da linha de comando da aplicação
+    """
+    parser.add_argument('--recurring-file', default=RECURRING_FILE_PATH, metavar='ARQUIVO',
+                        help="arquivo das regras de transações recorrentes")
+    subparsers = parser.add_subparsers(dest='command', metavar='COMANDO')
+
+    add = subparsers.add_parser('add', help="registra uma transação")
+    add.add_argument('type', choices=['receita', 'despesa'], help="tipo da transação")
+    add.add_argument('amount', type=float, help="valor (positivo)")
+    add.add_argument('--date', type=_valid_date, help="data (YYYY-MM-DD, padrão: hoje)")
+    add.add_argument('--category', default="", help="categoria")
+    add.add_argument('--description', default="", help="descrição")
+
+    list_parser = subparsers.add_parser('list', help="lista transações")
+    list_parser.add_argument('--start', type=_valid_date, help="data inicial (YYYY-MM-DD)")
+    list_parser.add_argument('--end', type=_valid_date, help="data final (YYYY-MM-DD)")
+    list_parser.add_argument('--type', choices=['receita', 'despesa'], help="tipo da transação")
+    list_parser.add_argument('--category', help="categoria")
+    list_parser.add_argument('--min', type=float, help="valor mínimo")
+    list_parser.add_argument('--max', type=float, help="valor máximo")
+    list_parser.add_argument('--text', help="texto na descrição ou na categoria")
+    list_parser.add_argument('--prefix', action='store_true',
+                             help="procura o texto só no início das palavras")
+    list_parser.add_argument('--json', action='store_true', help="saída em JSON")
+
+    report = subparsers.add_parser('report', help="gera relatórios")
+    report_subparsers = report.add_subparsers(dest='report', metavar='RELATÓRIO', required=True)
+
+    monthly = report_subparsers.add_parser('monthly', help="relatório mensal")
+    monthly.add_argument('year', type=int, help="ano (YYYY)")
+    monthly.add_argument('month', type=int, choices=range(1, 13), metavar='month',
+                         help="mês (1-12)")
+    monthly.add_argument('--projected', action='store_true',
+                         help="inclui as transações recorrentes previstas")
+    monthly.add_argument('--json', action='store_true', help="saída em JSON")
+
+    category = report_subparsers.add_parser('category', help="relatório por categoria")
+    category.add_argument('type', choices=['receita', 'despesa'], help="tipo da transação")
+    category.add_argument('--json', action='store_true', help="saída em JSON")
+
+    balance = subparsers.add_parser('balance', help="exibe o saldo atual ou em outras datas")
+    balance.add_argument('--at', type=_valid_date, help="saldo ao final de uma data (YYYY-MM-DD)")
+    balance.add_argument('--start', type=_valid_date,
+                         help="início da evolução do saldo (YYYY-MM-DD)")
+    balance.add_argument('--end', type=_valid_date,
+                         help="fim da evolução do saldo (YYYY-MM-DD, padrão: hoje)")
+    balance.add_argument('--step', type=int, default=1, help="dias entre os pontos (padrão: 1)")
+    balance.add_argument('--projected', action='store_true',
+                         help="inclui as transações recorrentes previstas")
+    balance.add_argument('--json', action='store_true', help="saída em JSON")
+
+    import_parser = subparsers.add_parser('import', help="importa transações de um CSV ou OFX")
+    import_parser.add_argument('path', help="arquivo a importar")
+    import_parser.add_argument('--format', choices=['csv', 'ofx'],
+                               help="formato do arquivo (padrão: pela extensão)")
+    import_parser.add_argument('--delimiter', default=',', help="separador de colunas do CSV")
+    import_parser.add_argument('--date-format', default="%Y-%m-%d",
+                               help="formato das datas do CSV (ex: %%d/%%m/%%Y)")
+    import_parser.add_argument('--encoding', help="codificação do arquivo")
+    import_parser.add_argument('--json', action='store_true', help="saída em JSON")
+
+    export = subparsers.add_parser('export', help="exporta transações para CSV ou JSON Lines")
+    export.add_argument('path', help="arquivo de saída ('-' para a saída padrão)")
+    export.add_argument('--format', choices=EXPORT_FORMATS,
+                        help="formato do arquivo (padrão: pela extensão, ou csv)")
+    export.add_argument('--start', type=_valid_date, help="data inicial (YYYY-MM-DD)")
+    export.add_argument('--end', type=_valid_date, help="data final (YYYY-MM-DD)")
+    export.add_argument('--type', choices=['receita', 'despesa'], help="tipo da transação")
+    export.add_argument('--category', help="categoria")
+
+    recurring = subparsers.add_parser('recurring', help="gerencia transações recorrentes")
+    recurring_subparsers = recurring.add_subparsers(dest='action', metavar='AÇÃO', required=True)
+
+    recurring_add = recurring_subparsers.add_parser('add', help="cadastra uma regra")
+    recurring_add.add_argument('type', choices=['receita', 'despesa'], help="tipo da transação")
+    recurring_add.add_argument('amount', type=float, help="valor de cada ocorrência (positivo)")
+    recurring_add.add_argument('--start', type=_valid_date,
+                               help="data da primeira ocorrência (YYYY-MM-DD, padrão: hoje)")
+    recurring_add.add_argument('--frequency', choices=list(FREQUENCIES), default='monthly',
+                               help="frequência (padrão: monthly)")
+    recurring_add.add_argument('--every', type=int, default=1,
+                               help="intervalo em dias, semanas ou meses (padrão: 1)")
+    recurring_add.add_argument('--until', type=_valid_date, help="data final (YYYY-MM-DD)")
+    recurring_add.add_argument('--category', default="", help="categoria")
+    recurring_add.add_argument('--description', default="", help="descrição")
+
+    recurring_list = recurring_subparsers.add_parser('list', help="lista as regras")
+    recurring_list.add_argument('--json', action='store_true', help="saída em JSON")
+
+    recurring_remove = recurring_subparsers.add_parser('remove', help="remove uma regra")
+    recurring_remove.add_argument('id', type=int, help="número da regra")
+
+    recurring_post = recurring_subparsers.add_parser(
+        'post', help="lança as ocorrências vencidas (para o cron)")
+    recurring_post.add_argument('--json', action='store_true', help="saída em JSON")
+
+    serve = subparsers.add_parser('serve', help="inicia a API HTTP/JSON local")
+    serve.add_argument('--host', default=API_HOST, help=f"endereço de escuta (padrão: {API_HOST})")
+    serve.add_argument('--port', type=int, default=API_PORT, help=f"porta (padrão: {API_PORT})")
+
+
+def _print_json(data: Any) -> None:
+    """Escreve dados em JSON na saída padrão."""
+    print(json.dumps(data, indent=4, ensure_ascii=False))
+
+
+def _print_transactions(transactions: List[Transaction]) -> None:
+    """Escreve as transações como linhas separadas por tabulação."""
+    for t in transactions:
+        print(f"{t.date}\t{t.transaction_type}\t{t.amount:.2f}\t{t.category}\t{t.description}")
+
+
+def _add(service: TransactionService, args: argparse.Namespace) -> None:
+    """Subcomando 'add'."""
+    service.add_transaction(Transaction(
+        transaction_type=args.type,
+        amount=args.amount,
+        date=args.date,
+        category=args.category,
+        description=args.description
+    ))
+
+
+def _list(service: TransactionService, args: argparse.Namespace) -> None:
+    """Subcomando 'list'."""
+    query = TransactionQuery(args.start, args.end, args.type, args.category,
+                             args.min, args.max, args.text, args.prefix)
+    transactions = service.find_transactions(query)
+
+    if args.json:
+        _print_json([t.to_dict() for t in transactions])
+    else:
+        _print_transactions(transactions)
+
+
+def _report(service: TransactionService, args: argparse.Namespace) -> None:
+    """Subcomando 'report'."""
+    recurring_service = None
+    if getattr(args, 'projected', False):
+        recurring_service = RecurringService(service, args.recurring_file)
+    report_service = ReportService(service, recurring_service=recurring_service)
+
+    if args.report == 'category':
+        report: Dict[str, Any] = report_service.generate_category_report(args.type)
+
+        if args.json:
+            _print_json(report)
+        else:
+            for category, amount in report.items():
+                print(f"{category}\t{amount:.2f}")
+        return
+
+    report = report_service.generate_monthly_report(args.year, args.month)
+
+    if args.json:
+        _print_json({key: [t.to_dict() for t in value] if key.endswith('transactions') else value
+                     for key, value in report.items()})
+        return
+
+    print(f"Período\t{report['period']}")
+    print(f"Receitas\t{report['total_income']:.2f}")
+    print(f"Despesas\t{report['total_expense']:.2f}")
+    print(f"Saldo\t{report['balance']:.2f}")
+    for category, amount in report['income_by_category'].items():
+        print(f"receita\t{category}\t{amount:.2f}")
+    for category, amount in report['expense_by_category'].items():
+        print(f"despesa\t{category}\t{amount:.2f}")
+
+
+def _balance(service: TransactionService, args: argparse.Namespace) -> None:
+    """Subcomando 'balance'."""
+    get_series, get_balance_at = service.get_balance_series, service.get_balance_at
+    at = args.at
+    if args.projected:
+        # Inclui as ocorrências recorrentes ainda não lançadas (padrão: saldo previsto hoje)
+        recurring_service = RecurringService(service, args.recurring_file)
+        get_series = recurring_service.get_projected_series
+        get_balance_at = recurring_service.get_projected_balance
+        at = at or datetime.now().strftime("%Y-%m-%d")
+
+    if args.start is not None:
+        end = args.end or datetime.now().strftime("%Y-%m-%d")
+        series = get_series(args.start, end, args.step)
+
+        if args.json:
+            _print_json([{'date': day, 'balance': balance} for day, balance in series])
+        else:
+            for day, balance in series:
+                print(f"{day}\t{balance:.2f}")
+        return
+
+    balance = service.get_balance() if at is None else get_balance_at(at)
+
+    if args.json:
+        _print_json({'balance': balance})
+    else:
+        print(f"{balance:.2f}")
+
+
+def _import(service: TransactionService, args: argparse.Namespace) -> int:
+    """Subcomando 'import' (retorna 1 se alguma linha foi rejeitada)."""
+    file_format = args.format or ('ofx' if args.path.lower().endswith('.ofx') else 'csv')
+    import_service = ImportService(service)
+
+    if file_format == 'ofx':
+        result = import_service.import_ofx(args.path, encoding=args.encoding or 'latin-1')
+    else:
+        result = import_service.import_csv(args.path, delimiter=args.delimiter,
+                                           date_format=args.date_format,
+                                           encoding=args.encoding or 'utf-8')
+
+    if args.json:
+        _print_json(result)
+    else:
+        print(f"{result['imported']} transação(ões) importada(s), "
+              f"{result['rejected']} linha(s) rejeitada(s)")
+        for line_number, message in result['errors']:
+            print(f"Linha {line_number}: {message}", file=sys.stderr)
+
+    return 1 if result['rejected'] else 0
+
+
+def _export(service: TransactionService, args: argparse.Namespace) -> None:
+    """Subcomando 'export'."""
+    count = ExportService(service).export_to_path(
+        args.path, args.format, start_date=args.start, end_date=args.end,
+        transaction_type=args.type, category=args.category)
+
+    if args.path != '-':
+        print(f"{count} transação(ões) exportada(s) para {args.path}")
+
+
+def _recurring(service: TransactionService, args: argparse.Namespace) -> None:
+    """Subcomando 'recurring'."""
+    recurring_service = RecurringService(service, args.recurring_file)
+
+    if args.action == 'add':
+        rule = recurring_service.add_rule(RecurringRule(
+            transaction_type=args.type,
+            amount=args.amount,
+            start_date=args.start or datetime.now().strftime("%Y-%m-%d"),
+            frequency=args.frequency,
+            interval=args.every,
+            end_date=args.until,
+            category=args.category,
+            description=args.description
+        ))
+        print(rule.rule_id)
+    elif args.action == 'list':
+        rules = recurring_service.get_rules()
+
+        if args.json:
+            _print_json([rule.to_dict() for rule in rules])
+        else:
+            for rule in rules:
+                print(f"{rule.rule_id}\t{rule.transaction_type}\t{rule.amount:.2f}\t{rule.frequency}"
+                      f"\t{rule.interval}\t{rule.start_date}\t{rule.end_date or ''}"
+                      f"\t{rule.category}\t{rule.description}")
+    elif args.action == 'remove':
+        recurring_service.remove_rule(args.id)
+    else:
+        transactions = recurring_service.post_due()
+
+        if args.json:
+            _print_json([t.to_dict() for t in transactions])
+        else:
+            _print_transactions(transactions)
+
+
+def _serve(service: TransactionService, args: argparse.Namespace) -> None:
+    """Subcomando 'serve'."""
+    # O servidor só é importado quando usado
+    from api.server import serve
+
+    # Carrega a conta antes de aceitar conexões
+    service.account
+    recurring_service = RecurringService(service, args.recurring_file)
+    report_service = ReportService(service, cache_size=REPORT_CACHE_SIZE,
+                                   recurring_service=recurring_service)
+    try:
+        serve(service, report_service, args.host, args.port)
+    finally:
+        service.close()
+
+
+COMMANDS = {
+    'add': _add,
+    'list': _list,
+    'report': _report,
+    'balance': _balance,
+    'import': _import,
+    'export': _export,
+    'recurring': _recurring,
+    'serve': _serve,
+}
+
+# Subcomandos de longa duração, que gravam em segundo plano
+WRITE_BEHIND_COMMANDS = {'serve'}
+
+
+def run_command(args: argparse.Namespace, file_handler: FileHandler, columnar: bool = False,
+                trusted_load: bool = True) -> int:
+    """
+    Executa um subcomando.
+
+    Args:
+        args: Argumentos interpretados (com 'command' preenchido)
+        file_handler: Manipulador de arquivo para persistência
+        columnar: Se True, usa o armazenamento colunar compacto
+        trusted_load: Se True, carrega os dados sem revalidar cada transação
+
+    Returns:
+        Código de saída (0 em caso de sucesso)
+    """
+    service = TransactionService(file_handler, columnar=columnar, trusted_load=trusted_load,
+                                 lazy_load=True,
+                                 write_behind=args.command in WRITE_BEHIND_COMMANDS)
+
+    try:
+        return COMMANDS[args.command](service, args) or 0
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
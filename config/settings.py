@@ -7,4 +7,45 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, 'data')
 
 # Arquivo de transações
-DATA_FILE_PATH = os.path.join(DATA_DIR, 'transactions.json')
\ No newline at end of file
+DATA_FILE_PATH = os.path.join(DATA_DIR, 'transactions.json')
+
+# Backend de armazenamento ('json', 'journal', 'sqlite', 'binary' ou 'partitioned')
+STORAGE_BACKEND = os.environ.get('GESTOR_STORAGE', 'json')
+
+# Quantidade de lançamentos no journal antes de gravar um novo snapshot
+JOURNAL_COMPACT_THRESHOLD = 1000
+
+# Mantém as transações em memória no formato colunar compacto
+COLUMNAR_STORE = os.environ.get('GESTOR_COLUMNAR', '0') == '1'
+
+# Carrega os dados persistidos sem revalidar cada transação
+# (use 'python main.py --verify' para conferir o armazenamento)
+TRUSTED_LOAD = os.environ.get('GESTOR_TRUSTED_LOAD', '1') == '1'
+
+# Instrumentação de desempenho (também pode ser ativada com 'python main.py --profile')
+PROFILE_ENABLED = os.environ.get('GESTOR_PROFILE', '0') == '1'
+
+# Arquivo JSON onde as estatísticas de desempenho são gravadas ao sair (opcional)
+PROFILE_OUTPUT = os.environ.get('GESTOR_PROFILE_FILE')
+
+# Quantidade de transações por página nas listagens do menu
+PAGE_SIZE = int(os.environ.get('GESTOR_PAGE_SIZE', '20'))
+
+# Quantidade máxima de relatórios guardados no cache do ReportService (0 desativa)
+REPORT_CACHE_SIZE = int(os.environ.get('GESTOR_REPORT_CACHE_SIZE', '64'))
+
+# Grava os dados em segundo plano (write-behind) nos backends sem gravação incremental
+WRITE_BEHIND = os.environ.get('GESTOR_WRITE_BEHIND', '0') == '1'
+
+# Segundos entre a primeira alteração pendente e a gravação em segundo plano
+FLUSH_INTERVAL = float(os.environ.get('GESTOR_FLUSH_INTERVAL', '2.0'))
+
+# Quantidade de transações pendentes que antecipa a gravação em segundo plano
+FLUSH_THRESHOLD = int(os.environ.get('GESTOR_FLUSH_THRESHOLD', '100'))
+
+# Endereço e porta da API HTTP local ('python main.py serve')
+API_HOST = os.environ.get('GESTOR_API_HOST', '127.0.0.1')
+API_PORT = int(os.environ.get('GESTOR_API_PORT', '8080'))
+
+# Arquivo das regras de transações recorrentes, ao lado dos dados da conta
+RECURRING_FILE_PATH = os.path.join(DATA_DIR, 'recurring.json')
\ No newline at end of file
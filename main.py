@@ -1,26 +1,91 @@
+import argparse
 import os
-from config.settings import DATA_FILE_PATH
-from services.file_handler import FileHandler
+import sys
+from config.settings import (
+    DATA_FILE_PATH, COLUMNAR_STORE, TRUSTED_LOAD, PROFILE_ENABLED, PROFILE_OUTPUT,
+    REPORT_CACHE_SIZE, WRITE_BEHIND, FLUSH_INTERVAL, FLUSH_THRESHOLD
+)
+from cli import add_subcommands, run_command
+from services.profiler import profiler
+from services.recurring_service import RecurringService
+from services.storage import create_file_handler
 from services.transaction_service import TransactionService
 from services.report_service import ReportService
-from ui.menu import Menu
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """Interpreta os argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(description="Gestor Financeiro Pessoal")
+    parser.add_argument('--verify', action='store_true',
+                        help="verifica a integridade dos dados armazenados e sai")
+    parser.add_argument('--profile', action='store_true', default=PROFILE_ENABLED,
+                        help="coleta estatísticas de desempenho (opção 9 do menu)")
+    parser.add_argument('--profile-output', default=PROFILE_OUTPUT, metavar='ARQUIVO',
+                        help="grava as estatísticas de desempenho em JSON ao sair")
+    add_subcommands(parser)
+    return parser.parse_args(argv)
+
+
+def verify(transaction_service: TransactionService) -> int:
+    """
+    Verifica os dados armazenados e exibe os problemas encontrados.
+    
+    Returns:
+        Código de saída (0 se não houver problemas)
+    """
+    problems = transaction_service.verify()
+    
+    if not problems:
+        print("Nenhum problema encontrado nos dados armazenados.")
+        return 0
+    
+    print(f"{len(problems)} problema(s) encontrado(s):")
+    for problem in problems:
+        print(f"  - {problem}")
+    return 1
+
+
+def main(argv=None):
     """Função principal que inicia a aplicação."""
+    args = parse_args(argv)
+    
+    if args.profile or args.profile_output:
+        profiler.enable(args.profile_output)
+    
     try:
         # Cria o diretório de dados se não existir
         data_dir = os.path.dirname(DATA_FILE_PATH)
         if not os.path.exists(data_dir):
             os.makedirs(data_dir)
         
-        # Inicializa os serviços
-        file_handler = FileHandler(DATA_FILE_PATH)
-        transaction_service = TransactionService(file_handler)
-        report_service = ReportService(transaction_service)
+        file_handler = create_file_handler(DATA_FILE_PATH)
+        
+        # Subcomandos não interativos (sem carregar a interface)
+        if args.command:
+            sys.exit(run_command(args, file_handler, columnar=COLUMNAR_STORE,
+                                 trusted_load=TRUSTED_LOAD))
+        
+        # Inicializa os serviços (a verificação não carrega a conta: a carga
+        # confiável falharia justamente nos dados corrompidos)
+        transaction_service = TransactionService(file_handler, columnar=COLUMNAR_STORE,
+                                                 trusted_load=TRUSTED_LOAD,
+                                                 lazy_load=args.verify,
+                                                 write_behind=WRITE_BEHIND and not args.verify,
+                                                 flush_interval=FLUSH_INTERVAL,
+                                                 flush_threshold=FLUSH_THRESHOLD)
+        
+        if args.verify:
+            sys.exit(verify(transaction_service))
+        
+        # A interface interativa só é importada quando usada
+        from ui.menu import Menu
+        
+        recurring_service = RecurringService(transaction_service, args.recurring_file)
+        report_service = ReportService(transaction_service, cache_size=REPORT_CACHE_SIZE,
+                                       recurring_service=recurring_service)
         
-        # Inicializa e executa o menu
-        menu = Menu(transaction_service, report_service)
+        # Inicializa e executa o menu (que lança as ocorrências recorrentes vencidas)
+        menu = Menu(transaction_service, report_service, recurring_service)
         menu.run()
         
     except Exception as e:
@@ -1,20 +1,25 @@
-from typing import List, Dict, Any
-from .transaction import Transaction
+from typing import List, Dict, Any, Sequence
+from .transaction import Transaction, date_to_ordinal
+from .money import to_cents, from_cents
+from .columnar_store import ColumnarTransactions
 
 
 class Account:
-    def __init__(self, initial_balance: float = 0.0):
+    def __init__(self, initial_balance: float = 0.0, columnar: bool = False):
         """
         Inicializa uma conta com saldo inicial.
         
         Args:
             initial_balance: Saldo inicial da conta
+            columnar: Se True, guarda as transações em armazenamento colunar
+                compacto (ColumnarTransactions) em vez de uma lista de objetos
         """
         if initial_balance < 0:
             raise ValueError("Saldo inicial não pode ser negativo")
-            
-        self.balance = initial_balance
-        self.transactions: List[Transaction] = []
+        
+        # O saldo é mantido em centavos inteiros; 'balance' expõe o valor em reais
+        self.balance_cents = to_cents(initial_balance)
+        self.transactions: Sequence[Transaction] = ColumnarTransactions() if columnar else []
     
     def add_transaction(self, transaction: Transaction) -> None:
         """
@@ -27,18 +32,64 @@ class Account:
         
         # Atualiza o saldo com base no tipo da transação
         if transaction.transaction_type == 'receita':
-            self.balance += transaction.amount
+            self.balance_cents += transaction.amount_cents
         else:  # despesa
-            self.balance -= transaction.amount
+            self.balance_cents -= transaction.amount_cents
+    
+    def add_transactions(self, transactions: List[Transaction]) -> None:
+        """
+        Adiciona um lote de transações atualizando o saldo uma única vez.
+        
+        Args:
+            transactions: Transações a serem adicionadas
+        """
+        self.transactions.extend(transactions)
+        self.update_balance(transactions)
+    
+    def update_balance(self, transactions: List[Transaction]) -> None:
+        """
+        Atualiza o saldo com base nas transações, sem armazená-las.
+        
+        Usado quando as transações ficam apenas no backend de armazenamento.
+        
+        Args:
+            transactions: Transações que afetam o saldo
+        """
+        delta = 0
+        
+        for transaction in transactions:
+            if transaction.transaction_type == 'receita':
+                delta += transaction.amount_cents
+            else:  # despesa
+                delta -= transaction.amount_cents
+        
+        self.balance_cents += delta
+    
+    @property
+    def balance(self) -> float:
+        """Saldo da conta em reais."""
+        return from_cents(self.balance_cents)
+    
+    @balance.setter
+    def balance(self, value: float) -> None:
+        self.balance_cents = to_cents(value)
     
     def get_balance(self) -> float:
         """Retorna o saldo atual da conta."""
         return self.balance
     
-    def get_transactions(self) -> List[Transaction]:
+    def get_transactions(self) -> Sequence[Transaction]:
         """Retorna todas as transações da conta."""
         return self.transactions
     
+    def date_ordinals(self) -> Sequence[int]:
+        """Retorna os ordinais das datas das transações, na ordem da conta."""
+        # Armazenamentos compactos já guardam a data como ordinal
+        if hasattr(self.transactions, 'date_ordinals'):
+            return self.transactions.date_ordinals()
+        
+        return [date_to_ordinal(t.date) for t in self.transactions]
+    
     def to_dict(self) -> Dict[str, Any]:
         """Converte a conta para um dicionário."""
         return {
@@ -47,13 +98,27 @@ class Account:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Account':
-        """Cria uma instância de Account a partir de um dicionário."""
-        account = cls(initial_balance=data['balance'])
-        
-        for transaction_data in data['transactions']:
-            transaction = Transaction.from_dict(transaction_data)
-            # Adiciona a transação sem modificar o saldo, pois já está contabilizado
-            account.transactions.append(transaction)
-            
+    def from_dict(cls, data: Dict[str, Any], columnar: bool = False,
+                  trusted: bool = False) -> 'Account':
+        """
+        Cria uma instância de Account a partir de um dicionário.
+        
+        Args:
+            data: Dicionário com o saldo e as transações
+            columnar: Se True, usa o armazenamento colunar compacto
+            trusted: Se True, as transações não são revalidadas (dados
+                gravados pela própria aplicação)
+        """
+        # O saldo salvo pode ser negativo (despesas acima das receitas), então
+        # não passa pela validação de saldo inicial. Arquivos antigos podem ter
+        # saldos com resíduo de ponto flutuante; a conversão arredonda para centavos.
+        account = cls(columnar=columnar)
+        account.balance = data['balance']
+        
+        # Adiciona as transações sem modificar o saldo, pois já está contabilizado
+        account.transactions.extend(
+            Transaction.from_dict(transaction_data, trusted=trusted)
+            for transaction_data in data['transactions']
+        )
+        
         return account
\ No newline at end of file
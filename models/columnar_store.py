@@ -0,0 +1,138 @@
+from array import array
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+from .transaction import Transaction, date_to_ordinal
+
+
+# Códigos usados para guardar o tipo da transação em um único byte
+TYPE_CODES = {'receita': 0, 'despesa': 1}
+TYPE_NAMES = ('receita', 'despesa')
+
+
+class ColumnarTransactions:
+    """
+    Armazenamento colunar das transações de uma conta.
+
+    Em vez de um objeto por transação, os campos ficam em buffers 'array':
+    valor (centavos, inteiro de 64 bits), data (ordinal do dia) e tipo (um
+    byte). As categorias são guardadas uma única vez em uma tabela e
+    referenciadas por código.
+    Objetos Transaction só são criados quando uma posição é acessada, como
+    cópias: alterar o objeto retornado não altera o armazenamento.
+
+    Implementa a parte da interface de lista usada pela conta e pelos
+    serviços (len, índice, fatia, iteração, append, extend e remoção de
+    uma fatia final), de modo que Account.get_transactions() continua
+    funcionando da mesma forma.
+    """
+
+    def __init__(self, transactions: Iterable[Transaction] = ()):
+        """
+        Inicializa o armazenamento colunar.
+
+        Args:
+            transactions: Transações iniciais
+        """
+        self.amount_cents = array('q')
+        self.dates = array('i')
+        self.types = array('b')
+        self.category_codes = array('I')
+        self.descriptions: List[str] = []
+
+        self.categories: List[str] = []
+        self._category_lookup: Dict[str, int] = {}
+
+        self.extend(transactions)
+
+    def _category_code(self, category: str) -> int:
+        """Obtém (ou cria) o código de uma categoria na tabela de categorias."""
+        code = self._category_lookup.get(category)
+
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(category)
+            self._category_lookup[category] = code
+
+        return code
+
+    def append(self, transaction: Transaction) -> None:
+        """
+        Acrescenta uma transação ao final do armazenamento.
+
+        Args:
+            transaction: Transação a ser acrescentada
+        """
+        self.amount_cents.append(transaction.amount_cents)
+        self.dates.append(date_to_ordinal(transaction.date))
+        self.types.append(TYPE_CODES[transaction.transaction_type])
+        self.category_codes.append(self._category_code(transaction.category))
+        self.descriptions.append(transaction.description)
+
+    def extend(self, transactions: Iterable[Transaction]) -> None:
+        """
+        Acrescenta várias transações ao final do armazenamento.
+
+        Args:
+            transactions: Transações a serem acrescentadas
+        """
+        for transaction in transactions:
+            self.append(transaction)
+
+    def date_ordinals(self) -> Sequence[int]:
+        """Retorna a coluna de ordinais das datas (sem cópia)."""
+        return self.dates
+
+    def iter_rows(self) -> Iterator[Tuple[str, int, int, str]]:
+        """
+        Percorre as transações sem criar objetos Transaction.
+
+        Yields:
+            Tuplas (tipo, valor em centavos, ordinal da data, categoria)
+        """
+        categories = self.categories
+
+        for type_code, amount_cents, ordinal, category_code in zip(
+                self.types, self.amount_cents, self.dates, self.category_codes):
+            yield TYPE_NAMES[type_code], amount_cents, ordinal, categories[category_code]
+
+    def _view(self, position: int) -> Transaction:
+        """Cria o objeto Transaction de uma posição sem revalidar os campos."""
+        transaction = Transaction.__new__(Transaction)
+        transaction.transaction_type = TYPE_NAMES[self.types[position]]
+        transaction.amount_cents = self.amount_cents[position]
+        transaction.date = date.fromordinal(self.dates[position]).isoformat()
+        transaction.category = self.categories[self.category_codes[position]]
+        transaction.description = self.descriptions[position]
+        return transaction
+
+    def __len__(self) -> int:
+        return len(self.amount_cents)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Transaction, List[Transaction]]:
+        if isinstance(key, slice):
+            return [self._view(position) for position in range(*key.indices(len(self)))]
+
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("Posição de transação fora do intervalo")
+
+        return self._view(key)
+
+    def __iter__(self) -> Iterator[Transaction]:
+        for position in range(len(self)):
+            yield self._view(position)
+
+    def __delitem__(self, key: slice) -> None:
+        start, stop, step = key.indices(len(self)) if isinstance(key, slice) else (None, None, None)
+
+        # Apenas a remoção de uma fatia final é suportada (usada para desfazer lotes)
+        if step != 1 or stop != len(self):
+            raise TypeError("Só é possível remover transações do final do armazenamento")
+
+        del self.amount_cents[start:]
+        del self.dates[start:]
+        del self.types[start:]
+        del self.category_codes[start:]
+        del self.descriptions[start:]
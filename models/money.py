@@ -0,0 +1,52 @@
+import math
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Union
+
+
+def to_cents(value: Union[int, float, str, Decimal]) -> int:
+    """
+    Converte um valor monetário para centavos inteiros.
+    
+    Valores com mais de duas casas decimais são arredondados para o
+    centavo mais próximo (meio centavo arredonda para cima), seja qual for o
+    tipo do valor: floats são convertidos pelo seu repr ('0.125').
+    
+    Args:
+        value: Valor em reais (int, float, str ou Decimal)
+        
+    Returns:
+        Valor em centavos
+        
+    Raises:
+        ValueError: Se o valor não for finito (infinito ou NaN)
+    """
+    if isinstance(value, bool):
+        raise TypeError("Valor monetário inválido")
+    if isinstance(value, int):
+        return value * 100
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError("Valor monetário inválido")
+        # Para floats com até duas casas decimais, x * 100 fica a um erro de
+        # representação de um inteiro, que é o resultado (e é bem mais rápido
+        # que Decimal); os demais seguem o mesmo arredondamento de str e Decimal
+        cents = value * 100
+        rounded = round(cents)
+        if abs(cents - rounded) < 1e-6:
+            return rounded
+        value = repr(value)
+    
+    return int((Decimal(value) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> float:
+    """
+    Converte centavos inteiros para um valor em reais (float).
+    
+    Args:
+        cents: Valor em centavos
+        
+    Returns:
+        Valor em reais
+    """
+    return cents / 100
\ No newline at end of file
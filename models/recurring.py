@@ -0,0 +1,211 @@
+import calendar
+from datetime import date as date_type, datetime
+from typing import Any, Dict, Iterator, Optional
+
+from .money import from_cents, to_cents
+from .transaction import Transaction
+
+
+# Frequências aceitas e a quantidade de dias de cada passo (None: por mês)
+FREQUENCIES = {'daily': 1, 'weekly': 7, 'monthly': None}
+
+
+def _parse_date(value: str) -> date_type:
+    """Converte uma data no formato YYYY-MM-DD, com a mensagem de erro da aplicação."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        raise ValueError("Formato de data inválido. Use YYYY-MM-DD") from None
+
+
+class RecurringRule:
+    """
+    Regra de uma transação recorrente (ex: aluguel todo dia 5, salário mensal).
+
+    A regra gera as datas das ocorrências sob demanda (ver occurrences), sem
+    guardar nenhuma delas: o custo de percorrer um período é proporcional às
+    ocorrências dentro dele, mesmo que a regra tenha começado há anos.
+    'posted_until' é a data da última ocorrência já lançada como transação.
+    """
+
+    __slots__ = ('rule_id', 'transaction_type', 'amount_cents', 'start_date', 'frequency',
+                 'interval', 'end_date', 'category', 'description', 'posted_until')
+
+    def __init__(self, transaction_type: str, amount: float, start_date: str,
+                 frequency: str = 'monthly', interval: int = 1, end_date: Optional[str] = None,
+                 category: str = "", description: str = "", rule_id: int = 0,
+                 posted_until: Optional[str] = None):
+        """
+        Inicializa uma regra recorrente.
+
+        Args:
+            transaction_type: Tipo das transações ('receita' ou 'despesa')
+            amount: Valor de cada ocorrência (positivo)
+            start_date: Data da primeira ocorrência (formato: YYYY-MM-DD); nas
+                regras mensais, o dia se repete nos meses seguintes (dias 29 a
+                31 caem no último dia dos meses mais curtos)
+            frequency: 'daily', 'weekly' ou 'monthly'
+            interval: Quantidade de dias, semanas ou meses entre as ocorrências
+            end_date: Data limite inclusiva (None para sem fim)
+            category: Categoria das transações
+            description: Descrição das transações
+            rule_id: Identificador da regra (atribuído ao ser cadastrada)
+            posted_until: Data da última ocorrência já lançada (None se nenhuma)
+        """
+        # Reaproveita as validações de tipo e valor das transações
+        Transaction(transaction_type, amount, start_date)
+
+        if frequency not in FREQUENCIES:
+            raise ValueError("Frequência deve ser 'daily', 'weekly' ou 'monthly'")
+
+        if not isinstance(interval, int) or interval < 1:
+            raise ValueError("O intervalo entre as ocorrências deve ser de pelo menos 1")
+
+        if end_date is not None and _parse_date(end_date) < _parse_date(start_date):
+            raise ValueError("A data final deve ser posterior ou igual à data inicial")
+
+        if posted_until is not None:
+            _parse_date(posted_until)
+
+        self.rule_id = rule_id
+        self.transaction_type = transaction_type
+        self.amount_cents = to_cents(amount)
+        self.start_date = start_date
+        self.frequency = frequency
+        self.interval = interval
+        self.end_date = end_date
+        self.category = category
+        self.description = description
+        self.posted_until = posted_until
+
+    @property
+    def amount(self) -> float:
+        """Valor de cada ocorrência em reais."""
+        return from_cents(self.amount_cents)
+
+    @property
+    def signed_cents(self) -> int:
+        """Variação do saldo causada por cada ocorrência, em centavos."""
+        return self.amount_cents if self.transaction_type == 'receita' else -self.amount_cents
+
+    def occurrences(self, start_date: Optional[str] = None,
+                    end_date: Optional[str] = None) -> Iterator[str]:
+        """
+        Gera as datas das ocorrências em um período, em ordem cronológica.
+
+        A primeira ocorrência do período é calculada diretamente (sem
+        percorrer as anteriores), e as demais são geradas uma a uma à medida
+        que são consumidas. Sem end_date (e sem data final na regra), o
+        gerador é infinito.
+
+        Args:
+            start_date: Data inicial inclusiva (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+
+        Yields:
+            Datas das ocorrências (formato: YYYY-MM-DD)
+        """
+        first = _parse_date(self.start_date)
+        start = first if start_date is None else max(first, _parse_date(start_date))
+
+        ends = [_parse_date(value) for value in (end_date, self.end_date) if value is not None]
+        end = min(ends) if ends else None
+
+        step_days = FREQUENCIES[self.frequency]
+        if step_days is not None:
+            step = step_days * self.interval
+            # Primeiro múltiplo do passo a partir do início do período
+            skipped = -(-(start.toordinal() - first.toordinal()) // step)
+            ordinal = first.toordinal() + skipped * step
+            end_ordinal = end.toordinal() if end is not None else None
+
+            while end_ordinal is None or ordinal <= end_ordinal:
+                yield date_type.fromordinal(ordinal).isoformat()
+                ordinal += step
+            return
+
+        # Mensal: meses contados a partir do mês da primeira ocorrência
+        first_month = first.year * 12 + first.month - 1
+        skipped = -(-(start.year * 12 + start.month - 1 - first_month) // self.interval)
+        month_index = first_month + skipped * self.interval
+
+        while True:
+            year, month = divmod(month_index, 12)
+            day = min(first.day, calendar.monthrange(year, month + 1)[1])
+            occurrence = date_type(year, month + 1, day)
+            month_index += self.interval
+
+            if occurrence < start:
+                # O dia da ocorrência no mês inicial é anterior ao início do período
+                continue
+            if end is not None and occurrence > end:
+                return
+            yield occurrence.isoformat()
+
+    def pending(self, start_date: Optional[str] = None,
+                end_date: Optional[str] = None) -> Iterator[str]:
+        """
+        Gera as datas das ocorrências ainda não lançadas em um período.
+
+        Args:
+            start_date: Data inicial inclusiva (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+
+        Returns:
+            Iterador das datas posteriores a posted_until (ver occurrences)
+        """
+        if self.posted_until is not None:
+            after = date_type.fromordinal(_parse_date(self.posted_until).toordinal() + 1).isoformat()
+            if start_date is None or after > start_date:
+                start_date = after
+        return self.occurrences(start_date, end_date)
+
+    def to_transaction(self, date: str) -> Transaction:
+        """
+        Cria a transação de uma ocorrência.
+
+        Args:
+            date: Data da ocorrência (formato: YYYY-MM-DD)
+
+        Returns:
+            Transação com os dados da regra
+        """
+        return Transaction(self.transaction_type, self.amount, date, self.category,
+                           self.description)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte a regra para um dicionário."""
+        return {
+            'id': self.rule_id,
+            'type': self.transaction_type,
+            'amount': self.amount,
+            'start_date': self.start_date,
+            'frequency': self.frequency,
+            'interval': self.interval,
+            'end_date': self.end_date,
+            'category': self.category,
+            'description': self.description,
+            'posted_until': self.posted_until
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RecurringRule':
+        """
+        Cria uma regra a partir de um dicionário (ver to_dict).
+
+        Args:
+            data: Dicionário com os dados da regra ('id' e 'posted_until'
+                são opcionais)
+        """
+        return cls(
+            transaction_type=data['type'],
+            amount=data['amount'],
+            start_date=data['start_date'],
+            frequency=data.get('frequency', 'monthly'),
+            interval=data.get('interval', 1),
+            end_date=data.get('end_date'),
+            category=data.get('category', ""),
+            description=data.get('description', ""),
+            rule_id=data.get('id', 0),
+            posted_until=data.get('posted_until')
+        )
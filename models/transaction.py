@@ -1,8 +1,30 @@
-from datetime import datetime
+from datetime import date as date_type, datetime
 from typing import Dict, Any
 
+from .money import to_cents, from_cents
+
+
+def date_to_ordinal(date: str) -> int:
+    """
+    Converte uma data no formato YYYY-MM-DD para o ordinal do dia.
+    
+    Args:
+        date: Data no formato YYYY-MM-DD
+        
+    Returns:
+        Ordinal do dia (como em date.toordinal)
+    """
+    try:
+        return date_type.fromisoformat(date).toordinal()
+    except ValueError:
+        # Datas aceitas pelo strptime mas fora do padrão ISO (ex: 2025-1-5)
+        return datetime.strptime(date, "%Y-%m-%d").toordinal()
+
 
 class Transaction:
+    # Sem __dict__ por instância: reduz bastante a memória de históricos grandes
+    __slots__ = ('transaction_type', 'amount_cents', 'date', 'category', 'description')
+    
     def __init__(self, transaction_type: str, amount: float, date: str = None, 
                  category: str = "", description: str = ""):
         """
@@ -20,9 +42,14 @@ class Transaction:
         
         if amount <= 0:
             raise ValueError("Valor da transação deve ser positivo")
+        
+        amount_cents = to_cents(amount)
+        if amount_cents <= 0:
+            raise ValueError("Valor da transação deve ser de pelo menos R$ 0,01")
             
         self.transaction_type = transaction_type
-        self.amount = amount
+        # O valor é guardado em centavos inteiros para somas exatas
+        self.amount_cents = amount_cents
         
         # Se a data não for fornecida, usa a data atual
         if date is None:
@@ -37,6 +64,15 @@ class Transaction:
         
         self.category = category
         self.description = description
+    
+    @property
+    def amount(self) -> float:
+        """Valor da transação em reais."""
+        return from_cents(self.amount_cents)
+    
+    @amount.setter
+    def amount(self, value: float) -> None:
+        self.amount_cents = to_cents(value)
         
     def to_dict(self) -> Dict[str, Any]:
         """Converte a transação para um dicionário."""
@@ -49,8 +85,26 @@ class Transaction:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Transaction':
-        """Cria uma instância de Transaction a partir de um dicionário."""
+    def from_dict(cls, data: Dict[str, Any], trusted: bool = False) -> 'Transaction':
+        """
+        Cria uma instância de Transaction a partir de um dicionário.
+        
+        Args:
+            data: Dicionário com os dados da transação
+            trusted: Se True, os campos são atribuídos diretamente, sem passar
+                pelas validações do construtor. Use apenas para dados gravados
+                pela própria aplicação (a verificação fica a cargo do comando
+                de verificação do armazenamento).
+        """
+        if trusted:
+            transaction = cls.__new__(cls)
+            transaction.transaction_type = data['type']
+            transaction.amount_cents = to_cents(data['amount'])
+            transaction.date = data['date']
+            transaction.category = data['category']
+            transaction.description = data['description']
+            return transaction
+        
         return cls(
             transaction_type=data['type'],
             amount=data['amount'],
@@ -0,0 +1,102 @@
+from datetime import date
+from typing import Dict, Iterable, Optional, Tuple
+
+from models.transaction import Transaction
+
+
+# Nome usado nos relatórios para transações sem categoria
+UNCATEGORIZED = "Sem categoria"
+
+
+def _year_month(value: str) -> Tuple[int, int]:
+    """Extrai (ano, mês) de uma data no formato YYYY-MM-DD."""
+    if len(value) == 10:
+        return int(value[:4]), int(value[5:7])
+
+    # Datas aceitas pelo strptime mas fora do padrão ISO (ex: 2025-1-5)
+    year, month, _ = value.split('-')
+    return int(year), int(month)
+
+
+class TransactionAggregates:
+    """
+    Totais materializados das transações.
+
+    Mantém a soma dos valores, em centavos inteiros, por (ano, mês, tipo,
+    categoria) e por (tipo, categoria), atualizados a cada transação
+    adicionada. Assim os relatórios mensais e por categoria são respondidos
+    em tempo proporcional ao número de categorias, e não ao de transações.
+    """
+
+    def __init__(self):
+        """Inicializa os totais vazios."""
+        self.monthly: Dict[Tuple[int, int, str], Dict[str, int]] = {}
+        self.by_type: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def build(cls, transactions: Iterable[Transaction]) -> 'TransactionAggregates':
+        """
+        Calcula os totais de todas as transações em uma única passada.
+
+        Para armazenamentos compactos (colunar ou mapeado em memória), lê as
+        linhas via iter_rows, sem criar objetos Transaction.
+
+        Args:
+            transactions: Transações da conta
+
+        Returns:
+            Totais calculados
+        """
+        aggregates = cls()
+
+        if hasattr(transactions, 'iter_rows'):
+            for transaction_type, amount_cents, ordinal, category in transactions.iter_rows():
+                day = date.fromordinal(ordinal)
+                aggregates._add(transaction_type, amount_cents, day.year, day.month, category)
+        else:
+            for transaction in transactions:
+                aggregates.add(transaction)
+
+        return aggregates
+
+    def _add(self, transaction_type: str, amount_cents: int, year: int, month: int,
+             category: str) -> None:
+        """Soma um valor (em centavos) aos totais correspondentes."""
+        category = category or UNCATEGORIZED
+
+        month_totals = self.monthly.setdefault((year, month, transaction_type), {})
+        month_totals[category] = month_totals.get(category, 0) + amount_cents
+
+        type_totals = self.by_type.setdefault(transaction_type, {})
+        type_totals[category] = type_totals.get(category, 0) + amount_cents
+
+    def add(self, transaction: Transaction) -> None:
+        """
+        Atualiza os totais com uma nova transação.
+
+        Args:
+            transaction: Transação adicionada
+        """
+        year, month = _year_month(transaction.date)
+        self._add(transaction.transaction_type, transaction.amount_cents, year, month,
+                  transaction.category)
+
+    def category_totals(self, transaction_type: str, year: Optional[int] = None,
+                        month: Optional[int] = None) -> Dict[str, int]:
+        """
+        Obtém os totais por categoria de um tipo de transação, em centavos.
+
+        Args:
+            transaction_type: Tipo de transação ('receita' ou 'despesa')
+            year: Ano (informe junto com o mês para restringir a um mês)
+            month: Mês (1-12)
+
+        Returns:
+            Dicionário com categorias e seus valores totais (em centavos)
+        """
+        if year is not None and month is not None:
+            totals = self.monthly.get((year, month, transaction_type), {})
+        else:
+            totals = self.by_type.get(transaction_type, {})
+
+        return dict(totals)
@@ -0,0 +1,157 @@
+from typing import Dict, Iterable, List, Tuple
+
+
+class BalanceIndex:
+    """
+    Variação do saldo por dia em uma árvore de Fenwick (binary indexed tree).
+
+    Cada posição da árvore corresponde a um dia, contado a partir de um dia
+    base, e a árvore acumula as receitas menos as despesas (em centavos) de
+    cada dia. Atualizar um dia e somar todos os dias até uma data (prefixo)
+    custam O(log d), em que d é a quantidade de dias cobertos: transações
+    retroativas só atualizam o próprio dia, sem recalcular saldos
+    acumulados. Quando uma data cai fora da faixa coberta, a árvore é
+    reconstruída com pelo menos o dobro do tamanho, deixando a folga do lado
+    em que a faixa cresceu (antes da base para transações retroativas): uma
+    sequência de datas cada vez mais antigas ou mais novas reconstrói a
+    árvore só O(log d) vezes, e o custo das reconstruções fica amortizado.
+    """
+
+    def __init__(self):
+        """Inicializa um índice vazio."""
+        # Ordinal do dia na posição 1 da árvore e quantidade de dias cobertos
+        self.base = 0
+        self.size = 0
+        self.tree: List[int] = [0]
+        # Soma de todas as variações, em centavos
+        self.total = 0
+
+    @classmethod
+    def from_deltas(cls, deltas: Dict[int, int]) -> 'BalanceIndex':
+        """
+        Constrói o índice a partir das variações diárias, em O(d).
+
+        Args:
+            deltas: Variação do saldo (em centavos) por ordinal do dia
+
+        Returns:
+            Índice construído
+        """
+        index = cls()
+        if deltas:
+            index._rebuild(deltas, min(deltas), max(deltas))
+        return index
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple]) -> 'BalanceIndex':
+        """
+        Constrói o índice a partir de linhas de transações.
+
+        Args:
+            rows: Tuplas iniciadas por (tipo, valor em centavos, ordinal do dia),
+                como as de iter_rows
+
+        Returns:
+            Índice construído
+        """
+        deltas: Dict[int, int] = {}
+        for row in rows:
+            transaction_type, amount_cents, ordinal = row[0], row[1], row[2]
+            if transaction_type == 'despesa':
+                amount_cents = -amount_cents
+            deltas[ordinal] = deltas.get(ordinal, 0) + amount_cents
+        return cls.from_deltas(deltas)
+
+    def _rebuild(self, deltas: Dict[int, int], first: int, last: int) -> None:
+        """Reconstrói a árvore cobrindo pelo menos os dias de first a last."""
+        size = 1
+        while size < last - first + 1:
+            size *= 2
+
+        tree = [0] * (size + 1)
+        for ordinal, delta in deltas.items():
+            tree[ordinal - first + 1] += delta
+
+        # Cada nó repassa a sua soma ao nó responsável pelo intervalo seguinte
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+
+        self.base, self.size, self.tree = first, size, tree
+        self.total = sum(deltas.values())
+
+    def daily_deltas(self) -> Dict[int, int]:
+        """
+        Obtém as variações de cada dia (o inverso de from_deltas), em O(d).
+
+        Returns:
+            Variação do saldo (em centavos) por ordinal do dia, sem os dias zerados
+        """
+        tree = self.tree[:]
+
+        for i in range(self.size, 0, -1):
+            parent = i + (i & -i)
+            if parent <= self.size:
+                tree[parent] -= tree[i]
+
+        return {self.base + i - 1: delta for i, delta in enumerate(tree) if i and delta}
+
+    def add(self, ordinal: int, delta: int) -> None:
+        """
+        Soma uma variação ao saldo de um dia.
+
+        Args:
+            ordinal: Ordinal do dia
+            delta: Variação em centavos (positiva para receitas)
+        """
+        if not self.base <= ordinal < self.base + self.size:
+            self._grow(ordinal, delta)
+            return
+
+        i = ordinal - self.base + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+        self.total += delta
+
+    def _grow(self, ordinal: int, delta: int) -> None:
+        """Reconstrói a árvore com pelo menos o dobro do tamanho para cobrir o dia."""
+        deltas = self.daily_deltas()
+        deltas[ordinal] = deltas.get(ordinal, 0) + delta
+
+        if not self.size:
+            self._rebuild(deltas, ordinal, ordinal)
+            return
+
+        first = min(ordinal, self.base)
+        last = max(ordinal, self.base + self.size - 1)
+        size = self.size * 2
+        while size < last - first + 1:
+            size *= 2
+
+        if ordinal < self.base:
+            # Retroativa: a folga fica antes do dia, para as próximas mais antigas
+            self._rebuild(deltas, last - size + 1, last)
+        else:
+            self._rebuild(deltas, first, first + size - 1)
+
+    def prefix(self, ordinal: int) -> int:
+        """
+        Soma as variações de todos os dias até uma data, inclusive.
+
+        Args:
+            ordinal: Ordinal do último dia somado
+
+        Returns:
+            Soma em centavos
+        """
+        if ordinal < self.base:
+            return 0
+
+        i = min(ordinal - self.base + 1, self.size)
+        result = 0
+        while i > 0:
+            result += self.tree[i]
+            i -= i & -i
+        return result
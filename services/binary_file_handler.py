@@ -0,0 +1,293 @@
+import mmap
+import struct
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from models.account import Account
+from models.columnar_store import TYPE_CODES, TYPE_NAMES
+from models.money import to_cents, from_cents
+from models.transaction import Transaction, date_to_ordinal
+from services.journal_file_handler import JournalFileHandler
+
+
+# Cabeçalho: assinatura, versão, geração do journal, saldo (centavos),
+# quantidade de registros, quantidade de strings e início da tabela de strings
+HEADER = struct.Struct('<4sHxxQqQQQ')
+MAGIC = b'GFB1'
+FORMAT_VERSION = 1
+
+# Registro de tamanho fixo: valor (centavos), ordinal da data, tipo,
+# código da categoria e código da descrição na tabela de strings
+RECORD = struct.Struct('<qiBxxxII')
+
+# Tabela de strings: (n + 1) offsets de 64 bits seguidos dos bytes UTF-8
+OFFSET = struct.Struct('<Q')
+
+
+class MappedTransactions:
+    """
+    Transações lidas diretamente de um snapshot binário mapeado em memória.
+
+    Os registros não são desserializados na carga: valores, datas, tipos e
+    códigos de strings são expostos como colunas (memoryview com passo) sobre
+    o próprio mmap. Categoria e descrição só são decodificadas quando uma
+    transação é acessada. Transações adicionadas depois da carga ficam em
+    uma lista ao final ('tail').
+    """
+
+    def __init__(self, buffer: Optional[mmap.mmap] = None, count: int = 0,
+                 string_count: int = 0, strings_offset: int = 0):
+        """
+        Inicializa a visão sobre o snapshot.
+
+        Args:
+            buffer: Conteúdo do snapshot mapeado em memória (None para vazio)
+            count: Quantidade de registros
+            string_count: Quantidade de strings na tabela
+            strings_offset: Posição do início da tabela de strings
+        """
+        self.count = count
+        self.tail: List[Transaction] = []
+        self._category_cache: Dict[int, str] = {}
+
+        if buffer is None or count == 0:
+            self.amount_cents: Sequence[int] = []
+            self.dates: Sequence[int] = []
+            self.types: Sequence[int] = []
+            self.category_codes: Sequence[int] = []
+            self.description_codes: Sequence[int] = []
+        else:
+            view = memoryview(buffer)
+            records = view[HEADER.size:HEADER.size + count * RECORD.size]
+
+            # As colunas usam a ordem de bytes nativa; o arquivo é little-endian
+            self.amount_cents = records.cast('q')[0::3]
+            self.dates = records.cast('i')[2::6]
+            self.types = records.cast('B')[12::24]
+            self.category_codes = records.cast('I')[4::6]
+            self.description_codes = records.cast('I')[5::6]
+
+        self._buffer = buffer
+        self._strings_start = strings_offset + (string_count + 1) * OFFSET.size
+        self._strings_offset = strings_offset
+
+    def _string(self, code: int) -> str:
+        """Decodifica uma string da tabela a partir do seu código."""
+        start = OFFSET.unpack_from(self._buffer, self._strings_offset + code * OFFSET.size)[0]
+        end = OFFSET.unpack_from(self._buffer, self._strings_offset + (code + 1) * OFFSET.size)[0]
+        return self._buffer[self._strings_start + start:self._strings_start + end].decode('utf-8')
+
+    def _category(self, code: int) -> str:
+        """Decodifica uma categoria, reaproveitando as já decodificadas."""
+        category = self._category_cache.get(code)
+
+        if category is None:
+            category = self._category_cache[code] = self._string(code)
+
+        return category
+
+    def _view(self, position: int) -> Transaction:
+        """Cria o objeto Transaction de uma posição do snapshot."""
+        transaction = Transaction.__new__(Transaction)
+        transaction.transaction_type = TYPE_NAMES[self.types[position]]
+        transaction.amount_cents = self.amount_cents[position]
+        transaction.date = date.fromordinal(self.dates[position]).isoformat()
+        transaction.category = self._category(self.category_codes[position])
+        transaction.description = self._string(self.description_codes[position])
+        return transaction
+
+    def date_ordinals(self) -> Sequence[int]:
+        """Retorna os ordinais das datas, na ordem da conta."""
+        return list(self.dates) + [date_to_ordinal(t.date) for t in self.tail]
+
+    def iter_rows(self) -> Iterator[Tuple[str, int, int, str]]:
+        """
+        Percorre as transações sem criar objetos Transaction.
+
+        Yields:
+            Tuplas (tipo, valor em centavos, ordinal da data, categoria)
+        """
+        for type_code, amount_cents, ordinal, category_code in zip(
+                self.types, self.amount_cents, self.dates, self.category_codes):
+            yield TYPE_NAMES[type_code], amount_cents, ordinal, self._category(category_code)
+
+        for t in self.tail:
+            yield t.transaction_type, t.amount_cents, date_to_ordinal(t.date), t.category
+
+    def append(self, transaction: Transaction) -> None:
+        """Acrescenta uma transação (fica em memória até o próximo snapshot)."""
+        self.tail.append(transaction)
+
+    def extend(self, transactions: Iterator[Transaction]) -> None:
+        """Acrescenta várias transações (ficam em memória até o próximo snapshot)."""
+        self.tail.extend(transactions)
+
+    def __len__(self) -> int:
+        return self.count + len(self.tail)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Transaction, List[Transaction]]:
+        if isinstance(key, slice):
+            return [self[position] for position in range(*key.indices(len(self)))]
+
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("Posição de transação fora do intervalo")
+
+        if key < self.count:
+            return self._view(key)
+        return self.tail[key - self.count]
+
+    def __iter__(self) -> Iterator[Transaction]:
+        for position in range(self.count):
+            yield self._view(position)
+        yield from self.tail
+
+    def __delitem__(self, key: slice) -> None:
+        start, stop, step = key.indices(len(self)) if isinstance(key, slice) else (None, None, None)
+
+        # Apenas as transações adicionadas depois da carga podem ser removidas
+        if step != 1 or stop != len(self) or start < self.count:
+            raise TypeError("Só é possível remover transações adicionadas após a carga")
+
+        del self.tail[start - self.count:]
+
+
+class BinaryFileHandler(JournalFileHandler):
+    """
+    Snapshot em formato binário, lido via mmap, com journal incremental.
+
+    O snapshot guarda registros de tamanho fixo (valor, data e tipo, além
+    dos códigos de categoria e descrição) seguidos de uma tabela de strings
+    sem repetições. Na carga, o arquivo é mapeado em memória e a conta usa
+    as colunas diretamente, sem criar um dicionário e um objeto por linha.
+    As transações novas vão para o journal, como no JournalFileHandler.
+
+    O formato usa ordem de bytes little-endian, a mesma das colunas nativas
+    nas plataformas suportadas (x86 e ARM).
+    """
+
+    def _map_snapshot(self) -> Tuple[MappedTransactions, int, int]:
+        """
+        Mapeia o snapshot em memória.
+
+        Returns:
+            Tupla (transações mapeadas, saldo em centavos, geração do journal)
+        """
+        try:
+            with open(self.file_path, 'rb') as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            # Arquivo inexistente ou vazio
+            return MappedTransactions(), 0, 0
+
+        if len(buffer) < HEADER.size:
+            return MappedTransactions(), 0, 0
+
+        (magic, version, generation, balance_cents,
+         count, string_count, strings_offset) = HEADER.unpack_from(buffer)
+
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Arquivo {self.file_path} não é um snapshot binário válido")
+
+        return MappedTransactions(buffer, count, string_count, strings_offset), balance_cents, generation
+
+    def _read_snapshot(self) -> Dict[str, Any]:
+        """Lê o snapshot binário no formato de dicionário do FileHandler."""
+        transactions, balance_cents, generation = self._map_snapshot()
+
+        if transactions.count == 0 and generation == 0:
+            return {}
+
+        return {
+            'balance': from_cents(balance_cents),
+            'transactions': [t.to_dict() for t in transactions],
+            'journal_generation': generation
+        }
+
+    def _write_snapshot(self, path: str, snapshot: Dict[str, Any]) -> None:
+        """
+        Escreve o snapshot binário.
+
+        Args:
+            path: Caminho do arquivo (temporário) de destino
+            snapshot: Dados da conta, incluindo 'journal_generation'
+        """
+        transactions = snapshot.get('transactions', [])
+        string_codes: Dict[str, int] = {}
+        strings: List[bytes] = []
+
+        def code(value: str) -> int:
+            if value not in string_codes:
+                string_codes[value] = len(strings)
+                strings.append(value.encode('utf-8'))
+            return string_codes[value]
+
+        records = bytearray(len(transactions) * RECORD.size)
+        for position, t in enumerate(transactions):
+            RECORD.pack_into(records, position * RECORD.size,
+                             to_cents(t['amount']), date_to_ordinal(t['date']),
+                             TYPE_CODES[t['type']], code(t['category']), code(t['description']))
+
+        offsets = bytearray((len(strings) + 1) * OFFSET.size)
+        position = 0
+        for index, value in enumerate(strings):
+            OFFSET.pack_into(offsets, index * OFFSET.size, position)
+            position += len(value)
+        OFFSET.pack_into(offsets, len(strings) * OFFSET.size, position)
+
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, snapshot['journal_generation'],
+                             to_cents(snapshot.get('balance', 0.0)), len(transactions),
+                             len(strings), HEADER.size + len(records))
+
+        with open(path, 'wb') as file:
+            file.write(header)
+            file.write(records)
+            file.write(offsets)
+            file.writelines(strings)
+
+    def load_balance_cents(self) -> int:
+        """
+        Carrega o saldo, em centavos, do cabeçalho do snapshot e do journal.
+
+        Returns:
+            Saldo armazenado em centavos (0 se não houver dados)
+        """
+        with self.lock:
+            _, balance_cents, self.generation = self._map_snapshot()
+            entries = self._read_journal()
+            self.pending_entries = len(entries)
+
+        for entry in entries:
+            if entry['type'] == 'receita':
+                balance_cents += to_cents(entry['amount'])
+            else:
+                balance_cents -= to_cents(entry['amount'])
+
+        return balance_cents
+
+    def load_account(self, columnar: bool = False, trusted: bool = False) -> Account:
+        """
+        Carrega a conta usando as transações mapeadas em memória.
+
+        O snapshot já é compacto, então o parâmetro columnar é ignorado. Os
+        lançamentos do journal são reaplicados por cima do snapshot.
+
+        Args:
+            columnar: Ignorado (o snapshot mapeado já é colunar)
+            trusted: Se True, os lançamentos do journal não são revalidados
+
+        Returns:
+            Instância de Account carregada
+        """
+        with self.lock:
+            transactions, balance_cents, self.generation = self._map_snapshot()
+            entries = self._read_journal()
+            self.pending_entries = len(entries)
+            self._mark_synced(len(transactions) + len(entries))
+
+        account = Account()
+        account.transactions = transactions
+        account.balance_cents = balance_cents
+        account.add_transactions([Transaction.from_dict(e, trusted=trusted) for e in entries])
+        return account
@@ -0,0 +1,95 @@
+from bisect import bisect_left, bisect_right
+from typing import List, Sequence
+
+from models.transaction import date_to_ordinal
+
+
+class DateIndex:
+    """
+    Índice das transações ordenado por data.
+
+    Guarda, em listas paralelas ordenadas, o ordinal da data de cada
+    transação e a sua posição na lista da conta. Consultas por período
+    viram duas buscas binárias, sem converter nenhuma data armazenada.
+    """
+
+    def __init__(self):
+        """Inicializa um índice vazio."""
+        self.ordinals: List[int] = []
+        self.positions: List[int] = []
+
+    @classmethod
+    def from_ordinals(cls, ordinals: Sequence[int]) -> 'DateIndex':
+        """
+        Constrói o índice a partir dos ordinais das datas, na ordem da conta.
+
+        Args:
+            ordinals: Ordinais das datas das transações
+
+        Returns:
+            Índice construído
+        """
+        index = cls()
+
+        # Ordenação estável: datas iguais mantêm a ordem de inserção
+        index.positions = sorted(range(len(ordinals)), key=ordinals.__getitem__)
+        index.ordinals = [ordinals[position] for position in index.positions]
+        return index
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def insert(self, value: str, position: int) -> None:
+        """
+        Insere uma transação no índice.
+
+        Transações com data retroativa são inseridas no ponto correto; as
+        que chegam em ordem cronológica caem no final da lista.
+
+        Args:
+            value: Data da transação (formato: YYYY-MM-DD)
+            position: Posição da transação na lista da conta
+        """
+        ordinal = date_to_ordinal(value)
+        index = bisect_right(self.ordinals, ordinal)
+        self.ordinals.insert(index, ordinal)
+        self.positions.insert(index, position)
+
+    def discard_from(self, position: int) -> None:
+        """
+        Remove do índice as transações a partir de uma posição da conta.
+
+        Args:
+            position: Primeira posição removida
+        """
+        kept = [i for i, p in enumerate(self.positions) if p < position]
+        self.ordinals = [self.ordinals[i] for i in kept]
+        self.positions = [self.positions[i] for i in kept]
+
+    def count(self, start_ordinal: int, end_ordinal: int) -> int:
+        """
+        Conta as transações em um intervalo de datas, sem copiar as posições.
+
+        Args:
+            start_ordinal: Ordinal da data inicial (inclusiva)
+            end_ordinal: Ordinal da data final (inclusiva)
+
+        Returns:
+            Quantidade de transações no período
+        """
+        return bisect_right(self.ordinals, end_ordinal) - bisect_left(self.ordinals, start_ordinal)
+
+    def range(self, start_ordinal: int, end_ordinal: int) -> List[int]:
+        """
+        Obtém as posições das transações em um intervalo de datas.
+
+        Args:
+            start_ordinal: Ordinal da data inicial (inclusiva)
+            end_ordinal: Ordinal da data final (inclusiva)
+
+        Returns:
+            Posições das transações no período, na ordem de inserção
+        """
+        low = bisect_left(self.ordinals, start_ordinal)
+        high = bisect_right(self.ordinals, end_ordinal)
+        return sorted(self.positions[low:high])
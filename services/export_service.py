@@ -0,0 +1,144 @@
+import csv
+import json
+import sys
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional, TextIO
+
+from models.transaction import Transaction
+from services.transaction_service import TransactionService
+
+
+# Colunas exportadas (os mesmos nomes aceitos pela importação de CSV)
+EXPORT_FIELDS = ['type', 'amount', 'date', 'category', 'description']
+
+# Formatos de exportação suportados
+EXPORT_FORMATS = ('csv', 'jsonl')
+
+# Tamanho do buffer do arquivo de saída (em bytes)
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def _chunks(transactions: Iterable[Transaction], size: int) -> Iterator[List[Transaction]]:
+    """Agrupa as transações em blocos de até 'size' itens."""
+    transactions = iter(transactions)
+
+    while True:
+        chunk = list(islice(transactions, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_csv(transactions: Iterable[Transaction], output: TextIO, chunk_size: int = 10000) -> int:
+    """
+    Escreve as transações em CSV, com cabeçalho, bloco a bloco.
+
+    Args:
+        transactions: Transações a serem escritas
+        output: Arquivo de saída (aberto com newline='')
+        chunk_size: Quantidade de linhas por bloco escrito
+
+    Returns:
+        Quantidade de transações escritas
+    """
+    writer = csv.writer(output)
+    writer.writerow(EXPORT_FIELDS)
+    count = 0
+
+    for chunk in _chunks(transactions, chunk_size):
+        writer.writerows(
+            (t.transaction_type, f"{t.amount:.2f}", t.date, t.category, t.description)
+            for t in chunk
+        )
+        count += len(chunk)
+
+    return count
+
+
+def write_jsonl(transactions: Iterable[Transaction], output: TextIO, chunk_size: int = 10000) -> int:
+    """
+    Escreve as transações em JSON Lines (um objeto por linha), bloco a bloco.
+
+    Args:
+        transactions: Transações a serem escritas
+        output: Arquivo de saída
+        chunk_size: Quantidade de linhas por bloco escrito
+
+    Returns:
+        Quantidade de transações escritas
+    """
+    count = 0
+
+    for chunk in _chunks(transactions, chunk_size):
+        output.write(''.join(json.dumps(t.to_dict(), ensure_ascii=False) + '\n' for t in chunk))
+        count += len(chunk)
+
+    return count
+
+
+class ExportService:
+    """
+    Exportação das transações para CSV ou JSON Lines.
+
+    As transações são lidas do TransactionService com iter_transactions e
+    escritas em blocos: nem a lista completa nem a estrutura de to_dict()
+    da conta são montadas em memória.
+    """
+
+    def __init__(self, transaction_service: TransactionService, chunk_size: int = 10000):
+        """
+        Inicializa o serviço de exportação.
+
+        Args:
+            transaction_service: Serviço de transações
+            chunk_size: Quantidade de linhas escritas por bloco
+        """
+        self.transaction_service = transaction_service
+        self.chunk_size = chunk_size
+
+    def export(self, output: TextIO, file_format: str = 'csv', **filters: Any) -> int:
+        """
+        Exporta as transações para um arquivo já aberto.
+
+        Args:
+            output: Arquivo de saída (para CSV, aberto com newline='')
+            file_format: 'csv' ou 'jsonl'
+            filters: Filtros de TransactionService.iter_transactions
+                (start_date, end_date, transaction_type, category)
+
+        Returns:
+            Quantidade de transações exportadas
+        """
+        if file_format not in EXPORT_FORMATS:
+            raise ValueError(f"Formato de exportação desconhecido: {file_format}")
+
+        transactions = self.transaction_service.iter_transactions(**filters)
+
+        if file_format == 'csv':
+            return write_csv(transactions, output, self.chunk_size)
+        return write_jsonl(transactions, output, self.chunk_size)
+
+    def export_to_path(self, path: str, file_format: Optional[str] = None,
+                       **filters: Any) -> int:
+        """
+        Exporta as transações para um arquivo ('-' para a saída padrão).
+
+        Args:
+            path: Caminho do arquivo de saída
+            file_format: 'csv' ou 'jsonl' (padrão: pela extensão do arquivo)
+            filters: Filtros de TransactionService.iter_transactions
+
+        Returns:
+            Quantidade de transações exportadas
+        """
+        if file_format is None:
+            file_format = 'jsonl' if path.lower().endswith(('.jsonl', '.ndjson')) else 'csv'
+
+        if file_format not in EXPORT_FORMATS:
+            raise ValueError(f"Formato de exportação desconhecido: {file_format}")
+
+        if path == '-':
+            return self.export(sys.stdout, file_format, **filters)
+
+        with open(path, 'w', encoding='utf-8', newline='', buffering=OUTPUT_BUFFER_SIZE) as output:
+            return self.export(output, file_format, **filters)
@@ -1,9 +1,57 @@
 import json
 import os
-from typing import Dict, Any, Optional
+import re
+from typing import Dict, Any, List, Optional
+
+from models.account import Account
+from models.money import to_cents, from_cents
+from services.file_lock import FileLock
+from services.profiler import instrumented
+
+
+# Início do arquivo JSON gravado por save_data: o saldo é a primeira chave
+BALANCE_PREFIX = re.compile(rb'\{\s*"balance"\s*:\s*(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s*[,}]')
+
+# Versão do arquivo, gravada logo depois do saldo e incrementada a cada gravação
+VERSION_PREFIX = re.compile(rb'\{\s*"balance"\s*:\s*[^,}]*,\s*"version"\s*:\s*(\d+)\s*[,}]')
+
+
+def balance_delta_cents(transactions: List[Dict[str, Any]]) -> int:
+    """
+    Calcula a variação do saldo, em centavos, causada por transações.
+    
+    Args:
+        transactions: Lista de transações (em formato de dicionário)
+        
+    Returns:
+        Soma das receitas menos a soma das despesas, em centavos
+    """
+    delta = 0
+    for transaction in transactions:
+        if transaction['type'] == 'receita':
+            delta += to_cents(transaction['amount'])
+        else:
+            delta -= to_cents(transaction['amount'])
+    return delta
 
 
 class FileHandler:
+    """
+    Armazenamento da conta em um arquivo JSON.
+    
+    Vários processos podem usar o mesmo arquivo: as gravações acontecem sob
+    uma trava entre processos (FileLock) e o arquivo guarda um número de
+    versão, incrementado a cada gravação. Se outro processo gravou desde a
+    última leitura, as transações novas desta instância são acrescentadas
+    ao conteúdo atual do arquivo, em vez de sobrescrevê-lo (ver save_data),
+    e has_changed/load_changes permitem acompanhar as gravações dos outros.
+    """
+    
+    # Indica se o backend consegue gravar transações novas sem reescrever tudo
+    supports_append = False
+    # Indica se o backend responde consultas filtradas sem carregar tudo em memória
+    supports_queries = False
+    
     def __init__(self, file_path: str):
         """
         Inicializa o manipulador de arquivo.
@@ -12,16 +60,29 @@ class FileHandler:
             file_path: Caminho para o arquivo JSON
         """
         self.file_path = file_path
+        self.lock = FileLock(file_path + '.lock')
+        # Estado do armazenamento quando a memória foi sincronizada com ele
+        # (None enquanto os dados não forem carregados)
+        self._synced_state: Any = None
+        # Quantidade de transações em memória que já estão no armazenamento
+        self.synced_count = 0
+        # Indica que esta instância gravou por cima de gravações de outro
+        # processo: a ordem em memória não é mais um prefixo do armazenamento
+        self._diverged = False
         
         # Cria o diretório se não existir
         directory = os.path.dirname(file_path)
         if not os.path.exists(directory):
-            os.makedirs(directory)
+            os.makedirs(directory, exist_ok=True)
         
-        # Cria o arquivo se não existir
-        if not os.path.exists(file_path):
-            self.save_data({})
+        # Cria o arquivo se não existir (sob a trava, para não apagar os
+        # dados que outro processo acabou de gravar)
+        with self.lock:
+            if not os.path.exists(file_path):
+                self.save_data({})
+                self._mark_synced(0)
     
+    @instrumented
     def load_data(self) -> Dict[str, Any]:
         """
         Carrega os dados do arquivo JSON.
@@ -31,17 +92,208 @@ class FileHandler:
         """
         try:
             with open(self.file_path, 'r', encoding='utf-8') as file:
-                return json.load(file)
+                data = json.load(file)
         except (json.JSONDecodeError, FileNotFoundError):
             # Retorna um dicionário vazio se o arquivo estiver vazio ou não existir
             return {}
+        
+        data.pop('version', None)
+        return data
     
+    @instrumented
     def save_data(self, data: Dict[str, Any]) -> None:
         """
-        Salva os dados no arquivo JSON.
+        Salva os dados no armazenamento.
+        
+        A gravação acontece sob a trava entre processos. Se outro processo
+        gravou desde a última sincronização, as transações desta instância
+        que ainda não estavam gravadas são acrescentadas ao conteúdo atual
+        (as transações nunca são alteradas nem removidas, então nada se
+        perde) e o saldo é recalculado a partir do saldo gravado.
+        
+        Args:
+            data: Dicionário com os dados a serem salvos
+        """
+        with self.lock:
+            if not data or not self.has_changed():
+                self._write_data(data)
+                if self._synced_state is not None:
+                    self._mark_synced(len(data.get('transactions', [])))
+                return
+            
+            count = len(data.get('transactions', []))
+            self._write_data(self._merge(data))
+            # A memória continua sem as transações dos outros processos:
+            # o estado sincronizado não é atualizado (has_changed segue True)
+            self.synced_count = count
+            self._diverged = True
+    
+    def _merge(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Acrescenta ao conteúdo atual do armazenamento as transações ainda não gravadas.
+        
+        Args:
+            data: Dados em memória desta instância
+            
+        Returns:
+            Dados a gravar
+        """
+        current = self.load_data()
+        new_transactions = data.get('transactions', [])[self.synced_count:]
+        balance_cents = to_cents(current.get('balance', 0.0)) + balance_delta_cents(new_transactions)
+        
+        return {
+            'balance': from_cents(balance_cents),
+            'transactions': current.get('transactions', []) + new_transactions
+        }
+    
+    def _write_data(self, data: Dict[str, Any]) -> None:
+        """
+        Grava os dados no arquivo JSON (chamado sob a trava).
+        
+        A gravação é feita em um arquivo temporário que substitui o original
+        apenas no final, de forma que uma falha no meio da escrita não corrompe
+        os dados já salvos (e leitores sem a trava nunca veem um arquivo
+        pela metade).
         
         Args:
             data: Dicionário com os dados a serem salvos
         """
-        with open(self.file_path, 'w', encoding='utf-8') as file:
-            json.dump(data, file, indent=4, ensure_ascii=False)
\ No newline at end of file
+        if 'balance' in data:
+            document = {'balance': data['balance'], 'version': self._state() + 1}
+            document.update((key, value) for key, value in data.items()
+                            if key not in document)
+            data = document
+        
+        temp_path = self.file_path + '.tmp'
+        
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(data, file, indent=4, ensure_ascii=False)
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    
+    def _state(self) -> Any:
+        """
+        Lê um identificador barato do conteúdo gravado.
+        
+        Returns:
+            Versão do arquivo, lida do início dele (0 se não houver)
+        """
+        try:
+            with open(self.file_path, 'rb') as file:
+                match = VERSION_PREFIX.match(file.read(256))
+        except FileNotFoundError:
+            return 0
+        
+        return int(match.group(1)) if match else 0
+    
+    def _mark_synced(self, count: int) -> None:
+        """
+        Registra que a memória corresponde ao armazenamento (chamado sob a trava).
+        
+        Args:
+            count: Quantidade de transações gravadas
+        """
+        self._synced_state = self._state()
+        self.synced_count = count
+        self._diverged = False
+    
+    def has_changed(self) -> bool:
+        """
+        Indica se outro processo gravou desde a última sincronização.
+        
+        A verificação lê apenas o início do arquivo (ou os metadados do
+        armazenamento), sem carregar os dados.
+        
+        Returns:
+            True se os dados em memória estão desatualizados
+        """
+        return self._synced_state is not None and self._state() != self._synced_state
+    
+    def load_changes(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lê as transações gravadas por outros processos desde a última sincronização.
+        
+        As transações só são acrescentadas ao armazenamento, então as novas
+        ficam depois das que já estão em memória. Se esta instância gravou
+        por cima de gravações de outro processo (ver save_data), a ordem em
+        memória não corresponde mais à do armazenamento e a conta precisa ser
+        recarregada com load_account.
+        
+        Returns:
+            Transações novas (em formato de dicionário), ou None se a conta
+            precisar ser recarregada por completo
+        """
+        with self.lock:
+            if self._synced_state is None or self._diverged:
+                return None
+            
+            transactions = self.load_data().get('transactions', [])
+            if len(transactions) < self.synced_count:
+                return None
+            
+            changes = transactions[self.synced_count:]
+            self._mark_synced(len(transactions))
+        
+        return changes
+    
+    def load_account(self, columnar: bool = False, trusted: bool = False) -> Account:
+        """
+        Carrega a conta a partir dos dados armazenados.
+        
+        Backends capazes de montar a conta sem passar por um dicionário
+        intermediário sobrescrevem este método.
+        
+        Args:
+            columnar: Se True, usa o armazenamento colunar compacto
+            trusted: Se True, as transações não são revalidadas
+            
+        Returns:
+            Instância de Account carregada (vazia se não houver dados)
+        """
+        with self.lock:
+            data = self.load_data()
+            self._mark_synced(len(data.get('transactions', [])))
+        
+        if data:
+            return Account.from_dict(data, columnar=columnar, trusted=trusted)
+        
+        return Account(columnar=columnar)
+    
+    def load_balance_cents(self) -> int:
+        """
+        Carrega apenas o saldo, em centavos.
+        
+        Lê só o início do arquivo, onde save_data grava o saldo; se o arquivo
+        não estiver nesse formato, carrega os dados completos.
+        
+        Returns:
+            Saldo armazenado em centavos (0 se não houver dados)
+        """
+        try:
+            with open(self.file_path, 'rb') as file:
+                match = BALANCE_PREFIX.match(file.read(256))
+        except FileNotFoundError:
+            return 0
+        
+        if match:
+            return to_cents(float(match.group(1)))
+        
+        return to_cents(self.load_data().get('balance', 0.0))
+    
+    def append_transactions(self, transactions: List[Dict[str, Any]]) -> None:
+        """
+        Acrescenta transações ao armazenamento sem reescrever o arquivo.
+        
+        Args:
+            transactions: Lista de transações (em formato de dicionário)
+        """
+        raise NotImplementedError("Este backend não suporta gravação incremental")
+    
+    def needs_compaction(self) -> bool:
+        """Indica se o backend deve receber um snapshot completo via save_data."""
+        return False
\ No newline at end of file
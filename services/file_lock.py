@@ -0,0 +1,71 @@
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    # Sem fcntl (Windows), a trava protege apenas as threads do próprio processo
+    fcntl = None
+
+
+class FileLock:
+    """
+    Trava exclusiva entre processos, baseada em fcntl.flock.
+
+    A trava é feita sobre um arquivo auxiliar (ex: 'transactions.json.lock'),
+    que nunca é substituído, ao contrário do arquivo de dados, regravado via
+    rename. Ela é reentrante e também serializa as threads do processo
+    (ex: a thread de gravação do modo write-behind). O sistema operacional
+    libera a trava se o processo terminar enquanto a segura.
+    """
+
+    def __init__(self, path: str):
+        """
+        Inicializa a trava (o arquivo auxiliar só é aberto ao travar).
+
+        Args:
+            path: Caminho do arquivo auxiliar da trava
+        """
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd = None
+
+    def acquire(self) -> None:
+        """Espera até obter a trava."""
+        self._thread_lock.acquire()
+
+        if self._depth == 0:
+            try:
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                if fcntl is not None:
+                    try:
+                        fcntl.flock(fd, fcntl.LOCK_EX)
+                    except BaseException:
+                        os.close(fd)
+                        raise
+            except BaseException:
+                self._thread_lock.release()
+                raise
+            self._fd = fd
+
+        self._depth += 1
+
+    def release(self) -> None:
+        """Libera a trava."""
+        self._depth -= 1
+
+        if self._depth == 0:
+            fd, self._fd = self._fd, None
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+        self._thread_lock.release()
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
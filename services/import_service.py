@@ -0,0 +1,277 @@
+import csv
+import re
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from models.transaction import Transaction
+from services.transaction_service import TransactionService
+
+
+# Campos de Transaction e as colunas do CSV correspondentes (padrão: mesmos nomes de to_dict)
+DEFAULT_COLUMNS = {
+    'type': 'type',
+    'amount': 'amount',
+    'date': 'date',
+    'category': 'category',
+    'description': 'description',
+}
+
+# Quantidade máxima de erros guardados com detalhes (os demais só são contados)
+MAX_REPORTED_ERRORS = 1000
+
+# Uma marcação OFX: <TAG>valor ou </TAG>
+OFX_TAG = re.compile(r'<(/?)([A-Za-z0-9.]+)>([^<]*)')
+
+# Tipo de linha lida pelos leitores: (número da linha, campos da transação)
+Row = Tuple[int, Dict[str, Any]]
+
+
+def parse_amount(value: str) -> Decimal:
+    """
+    Converte um valor textual em Decimal.
+
+    Aceita ponto ou vírgula como separador decimal e separadores de milhar
+    (ex: '1234.56', '1234,56', '1.234,56', '1,234.56', 'R$ -10,00').
+
+    Args:
+        value: Valor lido do arquivo
+
+    Returns:
+        Valor convertido (pode ser negativo)
+    """
+    text = value.strip().replace('R$', '').replace(' ', '')
+
+    if ',' in text and '.' in text:
+        # O separador que aparece por último é o decimal
+        if text.rfind(',') > text.rfind('.'):
+            text = text.replace('.', '').replace(',', '.')
+        else:
+            text = text.replace(',', '')
+    elif ',' in text:
+        text = text.replace(',', '.')
+
+    try:
+        amount = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"Valor inválido: {value!r}") from None
+
+    # 'nan' e 'inf' são aceitos pelo Decimal, mas não são valores monetários
+    if not amount.is_finite():
+        raise ValueError(f"Valor inválido: {value!r}")
+
+    return amount
+
+
+def read_csv(path: str, columns: Optional[Dict[str, str]] = None, delimiter: str = ',',
+             date_format: str = "%Y-%m-%d", encoding: str = 'utf-8') -> Iterator[Row]:
+    """
+    Lê as transações de um arquivo CSV, uma linha por vez.
+
+    A primeira linha deve conter os nomes das colunas. Se a coluna do tipo
+    não for mapeada, o tipo é deduzido do sinal do valor (negativo = despesa).
+
+    Args:
+        path: Caminho do arquivo CSV
+        columns: Mapeamento campo -> coluna (padrão: DEFAULT_COLUMNS)
+        delimiter: Separador de colunas
+        date_format: Formato das datas no arquivo (convertidas para YYYY-MM-DD)
+        encoding: Codificação do arquivo
+
+    Yields:
+        Tuplas (número da linha, campos da transação)
+    """
+    columns = dict(DEFAULT_COLUMNS if columns is None else columns)
+
+    with open(path, 'r', encoding=encoding, newline='') as file:
+        reader = csv.DictReader(file, delimiter=delimiter)
+
+        if reader.fieldnames is not None and 'type' in columns \
+                and columns['type'] not in reader.fieldnames:
+            # Arquivo sem coluna de tipo: o sinal do valor define o tipo
+            del columns['type']
+
+        for row in reader:
+            fields = {field: row.get(column) for field, column in columns.items()}
+            yield reader.line_num, _normalize(fields, date_format)
+
+
+def read_ofx(path: str, encoding: str = 'latin-1') -> Iterator[Row]:
+    """
+    Lê as transações (blocos STMTTRN) de um extrato OFX, uma por vez.
+
+    Funciona com OFX 1.x (SGML, sem marcações de fechamento) e 2.x (XML).
+    O valor com sinal define o tipo, a data vem de DTPOSTED e a descrição
+    de MEMO (ou NAME).
+
+    Args:
+        path: Caminho do arquivo OFX
+        encoding: Codificação do arquivo
+
+    Yields:
+        Tuplas (número da linha do início do bloco, campos da transação)
+    """
+    current: Optional[Dict[str, str]] = None
+    start_line = 0
+
+    with open(path, 'r', encoding=encoding, errors='replace') as file:
+        for line_number, line in enumerate(file, start=1):
+            for closing, tag, value in OFX_TAG.findall(line):
+                tag = tag.upper()
+
+                if tag == 'STMTTRN':
+                    if closing and current is not None:
+                        yield start_line, _ofx_fields(current)
+                        current = None
+                    elif not closing:
+                        current, start_line = {}, line_number
+                elif current is not None and not closing:
+                    current[tag] = value.strip()
+
+
+def _ofx_fields(block: Dict[str, str]) -> Dict[str, Any]:
+    """Converte um bloco STMTTRN nos campos da transação."""
+    posted = block.get('DTPOSTED', '')
+    date = f"{posted[:4]}-{posted[4:6]}-{posted[6:8]}" if len(posted) >= 8 else posted
+
+    return _normalize({
+        'amount': block.get('TRNAMT'),
+        'date': date,
+        'category': '',
+        'description': block.get('MEMO') or block.get('NAME', ''),
+    }, "%Y-%m-%d")
+
+
+def _normalize(fields: Dict[str, Any], date_format: str) -> Dict[str, Any]:
+    """
+    Converte valor, tipo e data lidos do arquivo.
+
+    Erros de conversão não são lançados aqui: o campo fica com a mensagem
+    em '_error', para que a linha seja rejeitada na validação.
+    """
+    try:
+        if fields.get('amount') in (None, ''):
+            raise ValueError("Valor ausente")
+
+        amount = parse_amount(fields['amount'])
+
+        if fields.get('type') in (None, ''):
+            fields['type'] = 'despesa' if amount < 0 else 'receita'
+            amount = abs(amount)
+        else:
+            fields['type'] = fields['type'].strip().lower()
+
+        fields['amount'] = amount
+
+        if fields.get('date') and date_format != "%Y-%m-%d":
+            try:
+                parsed = datetime.strptime(fields['date'].strip(), date_format)
+                fields['date'] = parsed.strftime("%Y-%m-%d")
+            except ValueError:
+                raise ValueError(f"Data inválida: {fields['date']!r}") from None
+    except ValueError as e:
+        fields['_error'] = str(e)
+
+    return fields
+
+
+class ImportService:
+    """
+    Importação de transações em lote a partir de arquivos.
+
+    As linhas chegam por geradores (read_csv, read_ofx), são validadas em
+    blocos e gravadas com TransactionService.add_transactions dentro de
+    deferred_writes: o arquivo nunca é lido inteiro para a memória e, nos
+    backends sem gravação incremental, os dados são regravados uma única
+    vez no final. Linhas inválidas são registradas e não interrompem a
+    importação.
+    """
+
+    def __init__(self, transaction_service: TransactionService, chunk_size: int = 5000):
+        """
+        Inicializa o serviço de importação.
+
+        Args:
+            transaction_service: Serviço de transações
+            chunk_size: Quantidade de linhas validadas e gravadas por bloco
+        """
+        self.transaction_service = transaction_service
+        self.chunk_size = chunk_size
+
+    def import_rows(self, rows: Iterable[Row]) -> Dict[str, Any]:
+        """
+        Valida e grava as linhas lidas de um arquivo.
+
+        Args:
+            rows: Tuplas (número da linha, campos da transação)
+
+        Returns:
+            Dicionário com 'imported' (quantidade gravada), 'rejected'
+            (quantidade de linhas inválidas) e 'errors' (lista de tuplas
+            (linha, mensagem), limitada a MAX_REPORTED_ERRORS)
+        """
+        result: Dict[str, Any] = {'imported': 0, 'rejected': 0, 'errors': []}
+        rows = iter(rows)
+
+        with self.transaction_service.deferred_writes():
+            while True:
+                chunk = list(islice(rows, self.chunk_size))
+                if not chunk:
+                    break
+
+                batch = self._validate(chunk, result)
+                result['imported'] += self.transaction_service.add_transactions(batch)
+
+        return result
+
+    def _validate(self, chunk: List[Row], result: Dict[str, Any]) -> List[Transaction]:
+        """Cria as transações válidas de um bloco e registra as linhas rejeitadas."""
+        batch = []
+
+        for line_number, fields in chunk:
+            try:
+                if '_error' in fields:
+                    raise ValueError(fields['_error'])
+                if not (fields.get('date') or '').strip():
+                    raise ValueError("Data ausente")
+
+                batch.append(Transaction(
+                    transaction_type=fields['type'],
+                    amount=fields['amount'],
+                    date=fields['date'].strip(),
+                    category=(fields.get('category') or '').strip(),
+                    description=(fields.get('description') or '').strip()
+                ))
+            except (KeyError, TypeError, ValueError) as e:
+                result['rejected'] += 1
+                if len(result['errors']) < MAX_REPORTED_ERRORS:
+                    result['errors'].append((line_number, str(e)))
+
+        return batch
+
+    def import_csv(self, path: str, **options: Any) -> Dict[str, Any]:
+        """
+        Importa um arquivo CSV.
+
+        Args:
+            path: Caminho do arquivo CSV
+            options: Opções de read_csv (columns, delimiter, date_format, encoding)
+
+        Returns:
+            Resultado da importação (ver import_rows)
+        """
+        return self.import_rows(read_csv(path, **options))
+
+    def import_ofx(self, path: str, **options: Any) -> Dict[str, Any]:
+        """
+        Importa um extrato OFX.
+
+        Args:
+            path: Caminho do arquivo OFX
+            options: Opções de read_ofx (encoding)
+
+        Returns:
+            Resultado da importação (ver import_rows)
+        """
+        return self.import_rows(read_ofx(path, **options))
@@ -0,0 +1,258 @@
+import json
+import os
+from typing import Dict, Any, List
+
+from config.settings import JOURNAL_COMPACT_THRESHOLD
+from models.money import to_cents, from_cents
+from services.file_handler import FileHandler
+from services.profiler import instrumented
+
+
+class JournalFileHandler(FileHandler):
+    """
+    Armazenamento em snapshot + journal.
+
+    O snapshot (arquivo JSON principal) guarda o estado compactado da conta e
+    o journal (arquivo '.journal' ao lado) recebe uma linha JSON por transação
+    nova. Na carga, o snapshot é lido e o journal é reaplicado por cima.
+
+    Cada snapshot carrega um número de geração, repetido no cabeçalho do
+    journal. Se o processo cair entre a gravação do snapshot e o truncamento
+    do journal, as gerações não batem e o journal antigo é ignorado, evitando
+    que as transações sejam aplicadas duas vezes.
+
+    Acréscimos, compactações e leituras acontecem sob a trava entre
+    processos; o cabeçalho e o tamanho do journal identificam o estado
+    gravado (ver has_changed).
+    """
+
+    supports_append = True
+
+    def __init__(self, file_path: str, compact_threshold: int = JOURNAL_COMPACT_THRESHOLD):
+        """
+        Inicializa o manipulador com journal.
+
+        Args:
+            file_path: Caminho para o arquivo JSON do snapshot
+            compact_threshold: Quantidade de lançamentos no journal que dispara
+                a gravação de um novo snapshot
+        """
+        self.journal_path = file_path + '.journal'
+        self.compact_threshold = compact_threshold
+        self.generation = 0
+        self.pending_entries = 0
+
+        super().__init__(file_path)
+
+        with self.lock:
+            if not os.path.exists(self.journal_path):
+                self.generation = self._read_snapshot().get('journal_generation', 0)
+                self._reset_journal()
+
+    def _read_snapshot(self) -> Dict[str, Any]:
+        """Lê o snapshot do disco (retorna um dicionário vazio se não houver)."""
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+
+    def _reset_journal(self) -> None:
+        """Recria o journal vazio com o cabeçalho da geração atual."""
+        with open(self.journal_path, 'w', encoding='utf-8') as file:
+            file.write(json.dumps({'generation': self.generation}) + '\n')
+
+    def _discard_torn_tail(self) -> None:
+        """
+        Remove do journal uma última linha incompleta (queda durante a escrita).
+
+        Sem isso, os lançamentos acrescentados depois dela ficariam
+        inalcançáveis, pois a leitura para na primeira linha inválida.
+        Chamado sob a trava, antes de acrescentar.
+        """
+        with open(self.journal_path, 'rb+') as file:
+            end = file.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+
+            file.seek(end - 1)
+            if file.read(1) == b'\n':
+                return
+
+            # Procura, de trás para frente, o fim da última linha completa
+            position = end
+            while position > 0:
+                start = max(0, position - 4096)
+                file.seek(start)
+                newline = file.read(position - start).rfind(b'\n')
+                if newline != -1:
+                    file.truncate(start + newline + 1)
+                    return
+                position = start
+
+        # Nem o cabeçalho está completo: recria o journal da geração atual
+        self._reset_journal()
+
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        """
+        Lê os lançamentos do journal que pertencem à geração atual (chamado
+        sob a trava, depois de ler a geração do snapshot).
+
+        Um journal de outra geração (queda entre a gravação do snapshot e o
+        truncamento do journal) é recriado vazio: os acréscimos seguintes
+        iriam para ele e seriam ignorados na próxima carga.
+
+        Returns:
+            Lista de transações (em formato de dicionário) ainda não compactadas
+        """
+        entries = []
+
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as file:
+                header = file.readline()
+                try:
+                    generation = json.loads(header).get('generation')
+                except json.JSONDecodeError:
+                    generation = None
+
+                if generation == self.generation:
+                    for line in file:
+                        try:
+                            entries.append(json.loads(line))
+                        except json.JSONDecodeError:
+                            # Linha incompleta (queda durante a escrita): descarta o restante
+                            break
+                    return entries
+        except FileNotFoundError:
+            pass
+
+        self._reset_journal()
+        return entries
+
+    @instrumented
+    def load_data(self) -> Dict[str, Any]:
+        """
+        Carrega o snapshot e reaplica os lançamentos do journal.
+
+        Returns:
+            Dicionário com os dados carregados
+        """
+        with self.lock:
+            data = self._read_snapshot()
+            self.generation = data.pop('journal_generation', 0)
+
+            entries = self._read_journal()
+            self.pending_entries = len(entries)
+
+        if entries:
+            balance_cents = to_cents(data.get('balance', 0.0))
+            data.setdefault('transactions', [])
+
+            for entry in entries:
+                if entry['type'] == 'receita':
+                    balance_cents += to_cents(entry['amount'])
+                else:
+                    balance_cents -= to_cents(entry['amount'])
+                data['transactions'].append(entry)
+
+            data['balance'] = from_cents(balance_cents)
+
+        return data
+
+    def _write_data(self, data: Dict[str, Any]) -> None:
+        """
+        Grava um novo snapshot compactado e esvazia o journal (chamado sob a trava).
+
+        Args:
+            data: Dicionário com os dados a serem salvos
+        """
+        self.generation += 1
+        snapshot = dict(data, journal_generation=self.generation)
+
+        temp_path = self.file_path + '.tmp'
+        try:
+            self._write_snapshot(temp_path, snapshot)
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            self.generation -= 1
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self._reset_journal()
+        self.pending_entries = 0
+
+    def _state(self) -> Any:
+        """
+        Lê um identificador barato do conteúdo gravado.
+
+        Returns:
+            Tupla (cabeçalho, tamanho) do journal: a compactação troca o
+            cabeçalho e cada acréscimo aumenta o tamanho
+        """
+        try:
+            with open(self.journal_path, 'rb') as file:
+                return file.readline(), os.fstat(file.fileno()).st_size
+        except FileNotFoundError:
+            return b'', 0
+
+    def _write_snapshot(self, path: str, snapshot: Dict[str, Any]) -> None:
+        """
+        Escreve o snapshot em um arquivo.
+
+        Args:
+            path: Caminho do arquivo (temporário) de destino
+            snapshot: Dados da conta, incluindo 'journal_generation'
+        """
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(snapshot, file, ensure_ascii=False, separators=(',', ':'))
+
+    def load_balance_cents(self) -> int:
+        """
+        Carrega o saldo, em centavos, do snapshot com o journal reaplicado.
+
+        A geração que valida o journal fica no final do snapshot, então o
+        snapshot é lido por completo.
+
+        Returns:
+            Saldo armazenado em centavos (0 se não houver dados)
+        """
+        return to_cents(self.load_data().get('balance', 0.0))
+
+    def append_transactions(self, transactions: List[Dict[str, Any]]) -> None:
+        """
+        Acrescenta transações ao final do journal.
+
+        Args:
+            transactions: Lista de transações (em formato de dicionário)
+        """
+        lines = [json.dumps(t, ensure_ascii=False) + '\n' for t in transactions]
+
+        with self.lock:
+            changed = self.has_changed()
+            self._discard_torn_tail()
+
+            with open(self.journal_path, 'a', encoding='utf-8') as file:
+                previous_size = file.tell()
+                try:
+                    file.writelines(lines)
+                    file.flush()
+                except BaseException:
+                    # Desfaz a escrita parcial para manter o lote atômico
+                    file.truncate(previous_size)
+                    raise
+
+            self.pending_entries += len(transactions)
+
+            if self._synced_state is not None:
+                if changed:
+                    # Outro processo gravou antes: as transações dele ficam
+                    # entre as que estão em memória e as deste lote
+                    self.synced_count += len(transactions)
+                    self._diverged = True
+                else:
+                    self._mark_synced(self.synced_count + len(transactions))
+
+    def needs_compaction(self) -> bool:
+        """Indica se o journal atingiu o limite e deve ser compactado."""
+        return self.pending_entries >= self.compact_threshold
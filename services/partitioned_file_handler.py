@@ -0,0 +1,528 @@
+import copy
+import heapq
+import json
+import os
+from datetime import date
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from models.money import to_cents, from_cents
+from models.transaction import date_to_ordinal
+from services.file_handler import FileHandler, balance_delta_cents
+from services.file_lock import FileLock
+from services.profiler import instrumented
+
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+
+def _partition_key(ordinal: int) -> str:
+    """Obtém a chave da partição (YYYY-MM) de um ordinal de data."""
+    day = date.fromordinal(ordinal)
+    return f"{day.year:04d}-{day.month:02d}"
+
+
+def _partition_bounds(key: str) -> Tuple[int, int]:
+    """Obtém os ordinais do primeiro e do último dia de uma partição."""
+    year, month = int(key[:4]), int(key[5:7])
+    first = date(year, month, 1).toordinal()
+    following = date(year + month // 12, month % 12 + 1, 1).toordinal()
+    return first, following - 1
+
+
+class PartitionedFileHandler(FileHandler):
+    """
+    Armazenamento particionado por mês.
+
+    Cada mês (ano-mês) fica em um arquivo JSON lines próprio dentro de um
+    diretório, e um manifesto guarda o saldo e, para cada partição, a
+    quantidade de transações, o tamanho válido do arquivo e os totais por
+    tipo e categoria. Assim o saldo e os totais de meses inteiros vêm do
+    manifesto, e as consultas por período abrem apenas as partições que
+    cruzam o intervalo pedido. Partições lidas ficam em memória para as
+    consultas seguintes.
+
+    As transações novas são acrescentadas ao final das partições e o
+    manifesto é regravado por último, de forma atômica: se o processo cair
+    no meio, as linhas além do tamanho registrado são ignoradas na leitura
+    e descartadas na próxima gravação.
+
+    As gravações acontecem sob a trava entre processos e sempre partem do
+    manifesto atual do disco. Como o manifesto é substituído a cada
+    gravação, os metadados do arquivo identificam o estado gravado (ver
+    has_changed) e load_changes relê o manifesto, descartando só as
+    partições em memória que mudaram.
+    """
+
+    supports_append = True
+    supports_queries = True
+
+    def __init__(self, directory: str):
+        """
+        Inicializa o armazenamento, criando o diretório se necessário.
+
+        Args:
+            directory: Diretório das partições e do manifesto
+        """
+        self.file_path = directory
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+        # A trava fica ao lado do diretório, que guarda apenas dados
+        self.lock = FileLock(os.path.normpath(directory) + '.lock')
+        self._partitions: Dict[str, List[Dict[str, Any]]] = {}
+        self._synced_state: Any = None
+        self.synced_count = 0
+        self._diverged = False
+
+        if not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        with self.lock:
+            self.manifest = self._read_manifest()
+            self._mark_synced(0)
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        """Lê o manifesto do disco (retorna um manifesto vazio se não houver)."""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {'version': MANIFEST_VERSION, 'balance_cents': None,
+                    'next_id': 1, 'partitions': {}}
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Grava o manifesto de forma atômica (arquivo temporário + rename)."""
+        temp_path = self.manifest_path + '.tmp'
+
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(manifest, file, indent=4, ensure_ascii=False)
+            os.replace(temp_path, self.manifest_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _state(self) -> Any:
+        """
+        Lê um identificador barato do conteúdo gravado.
+
+        Returns:
+            Tupla (inode, data de modificação, tamanho) do manifesto, com
+            zeros se ele ainda não existir
+        """
+        try:
+            stat = os.stat(self.manifest_path)
+        except FileNotFoundError:
+            return 0, 0, 0
+
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _reload_manifest(self) -> None:
+        """Relê o manifesto do disco, descartando as partições em memória que mudaram."""
+        manifest = self._read_manifest()
+
+        if manifest['next_id'] < self.manifest['next_id']:
+            # O conteúdo foi substituído por completo
+            self._partitions = {}
+
+        for key, rows in list(self._partitions.items()):
+            entry = manifest['partitions'].get(key)
+            if entry is None or entry['count'] != len(rows):
+                del self._partitions[key]
+
+        self.manifest = manifest
+
+    def load_changes(self) -> None:
+        """
+        Atualiza o manifesto com as gravações de outros processos.
+
+        As transações ficam no armazenamento e não precisam ser relidas;
+        as consultas seguintes já enxergam os dados novos.
+
+        Returns:
+            None (quem mantém dados em memória, como o saldo, deve relê-los)
+        """
+        with self.lock:
+            self._reload_manifest()
+            self._mark_synced(0)
+
+    def _partition_path(self, key: str) -> str:
+        """Caminho do arquivo de uma partição."""
+        return os.path.join(self.file_path, key + '.jsonl')
+
+    def _load_partition(self, key: str) -> List[Dict[str, Any]]:
+        """
+        Lê as transações de uma partição (usando a cópia em memória, se houver).
+
+        Cada linha guarda a transação e o seu número de sequência ('id'),
+        usado para devolver as consultas na ordem de inserção.
+
+        Args:
+            key: Chave da partição (YYYY-MM)
+
+        Returns:
+            Lista de transações (em formato de dicionário) da partição
+        """
+        rows = self._partitions.get(key)
+
+        if rows is None:
+            size = self.manifest['partitions'][key]['size']
+
+            with open(self._partition_path(key), 'rb') as file:
+                content = file.read(size)
+
+            rows = self._partitions[key] = [json.loads(line) for line in content.splitlines()]
+
+        return rows
+
+    def _keys_in_range(self, start_ordinal: Optional[int],
+                       end_ordinal: Optional[int]) -> List[str]:
+        """Chaves das partições que cruzam o intervalo, em ordem cronológica."""
+        keys = []
+
+        for key in sorted(self.manifest['partitions']):
+            first, last = _partition_bounds(key)
+
+            if start_ordinal is not None and last < start_ordinal:
+                continue
+            if end_ordinal is not None and first > end_ordinal:
+                continue
+
+            keys.append(key)
+
+        return keys
+
+    def load_balance_cents(self) -> int:
+        """
+        Carrega apenas o saldo, em centavos, a partir do manifesto.
+
+        Returns:
+            Saldo armazenado em centavos (0 se não houver dados)
+        """
+        return self.manifest['balance_cents'] or 0
+
+    def load_balance(self) -> float:
+        """
+        Carrega apenas o saldo, sem ler as partições.
+
+        Returns:
+            Saldo armazenado (0.0 se não houver dados)
+        """
+        return from_cents(self.load_balance_cents())
+
+    @instrumented
+    def load_data(self) -> Dict[str, Any]:
+        """
+        Carrega todas as partições no mesmo formato do FileHandler.
+
+        Returns:
+            Dicionário com os dados carregados (vazio se não houver dados)
+        """
+        if self.manifest['balance_cents'] is None:
+            return {}
+
+        return {
+            'balance': self.load_balance(),
+            'transactions': self.query_transactions()
+        }
+
+    @instrumented
+    def save_data(self, data: Dict[str, Any]) -> None:
+        """
+        Substitui todo o conteúdo pelos dados informados.
+
+        Args:
+            data: Dicionário com os dados a serem salvos
+        """
+        with self.lock:
+            for key in self._read_manifest()['partitions']:
+                os.remove(self._partition_path(key))
+
+            self._partitions = {}
+            self.manifest = {'version': MANIFEST_VERSION, 'balance_cents': None,
+                             'next_id': 1, 'partitions': {}}
+
+            if not data:
+                self._write_manifest(self.manifest)
+            else:
+                self._append_rows(data.get('transactions', []), to_cents(data.get('balance', 0.0)))
+
+            self._mark_synced(0)
+
+    def append_transactions(self, transactions: List[Dict[str, Any]]) -> None:
+        """
+        Acrescenta transações às partições dos seus meses e atualiza o saldo.
+
+        Args:
+            transactions: Lista de transações (em formato de dicionário)
+        """
+        with self.lock:
+            changed = self.has_changed()
+            if changed:
+                # Parte do manifesto gravado por outro processo
+                self._reload_manifest()
+
+            balance_cents = self.load_balance_cents() + balance_delta_cents(transactions)
+            self._append_rows(transactions, balance_cents)
+
+            if not changed:
+                self._mark_synced(0)
+
+    def _append_rows(self, transactions: List[Dict[str, Any]], balance_cents: int) -> None:
+        """
+        Grava transações nas partições e, por último, o manifesto.
+
+        O manifesto em memória só é substituído depois que tudo foi gravado,
+        de forma que uma falha deixa o armazenamento no estado anterior.
+
+        Args:
+            transactions: Lista de transações (em formato de dicionário)
+            balance_cents: Novo saldo, em centavos
+        """
+        manifest = copy.deepcopy(self.manifest)
+        manifest['balance_cents'] = balance_cents
+        by_partition: Dict[str, List[Dict[str, Any]]] = {}
+        next_id = manifest['next_id']
+
+        for transaction in transactions:
+            row = dict(transaction, id=next_id)
+            next_id += 1
+            by_partition.setdefault(_partition_key(date_to_ordinal(row['date'])), []).append(row)
+
+        for key, rows in by_partition.items():
+            entry = manifest['partitions'].setdefault(key, {
+                'count': 0, 'size': 0, 'totals': {'receita': {}, 'despesa': {}}
+            })
+            lines = b''.join(
+                json.dumps(row, ensure_ascii=False).encode('utf-8') + b'\n' for row in rows
+            )
+
+            # Descarta linhas de uma gravação interrompida antes de acrescentar
+            with open(self._partition_path(key), 'ab') as file:
+                file.truncate(entry['size'])
+                file.write(lines)
+
+            entry['count'] += len(rows)
+            entry['size'] += len(lines)
+
+            totals = entry['totals']
+            for row in rows:
+                category_totals = totals[row['type']]
+                category_totals[row['category']] = (
+                    category_totals.get(row['category'], 0) + to_cents(row['amount'])
+                )
+
+        manifest['next_id'] = next_id
+        self._write_manifest(manifest)
+        self.manifest = manifest
+
+        for key, rows in by_partition.items():
+            if key in self._partitions:
+                self._partitions[key].extend(rows)
+
+    def needs_compaction(self) -> bool:
+        """As partições são atualizadas no lugar e nunca precisam de compactação."""
+        return False
+
+    def _iter_partition(self, key: str) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre as transações de uma partição sem guardá-la em memória.
+
+        Usa a cópia em memória se a partição já tiver sido carregada.
+
+        Args:
+            key: Chave da partição (YYYY-MM)
+
+        Yields:
+            Transações (em formato de dicionário) da partição
+        """
+        rows = self._partitions.get(key)
+
+        if rows is not None:
+            yield from rows
+            return
+
+        remaining = self.manifest['partitions'][key]['size']
+
+        with open(self._partition_path(key), 'rb') as file:
+            for line in file:
+                remaining -= len(line)
+                if remaining < 0:
+                    break
+
+                yield json.loads(line)
+
+                if remaining == 0:
+                    break
+
+    def _scan(self, start_ordinal: Optional[int], end_ordinal: Optional[int],
+              cache: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre as linhas das partições do intervalo, na ordem de inserção.
+
+        Args:
+            start_ordinal: Ordinal da data inicial (inclusivo)
+            end_ordinal: Ordinal da data final (inclusivo)
+            cache: Se False, as partições ainda não carregadas são lidas do
+                disco sob demanda, sem ficar em memória
+
+        Returns:
+            Iterador sobre as transações (em formato de dicionário)
+        """
+        partitions = []
+
+        for key in self._keys_in_range(start_ordinal, end_ordinal):
+            rows = self._load_partition(key) if cache else self._iter_partition(key)
+            first, last = _partition_bounds(key)
+
+            # Partições inteiramente dentro do intervalo dispensam o filtro por data
+            if ((start_ordinal is None or start_ordinal <= first)
+                    and (end_ordinal is None or last <= end_ordinal)):
+                partitions.append(rows)
+            else:
+                partitions.append(
+                    row for row in rows
+                    if (start_ordinal is None or date_to_ordinal(row['date']) >= start_ordinal)
+                    and (end_ordinal is None or date_to_ordinal(row['date']) <= end_ordinal)
+                )
+
+        return heapq.merge(*partitions, key=lambda row: row['id'])
+
+    def query_transactions(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                           transaction_type: Optional[str] = None,
+                           category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Consulta transações lendo apenas as partições do período.
+
+        As partições lidas ficam em memória para as consultas seguintes.
+
+        Args:
+            start_date: Data inicial inclusiva (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+            transaction_type: Tipo de transação ('receita' ou 'despesa')
+            category: Categoria das transações
+
+        Returns:
+            Lista de transações (em formato de dicionário), na ordem de inserção
+        """
+        return list(self.iter_transactions(start_date, end_date, transaction_type, category,
+                                           cache=True))
+
+    def iter_transactions(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                          transaction_type: Optional[str] = None, category: Optional[str] = None,
+                          offset: int = 0, limit: Optional[int] = None,
+                          cache: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre as transações filtradas, lendo as partições sob demanda.
+
+        Args:
+            start_date: Data inicial inclusiva (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+            transaction_type: Tipo de transação ('receita' ou 'despesa')
+            category: Categoria das transações
+            offset: Quantidade de transações a pular
+            limit: Quantidade máxima de transações (None para todas)
+            cache: Se True, as partições lidas ficam em memória
+
+        Yields:
+            Transações (em formato de dicionário), na ordem de inserção
+        """
+        start_ordinal = date_to_ordinal(start_date) if start_date is not None else None
+        end_ordinal = date_to_ordinal(end_date) if end_date is not None else None
+
+        rows = (
+            row for row in self._scan(start_ordinal, end_ordinal, cache)
+            if (transaction_type is None or row['type'] == transaction_type)
+            and (category is None or row['category'] == category)
+        )
+        stop = None if limit is None else offset + limit
+
+        for row in islice(rows, offset, stop):
+            yield {'type': row['type'], 'amount': row['amount'], 'date': row['date'],
+                   'category': row['category'], 'description': row['description']}
+
+    def count_transactions(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                           transaction_type: Optional[str] = None,
+                           category: Optional[str] = None) -> int:
+        """
+        Conta as transações filtradas.
+
+        Sem filtros de tipo e categoria, os meses inteiramente dentro do
+        período são contados pelo manifesto; só as partições cortadas pelo
+        intervalo são lidas.
+
+        Args:
+            start_date: Data inicial inclusiva (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+            transaction_type: Tipo de transação ('receita' ou 'despesa')
+            category: Categoria das transações
+
+        Returns:
+            Quantidade de transações
+        """
+        if transaction_type is not None or category is not None:
+            return sum(1 for _ in self.iter_transactions(start_date, end_date, transaction_type,
+                                                         category, cache=True))
+
+        start_ordinal = date_to_ordinal(start_date) if start_date is not None else None
+        end_ordinal = date_to_ordinal(end_date) if end_date is not None else None
+        count = 0
+
+        for key in self._keys_in_range(start_ordinal, end_ordinal):
+            first, last = _partition_bounds(key)
+
+            if ((start_ordinal is None or start_ordinal <= first)
+                    and (end_ordinal is None or last <= end_ordinal)):
+                count += self.manifest['partitions'][key]['count']
+            else:
+                count += sum(
+                    1 for row in self._load_partition(key)
+                    if (start_ordinal is None or date_to_ordinal(row['date']) >= start_ordinal)
+                    and (end_ordinal is None or date_to_ordinal(row['date']) <= end_ordinal)
+                )
+
+        return count
+
+    def sum_by_category(self, transaction_type: str, start_date: Optional[str] = None,
+                        end_date: Optional[str] = None) -> Dict[str, int]:
+        """
+        Soma os valores (em centavos) por categoria.
+
+        Meses inteiramente dentro do período usam os totais do manifesto;
+        apenas as partições cortadas pelo intervalo são lidas.
+
+        Args:
+            transaction_type: Tipo de transação ('receita' ou 'despesa')
+            start_date: Data inicial inclusiva (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+
+        Returns:
+            Dicionário com categorias e seus totais em centavos, em ordem
+            cronológica de aparição das categorias
+        """
+        start_ordinal = date_to_ordinal(start_date) if start_date is not None else None
+        end_ordinal = date_to_ordinal(end_date) if end_date is not None else None
+        totals: Dict[str, int] = {}
+
+        for key in self._keys_in_range(start_ordinal, end_ordinal):
+            first, last = _partition_bounds(key)
+
+            if ((start_ordinal is None or start_ordinal <= first)
+                    and (end_ordinal is None or last <= end_ordinal)):
+                partition_totals = self.manifest['partitions'][key]['totals'][transaction_type]
+                for category, amount_cents in partition_totals.items():
+                    totals[category] = totals.get(category, 0) + amount_cents
+                continue
+
+            for row in self._load_partition(key):
+                ordinal = date_to_ordinal(row['date'])
+                if row['type'] != transaction_type:
+                    continue
+                if start_ordinal is not None and ordinal < start_ordinal:
+                    continue
+                if end_ordinal is not None and ordinal > end_ordinal:
+                    continue
+                totals[row['category']] = totals.get(row['category'], 0) + to_cents(row['amount'])
+
+        return totals
@@ -0,0 +1,176 @@
+import atexit
+import functools
+import json
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Profiler:
+    """
+    Instrumentação opcional de desempenho.
+
+    Quando habilitado, registra para cada operação instrumentada a quantidade
+    de chamadas, o tempo acumulado e o pico de memória alocada durante a
+    chamada (via tracemalloc). Desabilitado, o custo é apenas a verificação
+    de um atributo por chamada.
+    """
+
+    def __init__(self):
+        """Inicializa o profiler desabilitado e sem estatísticas."""
+        self.enabled = False
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def enable(self, output_path: Optional[str] = None) -> None:
+        """
+        Habilita a coleta de estatísticas.
+
+        Args:
+            output_path: Arquivo JSON onde as estatísticas serão gravadas ao
+                encerrar o processo (opcional)
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        self.enabled = True
+
+        if output_path:
+            atexit.register(self.dump, output_path)
+
+    def disable(self) -> None:
+        """Desabilita a coleta de estatísticas."""
+        self.enabled = False
+
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def reset(self) -> None:
+        """Descarta as estatísticas coletadas."""
+        with self._lock:
+            self.stats = {}
+
+    def _stack(self) -> List[List[int]]:
+        """Pilha de chamadas instrumentadas em andamento na thread atual."""
+        stack = getattr(self._local, 'stack', None)
+
+        if stack is None:
+            stack = self._local.stack = []
+
+        return stack
+
+    def measure(self, name: str, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Executa uma função registrando tempo e pico de memória.
+
+        Chamadas aninhadas são suportadas: o pico observado por uma chamada
+        interna também é repassado para a chamada que a envolve.
+
+        Args:
+            name: Nome da operação nas estatísticas
+            function: Função a ser executada
+
+        Returns:
+            Resultado da função
+        """
+        stack = self._stack()
+        tracing = tracemalloc.is_tracing()
+
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            tracemalloc.reset_peak()
+        else:
+            current = 0
+
+        # [memória no início, maior pico já observado]
+        stack.append([current, current])
+        start = time.perf_counter()
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            frame = stack.pop()
+            peak = max(tracemalloc.get_traced_memory()[1], frame[1]) if tracing else frame[1]
+
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+
+            self._record(name, elapsed, peak - frame[0])
+
+    def _record(self, name: str, elapsed: float, peak_bytes: int) -> None:
+        """Acumula as estatísticas de uma chamada."""
+        with self._lock:
+            entry = self.stats.setdefault(name, {
+                'calls': 0, 'total_seconds': 0.0, 'max_seconds': 0.0, 'peak_memory_bytes': 0
+            })
+            entry['calls'] += 1
+            entry['total_seconds'] += elapsed
+            entry['max_seconds'] = max(entry['max_seconds'], elapsed)
+            entry['peak_memory_bytes'] = max(entry['peak_memory_bytes'], peak_bytes)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Retorna uma cópia das estatísticas coletadas."""
+        with self._lock:
+            return {name: dict(entry) for name, entry in self.stats.items()}
+
+    def format_report(self) -> str:
+        """
+        Formata as estatísticas como uma tabela de texto.
+
+        Returns:
+            Tabela com as operações ordenadas pelo tempo acumulado
+        """
+        stats = self.snapshot()
+
+        if not stats:
+            return "Nenhuma estatística coletada."
+
+        lines = [f"{'OPERAÇÃO':<48} {'CHAMADAS':>8} {'TOTAL (ms)':>12} "
+                 f"{'MÁX (ms)':>10} {'PICO (KiB)':>11}",
+                 "-" * 93]
+
+        for name, entry in sorted(stats.items(), key=lambda item: -item[1]['total_seconds']):
+            lines.append(f"{name[:48]:<48} {entry['calls']:>8} "
+                         f"{entry['total_seconds'] * 1000:>12.2f} "
+                         f"{entry['max_seconds'] * 1000:>10.2f} "
+                         f"{entry['peak_memory_bytes'] / 1024:>11.1f}")
+
+        return "\n".join(lines)
+
+    def dump(self, path: str) -> None:
+        """
+        Grava as estatísticas em um arquivo JSON.
+
+        Args:
+            path: Caminho do arquivo de saída
+        """
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.snapshot(), file, indent=4, ensure_ascii=False)
+
+
+# Instância única usada por toda a aplicação
+profiler = Profiler()
+
+
+def instrumented(function: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorador que registra a função no profiler quando ele está habilitado.
+
+    O nome usado nas estatísticas é o __qualname__ da função
+    (ex: 'TransactionService.get_transactions_by_period').
+    """
+    name = function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not profiler.enabled:
+            return function(*args, **kwargs)
+
+        return profiler.measure(name, function, *args, **kwargs)
+
+    return wrapper
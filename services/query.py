@@ -0,0 +1,257 @@
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from models.money import to_cents
+from models.transaction import Transaction, date_to_ordinal
+from services.date_index import DateIndex
+from services.text_index import TextIndex, tokenize
+from services.value_index import ValueIndex
+
+
+# Filtros resolvidos pelos backends consultáveis (os demais são verificados em Python)
+BACKEND_FILTERS = ('date', 'type', 'category')
+
+Predicate = Callable[[Transaction], bool]
+
+
+class TransactionQuery:
+    """
+    Consulta de transações com qualquer combinação de filtros.
+
+    Os filtros informados são combinados com E: período, tipo, categoria,
+    faixa de valores e texto. Cada palavra do texto precisa aparecer dentro
+    de uma palavra da descrição ou da categoria (ou no início dela, com
+    prefix=True), sem diferenciar maiúsculas, minúsculas e acentos.
+    Filtros não informados (None) são ignorados.
+    """
+
+    def __init__(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                 transaction_type: Optional[str] = None, category: Optional[str] = None,
+                 min_amount: Optional[float] = None, max_amount: Optional[float] = None,
+                 text: Optional[str] = None, prefix: bool = False):
+        """
+        Cria a consulta, validando os filtros.
+
+        Args:
+            start_date: Data inicial inclusiva (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+            transaction_type: Tipo de transação ('receita' ou 'despesa')
+            category: Categoria exata das transações
+            min_amount: Valor mínimo inclusivo (em reais)
+            max_amount: Valor máximo inclusivo (em reais)
+            text: Trecho procurado na descrição ou na categoria
+            prefix: Se True, as palavras do texto precisam ser o início de
+                uma palavra da transação
+        """
+        if transaction_type not in (None, 'receita', 'despesa'):
+            raise ValueError("Tipo de transação deve ser 'receita' ou 'despesa'")
+
+        self.start_ordinal = date_to_ordinal(start_date) if start_date is not None else None
+        self.end_ordinal = date_to_ordinal(end_date) if end_date is not None else None
+        self.transaction_type = transaction_type
+        self.category = category
+        self.min_cents = to_cents(min_amount) if min_amount is not None else None
+        self.max_cents = to_cents(max_amount) if max_amount is not None else None
+
+        if (self.min_cents is not None and self.max_cents is not None
+                and self.min_cents > self.max_cents):
+            raise ValueError("Valor mínimo maior que o valor máximo")
+
+        self.text_terms = sorted(set(tokenize(text))) if text is not None else []
+        self.text = text.strip() if self.text_terms else None
+        self.prefix = prefix
+
+    @property
+    def has_date_range(self) -> bool:
+        """Indica se a consulta restringe o período."""
+        return self.start_ordinal is not None or self.end_ordinal is not None
+
+    def date_range(self) -> Tuple[int, int]:
+        """
+        Obtém o período da consulta em ordinais, com os limites abertos preenchidos.
+
+        Returns:
+            Tupla (ordinal inicial, ordinal final), inclusivos
+        """
+        start = self.start_ordinal if self.start_ordinal is not None else 1
+        end = self.end_ordinal if self.end_ordinal is not None else date.max.toordinal()
+        return start, end
+
+    def backend_filters(self) -> Dict[str, Any]:
+        """
+        Obtém os filtros aceitos por iter_transactions dos backends consultáveis.
+
+        Returns:
+            Dicionário com start_date, end_date (YYYY-MM-DD), transaction_type e category
+        """
+        return {
+            'start_date': (date.fromordinal(self.start_ordinal).isoformat()
+                           if self.start_ordinal is not None else None),
+            'end_date': (date.fromordinal(self.end_ordinal).isoformat()
+                         if self.end_ordinal is not None else None),
+            'transaction_type': self.transaction_type,
+            'category': self.category,
+        }
+
+    def predicate(self, skip: Sequence[str] = ()) -> Optional[Predicate]:
+        """
+        Monta a verificação dos filtros da consulta.
+
+        Args:
+            skip: Filtros já resolvidos por um índice ('date', 'type',
+                'category', 'amount' ou 'text')
+
+        Returns:
+            Função que diz se uma transação atende aos filtros restantes,
+            ou None se não sobrar nenhum filtro
+        """
+        checks: List[Predicate] = []
+
+        if 'type' not in skip and self.transaction_type is not None:
+            transaction_type = self.transaction_type
+            checks.append(lambda t: t.transaction_type == transaction_type)
+
+        if 'category' not in skip and self.category is not None:
+            category = self.category
+            checks.append(lambda t: t.category == category)
+
+        if 'amount' not in skip and self.min_cents is not None:
+            min_cents = self.min_cents
+            checks.append(lambda t: t.amount_cents >= min_cents)
+
+        if 'amount' not in skip and self.max_cents is not None:
+            max_cents = self.max_cents
+            checks.append(lambda t: t.amount_cents <= max_cents)
+
+        if 'date' not in skip and self.has_date_range:
+            start, end = self.date_range()
+            checks.append(lambda t: start <= date_to_ordinal(t.date) <= end)
+
+        if 'text' not in skip and self.text is not None:
+            checks.append(self._text_predicate())
+
+        if not checks:
+            return None
+        if len(checks) == 1:
+            return checks[0]
+        return lambda t: all(check(t) for check in checks)
+
+    def _text_predicate(self) -> Predicate:
+        """Monta a verificação do texto, com as mesmas regras do TextIndex."""
+        terms = self.text_terms
+
+        if self.prefix:
+            def matches(transaction: Transaction) -> bool:
+                words = tokenize(transaction.description) + tokenize(transaction.category)
+                return all(any(word.startswith(term) for word in words) for term in terms)
+        else:
+            def matches(transaction: Transaction) -> bool:
+                # Os termos não têm espaços: só casam dentro de uma palavra
+                words = " ".join(tokenize(transaction.description) + tokenize(transaction.category))
+                return all(term in words for term in terms)
+
+        return matches
+
+
+class QueryPlan:
+    """
+    Plano de execução de uma consulta sobre as transações em memória.
+
+    Indica o índice escolhido ('date', 'category', 'type', 'text', 'scan' para a
+    leitura completa ou 'backend' quando a consulta vai para o banco), as
+    posições candidatas obtidas dele e a verificação dos filtros restantes.
+    """
+
+    def __init__(self, index: str, estimated_rows: Optional[int],
+                 candidates: Optional[Sequence[int]], predicate: Optional[Predicate]):
+        """
+        Inicializa o plano.
+
+        Args:
+            index: Índice usado
+            estimated_rows: Quantidade de candidatas (None se desconhecida)
+            candidates: Posições candidatas em ordem de inserção (None para todas)
+            predicate: Verificação dos filtros restantes (None se não houver)
+        """
+        self.index = index
+        self.estimated_rows = estimated_rows
+        self.candidates = candidates
+        self.predicate = predicate
+
+    def __repr__(self) -> str:
+        return (f"QueryPlan(index={self.index!r}, estimated_rows={self.estimated_rows}, "
+                f"residual={self.predicate is not None})")
+
+    def positions(self, transactions: Sequence[Transaction]) -> Iterator[int]:
+        """
+        Percorre as posições que atendem à consulta, em uma única passada.
+
+        Args:
+            transactions: Transações da conta
+
+        Yields:
+            Posições das transações encontradas, na ordem de inserção
+        """
+        candidates = range(len(transactions)) if self.candidates is None else self.candidates
+        predicate = self.predicate
+
+        if predicate is None:
+            yield from candidates
+            return
+
+        for position in candidates:
+            if predicate(transactions[position]):
+                yield position
+
+
+def plan_query(query: TransactionQuery, total: int, date_index: DateIndex,
+               type_index: ValueIndex, category_index: ValueIndex,
+               text_index: Optional[TextIndex] = None) -> QueryPlan:
+    """
+    Escolhe o índice mais seletivo para uma consulta.
+
+    Cada índice aplicável estima o número de candidatas sem copiar
+    posições (buscas binárias no índice por data, tamanho da lista nos
+    índices por tipo e categoria, ocorrências das palavras no índice de
+    texto). O de menor estimativa fornece as
+    candidatas, e os demais filtros viram a verificação restante.
+
+    Args:
+        query: Consulta a ser planejada
+        total: Quantidade de transações da conta
+        date_index: Índice por data
+        type_index: Índice por tipo
+        category_index: Índice por categoria
+        text_index: Índice invertido de texto (None para verificar o texto
+            transação a transação)
+
+    Returns:
+        Plano de execução
+    """
+    options: List[Tuple[int, str, Callable[[], Sequence[int]]]] = []
+
+    if query.has_date_range:
+        start, end = query.date_range()
+        options.append((date_index.count(start, end), 'date',
+                        lambda: date_index.range(start, end)))
+
+    if query.category is not None:
+        category = query.category
+        options.append((category_index.count(category), 'category',
+                        lambda: category_index.lookup(category)))
+
+    if query.transaction_type is not None:
+        transaction_type = query.transaction_type
+        options.append((type_index.count(transaction_type), 'type',
+                        lambda: type_index.lookup(transaction_type)))
+
+    if query.text is not None and text_index is not None:
+        text, prefix = query.text, query.prefix
+        options.append((text_index.estimate(text, prefix), 'text',
+                        lambda: text_index.search(text, prefix)))
+
+    if not options:
+        return QueryPlan('scan', total, None, query.predicate())
+
+    estimated_rows, index, candidates = min(options, key=lambda option: option[0])
+    return QueryPlan(index, estimated_rows, candidates(), query.predicate(skip=(index,)))
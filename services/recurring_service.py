@@ -0,0 +1,307 @@
+import heapq
+import json
+import os
+from itertools import repeat
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from models.money import from_cents, to_cents
+from models.recurring import RecurringRule
+from models.transaction import Transaction
+from services.file_lock import FileLock
+from services.transaction_service import TransactionService
+
+
+class RecurringService:
+    """
+    Regras de transações recorrentes (aluguel, salário, assinaturas).
+
+    As regras ficam em um arquivo JSON ao lado dos dados da conta. As
+    ocorrências vencidas (até hoje) são lançadas como transações comuns por
+    post_due, uma única vez cada: cada regra guarda a data da última
+    ocorrência lançada. As ocorrências seguintes nunca são gravadas; elas
+    são geradas sob demanda (iter_projected) para os relatórios e para as
+    projeções de saldo, com custo proporcional às ocorrências do período.
+    """
+
+    def __init__(self, transaction_service: TransactionService, file_path: str):
+        """
+        Inicializa o serviço e carrega as regras.
+
+        Args:
+            transaction_service: Serviço de transações onde as ocorrências são lançadas
+            file_path: Caminho do arquivo JSON das regras
+        """
+        self.transaction_service = transaction_service
+        self.file_path = file_path
+        self.lock = FileLock(file_path + '.lock')
+        self.rules: List[RecurringRule] = []
+        self._next_id = 1
+        # Estado do arquivo na última leitura ou gravação (ver refresh)
+        self._state: Any = None
+        # Funções chamadas quando as regras mudam (ver add_listener)
+        self._listeners: List[Callable[[], None]] = []
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._load()
+
+    def _file_state(self) -> Any:
+        """Identificador barato do conteúdo gravado (None se o arquivo não existir)."""
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _load(self) -> None:
+        """Lê as regras do arquivo."""
+        with self.lock:
+            self._state = self._file_state()
+            try:
+                with open(self.file_path, 'r', encoding='utf-8') as file:
+                    data = json.load(file)
+            except FileNotFoundError:
+                data = {'next_id': 1, 'rules': []}
+
+        self.rules = [RecurringRule.from_dict(rule) for rule in data['rules']]
+        self._next_id = data['next_id']
+
+    def _save(self) -> None:
+        """Grava as regras no arquivo (chamado sob a trava), substituindo-o de uma vez."""
+        data = {'next_id': self._next_id, 'rules': [rule.to_dict() for rule in self.rules]}
+        temp_path = self.file_path + '.tmp'
+
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(data, file, indent=4, ensure_ascii=False)
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self._state = self._file_state()
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Registra uma função chamada sempre que as regras mudam (ex: para
+        esvaziar o cache de relatórios, que inclui as ocorrências previstas).
+
+        Args:
+            listener: Função sem argumentos
+        """
+        self._listeners.append(listener)
+
+    def _notify_listeners(self) -> None:
+        for listener in self._listeners:
+            listener()
+
+    def refresh(self) -> bool:
+        """
+        Relê as regras se outro processo alterou o arquivo.
+
+        Returns:
+            True se as regras mudaram
+        """
+        if self._file_state() == self._state:
+            return False
+
+        self._load()
+        self._notify_listeners()
+        return True
+
+    def get_rules(self) -> List[RecurringRule]:
+        """
+        Obtém as regras cadastradas.
+
+        Returns:
+            Lista de regras, na ordem de cadastro
+        """
+        self.refresh()
+        return list(self.rules)
+
+    def add_rule(self, rule: RecurringRule) -> RecurringRule:
+        """
+        Cadastra uma regra.
+
+        Args:
+            rule: Regra a ser cadastrada (o identificador é atribuído aqui)
+
+        Returns:
+            A regra cadastrada
+        """
+        with self.lock:
+            self._load()
+            rule.rule_id = self._next_id
+            self._next_id += 1
+            self.rules.append(rule)
+            self._save()
+
+        self._notify_listeners()
+        return rule
+
+    def remove_rule(self, rule_id: int) -> RecurringRule:
+        """
+        Remove uma regra (as ocorrências já lançadas continuam na conta).
+
+        Args:
+            rule_id: Identificador da regra
+
+        Returns:
+            A regra removida
+
+        Raises:
+            ValueError: Se não houver regra com o identificador
+        """
+        with self.lock:
+            self._load()
+            for position, rule in enumerate(self.rules):
+                if rule.rule_id == rule_id:
+                    del self.rules[position]
+                    self._save()
+                    break
+            else:
+                raise ValueError(f"Regra recorrente não encontrada: {rule_id}")
+
+        self._notify_listeners()
+        return rule
+
+    def post_due(self, today: Optional[str] = None) -> List[Transaction]:
+        """
+        Lança como transações as ocorrências vencidas ainda não lançadas.
+
+        As regras são gravadas com as novas datas de lançamento antes de as
+        transações serem adicionadas (em um único lote) e voltam às datas
+        anteriores se a adição falhar: uma falha ao gravar as regras nunca
+        deixa ocorrências lançadas para serem lançadas de novo. A trava das
+        regras impede que dois processos lancem as mesmas ocorrências.
+
+        Args:
+            today: Data limite inclusiva (formato: YYYY-MM-DD, padrão: hoje)
+
+        Returns:
+            Transações lançadas, em ordem cronológica
+        """
+        if today is None:
+            today = datetime.now().strftime("%Y-%m-%d")
+
+        with self.lock:
+            self._load()
+            transactions = []
+            posted: List[Tuple[RecurringRule, str]] = []
+
+            for rule in self.rules:
+                dates = list(rule.pending(end_date=today))
+                if dates:
+                    transactions.extend(rule.to_transaction(date) for date in dates)
+                    posted.append((rule, dates[-1]))
+
+            if not transactions:
+                return []
+
+            transactions.sort(key=attrgetter('date'))
+            previous = [(rule, rule.posted_until) for rule, _ in posted]
+
+            def restore() -> None:
+                for rule, posted_until in previous:
+                    rule.posted_until = posted_until
+
+            for rule, last_date in posted:
+                rule.posted_until = last_date
+
+            try:
+                self._save()
+            except BaseException:
+                restore()
+                raise
+
+            try:
+                self.transaction_service.add_transactions(transactions)
+            except BaseException:
+                restore()
+                self._save()
+                raise
+
+        return transactions
+
+    def _pending_deltas(self, start_date: Optional[str],
+                        end_date: str) -> Iterator[Tuple[str, int]]:
+        """Ocorrências não lançadas de todas as regras, como (data, variação em centavos), por data."""
+        return heapq.merge(*(
+            zip(rule.pending(start_date, end_date), repeat(rule.signed_cents))
+            for rule in self.rules
+        ))
+
+    def iter_projected(self, start_date: str, end_date: str) -> Iterator[Transaction]:
+        """
+        Gera as ocorrências previstas (ainda não lançadas) de um período.
+
+        As ocorrências de cada regra são geradas sob demanda e intercaladas
+        por data, sem montar listas.
+
+        Args:
+            start_date: Data inicial inclusiva (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+
+        Returns:
+            Iterador das transações previstas, em ordem cronológica
+        """
+        self.refresh()
+        return heapq.merge(*(
+            map(rule.to_transaction, rule.pending(start_date, end_date))
+            for rule in self.rules
+        ), key=attrgetter('date'))
+
+    def get_projected_balance(self, date: str) -> float:
+        """
+        Obtém o saldo previsto ao final de um dia.
+
+        É o saldo na data (ver TransactionService.get_balance_at) mais as
+        ocorrências ainda não lançadas até ela.
+
+        Args:
+            date: Data (formato: YYYY-MM-DD)
+
+        Returns:
+            Saldo previsto
+        """
+        self.refresh()
+        balance_cents = self.transaction_service.get_balance_cents_at(date)
+        balance_cents += sum(delta for _, delta in self._pending_deltas(None, date))
+        return from_cents(balance_cents)
+
+    def get_projected_series(self, start_date: str, end_date: str,
+                             step_days: int = 1) -> List[Tuple[str, float]]:
+        """
+        Obtém a evolução prevista do saldo em um período.
+
+        Args:
+            start_date: Data inicial (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+            step_days: Intervalo, em dias, entre os pontos da série
+
+        Returns:
+            Lista de pares (data, saldo previsto ao final do dia)
+
+        Raises:
+            ValueError: Se o período ou o intervalo forem inválidos
+        """
+        self.refresh()
+        series = self.transaction_service.get_balance_series(start_date, end_date, step_days)
+        pending = self._pending_deltas(None, end_date)
+        next_date, next_delta = next(pending, (None, 0))
+        projected_cents = 0
+        result = []
+
+        for date, balance in series:
+            # Acumula as ocorrências até o ponto atual (as datas ISO são comparáveis)
+            while next_date is not None and next_date <= date:
+                projected_cents += next_delta
+                next_date, next_delta = next(pending, (None, 0))
+            result.append((date, from_cents(to_cents(balance) + projected_cents)))
+
+        return result
@@ -0,0 +1,111 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+# Chave de um relatório: (tipo de relatório, *parâmetros)
+ReportKey = Tuple[Hashable, ...]
+
+
+class ReportCache:
+    """
+    Cache LRU limitado de relatórios já calculados.
+
+    As chaves são tuplas com o tipo do relatório e seus parâmetros (ex:
+    ('monthly', 2025, 5)). Quando o limite é atingido, o relatório usado há
+    mais tempo é descartado. Acertos, falhas e remoções são contados para
+    ajustar o tamanho do cache.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        """
+        Inicializa o cache.
+
+        Args:
+            maxsize: Quantidade máxima de relatórios guardados (0 desativa o cache)
+        """
+        self.maxsize = max(0, maxsize)
+        self._entries: 'OrderedDict[ReportKey, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: ReportKey) -> bool:
+        return key in self._entries
+
+    def get_or_compute(self, key: ReportKey, compute: Callable[[], Any]) -> Any:
+        """
+        Obtém um relatório do cache ou o calcula e guarda.
+
+        Args:
+            key: Chave do relatório
+            compute: Função que calcula o relatório em caso de falha
+
+        Returns:
+            Relatório (o mesmo objeto a cada acerto: não deve ser modificado)
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+        value = compute()
+
+        if self.maxsize:
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return value
+
+    def invalidate(self, predicate: Callable[[ReportKey], bool]) -> int:
+        """
+        Remove os relatórios cujas chaves atendem a um critério.
+
+        Args:
+            predicate: Função que recebe a chave e diz se o relatório ficou
+                desatualizado
+
+        Returns:
+            Quantidade de relatórios removidos
+        """
+        stale = [key for key in self._entries if predicate(key)]
+
+        for key in stale:
+            del self._entries[key]
+
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove todos os relatórios (os contadores são mantidos)."""
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtém os contadores do cache.
+
+        Returns:
+            Dicionário com hits, misses, hit_rate, evictions,
+            invalidations, size e maxsize
+        """
+        lookups = self.hits + self.misses
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
@@ -1,20 +1,103 @@
-from typing import List, Dict, Any
-from datetime import datetime
+import calendar
+from typing import Dict, Any, List, Optional, Set, Tuple
 
-from services.transaction_service import TransactionService
+from models.money import from_cents
 from models.transaction import Transaction
+from services.aggregates import UNCATEGORIZED
+from services.transaction_service import TransactionService
+from services.recurring_service import RecurringService
+from services.profiler import instrumented
+from services.report_cache import ReportCache, ReportKey
+
+
+def _month_bounds(year: int, month: int) -> Tuple[str, str]:
+    """Obtém a primeira e a última data (inclusivas) de um mês."""
+    # Determina o último dia do mês (o período é inclusivo nas duas pontas)
+    last_day = calendar.monthrange(year, month)[1]
+    return f"{year}-{month:02d}-01", f"{year}-{month:02d}-{last_day:02d}"
+
+
+def _parse_year_month(value: str) -> Tuple[int, int]:
+    """Converte um mês no formato YYYY-MM para (ano, mês)."""
+    try:
+        year, month = (int(part) for part in value.split('-'))
+    except ValueError:
+        raise ValueError(f"Mês inválido: {value!r} (use o formato YYYY-MM)") from None
+    
+    if not 1 <= month <= 12:
+        raise ValueError(f"Mês inválido: {value!r} (use o formato YYYY-MM)")
+    
+    return year, month
 
 
 class ReportService:
-    def __init__(self, transaction_service: TransactionService):
+    def __init__(self, transaction_service: TransactionService, cache_size: int = 64,
+                 recurring_service: Optional[RecurringService] = None):
         """
         Inicializa o serviço de relatórios.
         
+        Os relatórios gerados ficam em um cache LRU, invalidado a cada
+        transação adicionada: uma transação de 2025-05-10 remove apenas os
+        relatórios que incluem maio de 2025 e os relatórios por categoria do
+        seu tipo. Se a conta for recarregada (gravações de outro processo),
+        o cache é esvaziado.
+        
+        Com um serviço de transações recorrentes, os relatórios mensais
+        incluem as ocorrências previstas (ainda não lançadas) do mês, e o
+        cache é esvaziado quando as regras mudam.
+        
         Args:
             transaction_service: Serviço de transações
+            cache_size: Quantidade máxima de relatórios em cache (0 desativa)
+            recurring_service: Serviço de transações recorrentes (opcional)
         """
         self.transaction_service = transaction_service
+        self.recurring_service = recurring_service
+        self.cache = ReportCache(cache_size)
+        transaction_service.add_listener(self._invalidate)
+        transaction_service.add_reload_listener(self.cache.clear)
+        if recurring_service is not None:
+            recurring_service.add_listener(self.cache.clear)
     
+    def _invalidate(self, transactions: List[Transaction]) -> None:
+        """
+        Remove do cache os relatórios afetados por transações adicionadas.
+        
+        Args:
+            transactions: Transações adicionadas
+        """
+        months: Set[Tuple[int, int]] = set()
+        types: Set[str] = set()
+        
+        for transaction in transactions:
+            year, month, _ = transaction.date.split('-')
+            months.add((int(year), int(month)))
+            types.add(transaction.transaction_type)
+        
+        def is_stale(key: ReportKey) -> bool:
+            if key[0] == 'monthly':
+                return (key[1], key[2]) in months
+            if key[0] == 'range':
+                return any(key[1] <= month <= key[2] for month in months)
+            return key[0] == 'category' and key[1] in types
+        
+        self.cache.invalidate(is_stale)
+    
+    def _refresh_rules(self) -> None:
+        """Relê as regras recorrentes alteradas por outro processo (esvaziando o cache)."""
+        if self.recurring_service is not None:
+            self.recurring_service.refresh()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Obtém os contadores do cache de relatórios (acertos, falhas, etc.).
+        
+        Returns:
+            Dicionário com os contadores (ver ReportCache.stats)
+        """
+        return self.cache.stats()
+    
+    @instrumented
     def generate_monthly_report(self, year: int, month: int) -> Dict[str, Any]:
         """
         Gera um relatório mensal.
@@ -24,38 +107,102 @@ class ReportService:
             month: Mês do relatório (1-12)
             
         Returns:
-            Dicionário com os dados do relatório
+            Dicionário com os dados do relatório (compartilhado com o cache:
+            não deve ser modificado)
         """
-        # Cria as datas de início e fim do mês
-        start_date = f"{year}-{month:02d}-01"
-        
-        # Determina o último dia do mês
-        if month == 12:
-            next_month = 1
-            next_year = year + 1
-        else:
-            next_month = month + 1
-            next_year = year
-            
-        end_date = f"{next_year}-{next_month:02d}-01"
+        self._refresh_rules()
+        return self.cache.get_or_compute(('monthly', year, month),
+                                         lambda: self._compute_monthly_report(year, month))
+    
+    def _compute_monthly_report(self, year: int, month: int) -> Dict[str, Any]:
+        """Calcula um relatório mensal (sem usar o cache)."""
+        start_date, end_date = _month_bounds(year, month)
         
         # Obtém as transações do período
         transactions = self.transaction_service.get_transactions_by_period(start_date, end_date)
         
-        # Separa receitas e despesas
-        incomes = [t for t in transactions if t.transaction_type == 'receita']
-        expenses = [t for t in transactions if t.transaction_type == 'despesa']
+        return self._build_monthly_report(year, month, transactions)
+    
+    @instrumented
+    def generate_range_report(self, start_year_month: str, end_year_month: str) -> List[Dict[str, Any]]:
+        """
+        Gera os relatórios mensais de um intervalo de meses.
+        
+        As transações são agrupadas por mês em uma única chamada ao serviço de
+        transações, e os totais por categoria vêm dos totais já agregados,
+        sem percorrer as transações.
+        
+        Args:
+            start_year_month: Primeiro mês do intervalo (formato: YYYY-MM)
+            end_year_month: Último mês do intervalo, inclusivo (formato: YYYY-MM)
+            
+        Returns:
+            Lista com um relatório mensal (mesmo formato de
+            generate_monthly_report) por mês, em ordem cronológica
+            (compartilhada com o cache: não deve ser modificada)
+        """
+        start_year, start_month = _parse_year_month(start_year_month)
+        end_year, end_month = _parse_year_month(end_year_month)
+        
+        if (start_year, start_month) > (end_year, end_month):
+            raise ValueError("O mês inicial deve ser anterior ou igual ao mês final")
+        
+        self._refresh_rules()
+        return self.cache.get_or_compute(
+            ('range', (start_year, start_month), (end_year, end_month)),
+            lambda: self._compute_range_report(start_year, start_month, end_year, end_month))
+    
+    def _compute_range_report(self, start_year: int, start_month: int, end_year: int,
+                              end_month: int) -> List[Dict[str, Any]]:
+        """Calcula os relatórios de um intervalo de meses (sem usar o cache)."""
+        transactions_by_month = self.transaction_service.get_transactions_by_month(
+            start_year, start_month, end_year, end_month)
+        
+        return [
+            self._build_monthly_report(year, month, transactions_by_month[(year, month)])
+            for year, month in transactions_by_month
+        ]
+    
+    def _build_monthly_report(self, year: int, month: int,
+                              transactions: List[Transaction]) -> Dict[str, Any]:
+        """
+        Monta o relatório de um mês a partir das suas transações.
         
-        # Calcula totais
-        total_income = sum(t.amount for t in incomes)
-        total_expense = sum(t.amount for t in expenses)
-        balance = total_income - total_expense
+        Args:
+            year: Ano do relatório
+            month: Mês do relatório (1-12)
+            transactions: Transações do mês
+            
+        Returns:
+            Dicionário com os dados do relatório (com 'projected_transactions'
+            quando há serviço de transações recorrentes)
+        """
+        # Totais por categoria (em centavos) já agregados pelo serviço de transações
+        income_cents = self.transaction_service.get_category_totals_cents('receita', year, month)
+        expense_cents = self.transaction_service.get_category_totals_cents('despesa', year, month)
         
-        # Agrupa por categoria
-        income_by_category = self._group_by_category(incomes)
-        expense_by_category = self._group_by_category(expenses)
+        projected = None
+        if self.recurring_service is not None:
+            # Só as ocorrências do mês são geradas
+            projected = list(self.recurring_service.iter_projected(*_month_bounds(year, month)))
+            income_cents, expense_cents = dict(income_cents), dict(expense_cents)
+            for transaction in projected:
+                totals = income_cents if transaction.transaction_type == 'receita' else expense_cents
+                category = transaction.category or UNCATEGORIZED
+                totals[category] = totals.get(category, 0) + transaction.amount_cents
         
-        return {
+        # Calcula totais com inteiros, convertendo para reais apenas no final
+        total_income_cents = sum(income_cents.values())
+        total_expense_cents = sum(expense_cents.values())
+        
+        total_income = from_cents(total_income_cents)
+        total_expense = from_cents(total_expense_cents)
+        balance = from_cents(total_income_cents - total_expense_cents)
+        
+        income_by_category = {category: from_cents(c) for category, c in income_cents.items()}
+        expense_by_category = {category: from_cents(c) for category, c in expense_cents.items()}
+        
+        report = {
             'period': f"{year}-{month:02d}",
             'total_income': total_income,
             'total_expense': total_expense,
@@ -64,7 +211,14 @@ class ReportService:
             'expense_by_category': expense_by_category,
             'transactions': transactions
         }
+        
+        if projected is not None:
+            # Incluídas nos totais, mas listadas à parte das transações lançadas
+            report['projected_transactions'] = projected
+        
+        return report
     
+    @instrumented
     def generate_category_report(self, transaction_type: str) -> Dict[str, float]:
         """
         Gera um relatório de gastos ou receitas por categoria.
@@ -73,29 +227,9 @@ class ReportService:
             transaction_type: Tipo de transação ('receita' ou 'despesa')
             
         Returns:
-            Dicionário com categorias e seus valores totais
-        """
-        transactions = self.transaction_service.get_transactions_by_type(transaction_type)
-        return self._group_by_category(transactions)
-    
-    def _group_by_category(self, transactions: List[Transaction]) -> Dict[str, float]:
+            Dicionário com categorias e seus valores totais (compartilhado
+            com o cache: não deve ser modificado)
         """
-        Agrupa transações por categoria.
-        
-        Args:
-            transactions: Lista de transações
-            
-        Returns:
-            Dicionário com categorias e seus valores totais
-        """
-        categories = {}
-        
-        for transaction in transactions:
-            category = transaction.category if transaction.category else "Sem categoria"
-            
-            if category in categories:
-                categories[category] += transaction.amount
-            else:
-                categories[category] = transaction.amount
-                
-        return categories
\ No newline at end of file
+        return self.cache.get_or_compute(
+            ('category', transaction_type),
+            lambda: self.transaction_service.get_category_totals(transaction_type))
@@ -0,0 +1,372 @@
+import os
+import sqlite3
+from datetime import date
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from models.money import to_cents, from_cents
+from models.transaction import date_to_ordinal
+from services.file_handler import FileHandler, balance_delta_cents
+from services.file_lock import FileLock
+from services.profiler import instrumented
+
+
+# Versão do esquema do banco (PRAGMA user_version)
+SCHEMA_VERSION = 3
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS transactions (
+        id INTEGER PRIMARY KEY,
+        type TEXT NOT NULL,
+        amount_cents INTEGER NOT NULL,
+        date TEXT NOT NULL,
+        category TEXT NOT NULL,
+        description TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions (date)",
+    "CREATE INDEX IF NOT EXISTS idx_transactions_type ON transactions (type, date)",
+    "CREATE INDEX IF NOT EXISTS idx_transactions_category ON transactions (category, date)",
+]
+
+
+def _iso_date(value: str) -> str:
+    """
+    Normaliza uma data para YYYY-MM-DD (ex: '2025-1-5' vira '2025-01-05').
+
+    As datas são comparadas como texto no banco, o que só respeita a ordem
+    cronológica com zeros à esquerda.
+    """
+    return date.fromordinal(date_to_ordinal(value)).isoformat()
+
+
+class SQLiteHandler(FileHandler):
+    """
+    Backend de armazenamento em SQLite (biblioteca padrão).
+
+    Expõe a mesma interface do FileHandler (load_data/save_data) e, além
+    disso, grava transações de forma incremental e responde consultas
+    filtradas diretamente no banco, usando índices por data, tipo e
+    categoria. Assim o histórico não precisa ficar todo em memória.
+
+    O próprio SQLite coordena vários processos no mesmo banco: cada
+    gravação é uma transação do banco, e o saldo é atualizado com um UPDATE
+    relativo dentro dela. PRAGMA data_version indica se outra conexão
+    gravou desde a última sincronização.
+    """
+
+    supports_append = True
+    supports_queries = True
+
+    def __init__(self, file_path: str):
+        """
+        Inicializa o banco de dados, criando as tabelas se necessário.
+
+        Args:
+            file_path: Caminho para o arquivo do banco SQLite
+        """
+        self.file_path = file_path
+
+        # Cria o diretório se não existir
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.lock = FileLock(file_path + '.lock')
+        self.synced_count = 0
+        self._diverged = False
+
+        self.connection = sqlite3.connect(file_path)
+        self._create_schema()
+        self._mark_synced(0)
+
+    def _create_schema(self) -> None:
+        """Cria as tabelas e os índices do banco, migrando bancos antigos."""
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(transactions)")}
+
+        with self.connection:
+            if 'amount' in columns:
+                self._migrate_float_amounts()
+
+            for statement in SCHEMA:
+                self.connection.execute(statement)
+
+            if version < 3:
+                self._migrate_dates()
+
+            if version != SCHEMA_VERSION:
+                self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _migrate_float_amounts(self) -> None:
+        """
+        Migra bancos da versão 1, que guardavam valores e saldo em reais (REAL),
+        para valores em centavos inteiros (deve rodar dentro de uma transação).
+        """
+        self.connection.execute("ALTER TABLE transactions RENAME TO transactions_v1")
+        self.connection.execute(SCHEMA[1])
+        self.connection.execute(
+            "INSERT INTO transactions (id, type, amount_cents, date, category, description) "
+            "SELECT id, type, CAST(ROUND(amount * 100) AS INTEGER), date, category, description "
+            "FROM transactions_v1"
+        )
+        self.connection.execute("DROP TABLE transactions_v1")
+
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'balance'").fetchone()
+        if row:
+            self._set_balance_cents(to_cents(float(row[0])))
+            self.connection.execute("DELETE FROM meta WHERE key = 'balance'")
+
+    def _migrate_dates(self) -> None:
+        """
+        Migra bancos anteriores à versão 3, que guardavam as datas como
+        digitadas (ex: '2025-1-5'), para YYYY-MM-DD (deve rodar dentro de uma
+        transação).
+        """
+        rows = self.connection.execute(
+            "SELECT id, date FROM transactions "
+            "WHERE date NOT GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'"
+        ).fetchall()
+        self.connection.executemany(
+            "UPDATE transactions SET date = ? WHERE id = ?",
+            ((_iso_date(value), row_id) for row_id, value in rows)
+        )
+
+    def _state(self) -> int:
+        """
+        Lê um identificador barato do conteúdo gravado.
+
+        Returns:
+            PRAGMA data_version, que muda quando outra conexão grava no banco
+        """
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def load_changes(self) -> None:
+        """
+        Registra a sincronização com as gravações de outras conexões.
+
+        As transações ficam no banco e as consultas seguintes já enxergam
+        os dados novos.
+
+        Returns:
+            None (quem mantém dados em memória, como o saldo, deve relê-los)
+        """
+        self._mark_synced(0)
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        self.connection.close()
+
+    def _set_balance_cents(self, balance_cents: int) -> None:
+        """Grava o saldo (em centavos) nos metadados (deve rodar dentro de uma transação)."""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('balance_cents', ?)",
+            (str(balance_cents),)
+        )
+
+    def _insert_rows(self, transactions: List[Dict[str, Any]]) -> None:
+        """Insere transações, com as datas normalizadas (deve rodar dentro de uma transação)."""
+        self.connection.executemany(
+            "INSERT INTO transactions (type, amount_cents, date, category, description) "
+            "VALUES (?, ?, ?, ?, ?)",
+            ((t['type'], to_cents(t['amount']), _iso_date(t['date']), t['category'],
+              t['description'])
+             for t in transactions)
+        )
+
+    def load_balance_cents(self) -> int:
+        """
+        Carrega apenas o saldo, em centavos, sem ler as transações.
+
+        Returns:
+            Saldo armazenado em centavos (0 se o banco estiver vazio)
+        """
+        row = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'balance_cents'"
+        ).fetchone()
+        return int(row[0]) if row else 0
+
+    def load_balance(self) -> float:
+        """
+        Carrega apenas o saldo, sem ler as transações.
+
+        Returns:
+            Saldo armazenado (0.0 se o banco estiver vazio)
+        """
+        return from_cents(self.load_balance_cents())
+
+    @instrumented
+    def load_data(self) -> Dict[str, Any]:
+        """
+        Carrega todos os dados do banco no mesmo formato do FileHandler.
+
+        Returns:
+            Dicionário com os dados carregados (vazio se não houver dados)
+        """
+        has_balance = self.connection.execute(
+            "SELECT 1 FROM meta WHERE key = 'balance_cents'"
+        ).fetchone()
+
+        if not has_balance:
+            return {}
+
+        return {
+            'balance': self.load_balance(),
+            'transactions': self.query_transactions()
+        }
+
+    @instrumented
+    def save_data(self, data: Dict[str, Any]) -> None:
+        """
+        Substitui todo o conteúdo do banco pelos dados informados.
+
+        Args:
+            data: Dicionário com os dados a serem salvos
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM transactions")
+            self.connection.execute("DELETE FROM meta")
+
+            if data:
+                self._insert_rows(data.get('transactions', []))
+                self._set_balance_cents(to_cents(data.get('balance', 0.0)))
+
+    def append_transactions(self, transactions: List[Dict[str, Any]]) -> None:
+        """
+        Insere transações e atualiza o saldo em uma única transação do banco.
+
+        Args:
+            transactions: Lista de transações (em formato de dicionário)
+        """
+        delta = balance_delta_cents(transactions)
+
+        with self.connection:
+            self._insert_rows(transactions)
+            # Atualização relativa: outro processo pode ter gravado desde a
+            # última leitura do saldo (o INSERT acima já travou o banco)
+            updated = self.connection.execute(
+                "UPDATE meta SET value = CAST(CAST(value AS INTEGER) + ? AS TEXT) "
+                "WHERE key = 'balance_cents'",
+                (delta,)
+            ).rowcount
+            if not updated:
+                self._set_balance_cents(delta)
+
+    def needs_compaction(self) -> bool:
+        """O banco é atualizado no lugar e nunca precisa de compactação."""
+        return False
+
+    def query_transactions(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                           transaction_type: Optional[str] = None,
+                           category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Consulta transações aplicando os filtros no banco.
+
+        Args:
+            start_date: Data inicial inclusiva (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+            transaction_type: Tipo de transação ('receita' ou 'despesa')
+            category: Categoria das transações
+
+        Returns:
+            Lista de transações (em formato de dicionário), na ordem de inserção
+        """
+        return list(self.iter_transactions(start_date, end_date, transaction_type, category))
+
+    def _where(self, start_date: Optional[str], end_date: Optional[str],
+               transaction_type: Optional[str], category: Optional[str]) -> Tuple[str, List[Any]]:
+        """Monta a cláusula WHERE (e os parâmetros) dos filtros informados."""
+        conditions = []
+        params: List[Any] = []
+
+        if start_date is not None:
+            conditions.append("date >= ?")
+            params.append(_iso_date(start_date))
+        if end_date is not None:
+            conditions.append("date <= ?")
+            params.append(_iso_date(end_date))
+        if transaction_type is not None:
+            conditions.append("type = ?")
+            params.append(transaction_type)
+        if category is not None:
+            conditions.append("category = ?")
+            params.append(category)
+
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+    def iter_transactions(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                          transaction_type: Optional[str] = None, category: Optional[str] = None,
+                          offset: int = 0, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre as transações filtradas à medida que são lidas do banco.
+
+        Args:
+            start_date: Data inicial inclusiva (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+            transaction_type: Tipo de transação ('receita' ou 'despesa')
+            category: Categoria das transações
+            offset: Quantidade de transações a pular
+            limit: Quantidade máxima de transações (None para todas)
+
+        Yields:
+            Transações (em formato de dicionário), na ordem de inserção
+        """
+        where, params = self._where(start_date, end_date, transaction_type, category)
+        sql = "SELECT type, amount_cents, date, category, description FROM transactions"
+        sql += where + " ORDER BY id"
+
+        if offset or limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [-1 if limit is None else limit, offset]
+
+        for row in self.connection.execute(sql, params):
+            yield {'type': row[0], 'amount': from_cents(row[1]), 'date': row[2],
+                   'category': row[3], 'description': row[4]}
+
+    def count_transactions(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                           transaction_type: Optional[str] = None,
+                           category: Optional[str] = None) -> int:
+        """
+        Conta as transações filtradas no banco, sem lê-las.
+
+        Args:
+            start_date: Data inicial inclusiva (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+            transaction_type: Tipo de transação ('receita' ou 'despesa')
+            category: Categoria das transações
+
+        Returns:
+            Quantidade de transações
+        """
+        where, params = self._where(start_date, end_date, transaction_type, category)
+        return self.connection.execute("SELECT COUNT(*) FROM transactions" + where, params).fetchone()[0]
+
+    def sum_by_category(self, transaction_type: str, start_date: Optional[str] = None,
+                        end_date: Optional[str] = None) -> Dict[str, int]:
+        """
+        Soma os valores (em centavos) por categoria diretamente no banco.
+
+        Args:
+            transaction_type: Tipo de transação ('receita' ou 'despesa')
+            start_date: Data inicial inclusiva (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+
+        Returns:
+            Dicionário com categorias e seus totais em centavos, na ordem em que
+            cada categoria apareceu pela primeira vez
+        """
+        sql = "SELECT category, SUM(amount_cents) FROM transactions WHERE type = ?"
+        params = [transaction_type]
+
+        if start_date is not None:
+            sql += " AND date >= ?"
+            params.append(_iso_date(start_date))
+        if end_date is not None:
+            sql += " AND date <= ?"
+            params.append(_iso_date(end_date))
+
+        sql += " GROUP BY category ORDER BY MIN(id)"
+
+        return {row[0]: row[1] for row in self.connection.execute(sql, params)}
@@ -0,0 +1,35 @@
+import os
+
+from config.settings import STORAGE_BACKEND
+from services.binary_file_handler import BinaryFileHandler
+from services.file_handler import FileHandler
+from services.journal_file_handler import JournalFileHandler
+from services.partitioned_file_handler import PartitionedFileHandler
+from services.sqlite_handler import SQLiteHandler
+
+
+def create_file_handler(file_path: str, backend: str = STORAGE_BACKEND) -> FileHandler:
+    """
+    Cria o manipulador de arquivo correspondente ao backend configurado.
+    
+    Args:
+        file_path: Caminho para o arquivo de dados
+        backend: Nome do backend ('json', 'journal', 'sqlite', 'binary' ou 'partitioned')
+        
+    Returns:
+        Instância do manipulador de arquivo
+    """
+    if backend == 'json':
+        return FileHandler(file_path)
+    if backend == 'journal':
+        return JournalFileHandler(file_path)
+    if backend == 'sqlite':
+        # O banco fica ao lado do JSON, com a extensão trocada
+        return SQLiteHandler(os.path.splitext(file_path)[0] + '.sqlite3')
+    if backend == 'binary':
+        return BinaryFileHandler(os.path.splitext(file_path)[0] + '.bin')
+    if backend == 'partitioned':
+        # Um diretório com uma partição por mês, ao lado do JSON
+        return PartitionedFileHandler(os.path.splitext(file_path)[0])
+    
+    raise ValueError(f"Backend de armazenamento desconhecido: {backend}")
@@ -0,0 +1,215 @@
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Set
+
+from models.transaction import Transaction
+
+
+# Uma palavra do texto normalizado (letras e dígitos)
+WORD = re.compile(r'\w+')
+
+
+# Letras acentuadas comuns em português (e variantes), convertidas sem unicodedata
+ACCENTS = str.maketrans('áàâãäåéèêëíìîïóòôõöúùûüçñý', 'aaaaaaeeeeiiiiooooouuuucny')
+
+
+def normalize(text: str) -> str:
+    """
+    Normaliza um texto para buscas: sem acentos e sem diferença entre
+    maiúsculas e minúsculas (ex: 'Açaí' -> 'acai').
+
+    Args:
+        text: Texto original
+
+    Returns:
+        Texto normalizado
+    """
+    if text.isascii():
+        return text.lower()
+
+    text = text.casefold().translate(ACCENTS)
+    if text.isascii():
+        return text
+
+    # Outros acentos e caracteres combinantes
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Divide um texto em palavras normalizadas.
+
+    Args:
+        text: Texto original
+
+    Returns:
+        Palavras normalizadas, na ordem em que aparecem
+    """
+    return WORD.findall(normalize(text))
+
+
+class TextIndex:
+    """
+    Índice invertido das palavras da descrição e da categoria das transações.
+
+    Cada palavra normalizada aponta para as posições (na conta) das
+    transações que a contêm. As palavras distintas ficam também em uma
+    lista ordenada: a busca por prefixo é uma busca binária e a busca por
+    trecho é feita com str.find sobre o vocabulário concatenado, nunca na
+    lista de transações.
+    """
+
+    def __init__(self):
+        """Inicializa um índice vazio."""
+        self.postings: Dict[str, List[int]] = {}
+        self.vocabulary: List[str] = []
+        # Vocabulário concatenado (separado por '\n') e o início de cada palavra nele
+        self._joined: Optional[str] = None
+        self._offsets: List[int] = []
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable[Transaction]) -> 'TextIndex':
+        """
+        Constrói o índice a partir das transações, na ordem da conta.
+
+        Args:
+            transactions: Transações da conta
+
+        Returns:
+            Índice construído
+        """
+        index = cls()
+        postings = index.postings
+        # As categorias se repetem muito: cada uma é normalizada uma única vez
+        categories: Dict[str, List[str]] = {}
+
+        for position, transaction in enumerate(transactions):
+            words = set(tokenize(transaction.description))
+
+            category_words = categories.get(transaction.category)
+            if category_words is None:
+                category_words = categories[transaction.category] = tokenize(transaction.category)
+            words.update(category_words)
+
+            for word in words:
+                bucket = postings.get(word)
+                if bucket is None:
+                    postings[word] = [position]
+                else:
+                    bucket.append(position)
+
+        index.vocabulary = sorted(postings)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.postings)
+
+    def insert(self, transaction: Transaction, position: int) -> None:
+        """
+        Insere uma transação no índice.
+
+        Args:
+            transaction: Transação inserida
+            position: Posição da transação na lista da conta
+        """
+        for word in set(tokenize(transaction.description) + tokenize(transaction.category)):
+            bucket = self.postings.get(word)
+            if bucket is None:
+                self.postings[word] = [position]
+                insort(self.vocabulary, word)
+                self._joined = None
+            else:
+                bucket.append(position)
+
+    def discard_from(self, position: int) -> None:
+        """
+        Remove do índice as transações a partir de uma posição da conta.
+
+        Args:
+            position: Primeira posição removida
+        """
+        for word, bucket in list(self.postings.items()):
+            del bucket[bisect_left(bucket, position):]
+            if not bucket:
+                del self.postings[word]
+
+        self.vocabulary = sorted(self.postings)
+        self._joined = None
+
+    def _matching_words(self, term: str, prefix: bool) -> List[str]:
+        """Palavras do vocabulário que começam com o termo (ou o contêm)."""
+        if prefix:
+            start = bisect_left(self.vocabulary, term)
+            end = start
+            while end < len(self.vocabulary) and self.vocabulary[end].startswith(term):
+                end += 1
+            return self.vocabulary[start:end]
+
+        if self._joined is None:
+            self._joined = '\n'.join(self.vocabulary)
+            self._offsets = [0]
+            self._offsets.extend(accumulate(len(word) + 1 for word in self.vocabulary))
+
+        words = []
+        joined, offsets = self._joined, self._offsets
+        found = joined.find(term)
+
+        while found != -1:
+            # O termo não contém '\n': o trecho encontrado está dentro de uma palavra
+            number = bisect_right(offsets, found) - 1
+            words.append(self.vocabulary[number])
+            found = joined.find(term, offsets[number + 1])
+
+        return words
+
+    def estimate(self, text: str, prefix: bool = False) -> int:
+        """
+        Estima (por cima) quantas transações uma busca encontra, sem montá-la.
+
+        Args:
+            text: Texto procurado
+            prefix: Se True, os termos precisam ser o início de uma palavra
+
+        Returns:
+            Soma das ocorrências das palavras do termo mais raro
+        """
+        terms = set(tokenize(text))
+        if not terms:
+            return 0
+
+        return min(
+            sum(len(self.postings[word]) for word in self._matching_words(term, prefix))
+            for term in terms
+        )
+
+    def search(self, text: str, prefix: bool = False) -> List[int]:
+        """
+        Busca as transações que contêm todos os termos do texto.
+
+        Cada termo precisa aparecer dentro de uma palavra da descrição ou da
+        categoria (ou no início dela, com prefix=True), sem diferenciar
+        maiúsculas, minúsculas e acentos: 'mercado' encontra 'Mercado' e
+        'Supermercado Extra'.
+
+        Args:
+            text: Texto procurado
+            prefix: Se True, os termos precisam ser o início de uma palavra
+
+        Returns:
+            Posições das transações encontradas, na ordem de inserção
+        """
+        result: Optional[Set[int]] = None
+
+        for term in set(tokenize(text)):
+            positions: Set[int] = set()
+            for word in self._matching_words(term, prefix):
+                positions.update(self.postings[word])
+
+            result = positions if result is None else result & positions
+            if not result:
+                return []
+
+        return sorted(result) if result is not None else []
@@ -1,40 +1,313 @@
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import calendar
+import threading
+from contextlib import contextmanager
+from itertools import islice
+from operator import attrgetter, itemgetter
+from datetime import date, datetime
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple, Union
 
-from models.transaction import Transaction
+from models.transaction import Transaction, date_to_ordinal
 from models.account import Account
+from models.money import from_cents, to_cents
 from services.file_handler import FileHandler
+from services.date_index import DateIndex
+from services.balance_index import BalanceIndex
+from services.aggregates import TransactionAggregates, UNCATEGORIZED
+from services.query import BACKEND_FILTERS, QueryPlan, TransactionQuery, plan_query
+from services.text_index import TextIndex
+from services.value_index import ValueIndex
+from services.write_behind import WriteBehindFlusher
+from services.profiler import instrumented
+
+
+class TransactionSelection:
+    """
+    Resultado de uma consulta de transações, lido por páginas.
+    
+    A quantidade total é calculada uma única vez, sem montar a lista de
+    transações, e cada página só é criada quando solicitada.
+    """
+    
+    def __init__(self, count: Callable[[], int], fetch: Callable[[int, int], List[Transaction]]):
+        """
+        Inicializa a seleção.
+        
+        Args:
+            count: Função que retorna a quantidade total de transações
+            fetch: Função (offset, limit) que retorna as transações de uma página
+        """
+        self._count = count
+        self._fetch = fetch
+        self._total: Optional[int] = None
+    
+    @classmethod
+    def from_sequence(cls, transactions: Sequence[Transaction]) -> 'TransactionSelection':
+        """
+        Cria uma seleção sobre transações já obtidas (lista ou armazenamento da conta).
+        
+        Args:
+            transactions: Transações selecionadas
+            
+        Returns:
+            Seleção sobre as transações
+        """
+        return cls(lambda: len(transactions),
+                   lambda offset, limit: list(transactions[offset:offset + limit]))
+    
+    def __len__(self) -> int:
+        if self._total is None:
+            self._total = self._count()
+        return self._total
+    
+    def page(self, offset: int, limit: int) -> List[Transaction]:
+        """
+        Obtém as transações de uma página.
+        
+        Args:
+            offset: Posição da primeira transação da página
+            limit: Quantidade máxima de transações
+            
+        Returns:
+            Transações da página, na ordem de inserção
+        """
+        return self._fetch(offset, limit)
 
 
 class TransactionService:
-    def __init__(self, file_handler: FileHandler):
+    def __init__(self, file_handler: FileHandler, columnar: bool = False,
+                 trusted_load: bool = True, lazy_load: bool = False,
+                 write_behind: bool = False, flush_interval: float = 2.0,
+                 flush_threshold: int = 100):
         """
         Inicializa o serviço de transações.
         
         Args:
             file_handler: Manipulador de arquivo para persistência
+            columnar: Se True, mantém as transações em armazenamento colunar
+                compacto na memória
+            trusted_load: Se True, os dados persistidos são carregados sem
+                revalidar cada transação (ver verify)
+            lazy_load: Se True, a conta só é carregada quando for usada pela
+                primeira vez (o saldo e a gravação de transações novas não
+                exigem a carga quando o backend permite)
+            write_behind: Se True, backends sem gravação incremental gravam a
+                conta em uma thread de fundo, sem bloquear quem adicionou a
+                transação (ver flush, close e pop_flush_error)
+            flush_interval: Segundos entre a primeira alteração pendente e a
+                gravação em segundo plano
+            flush_threshold: Quantidade de transações pendentes que antecipa
+                a gravação em segundo plano
         """
         self.file_handler = file_handler
-        self.account = self._load_account()
+        self.columnar = columnar
+        self.trusted_load = trusted_load
+        # Com backends consultáveis, as transações ficam só no armazenamento
+        self.pushdown = file_handler.supports_queries
+        self.date_index = DateIndex()
+        self.type_index = ValueIndex()
+        self.category_index = ValueIndex()
+        # Índice de texto, construído na primeira busca por texto
+        self._text_index: Optional[TextIndex] = None
+        # Variação do saldo por dia, construída na primeira consulta de saldo por data
+        self._balance_index: Optional[BalanceIndex] = None
+        self.aggregates = TransactionAggregates()
+        self._account: Optional[Account] = None
+        # Gravações completas adiadas por deferred_writes()
+        self._deferred_writes = 0
+        self._unsaved_changes = False
+        # Funções chamadas a cada lote de transações adicionado (ver add_listener)
+        self._listeners: List[Callable[[List[Transaction]], None]] = []
+        # Funções chamadas quando a conta é recarregada (ver add_reload_listener)
+        self._reload_listeners: List[Callable[[], None]] = []
+        # Protege a conta em memória enquanto a thread de gravação copia os dados
+        self._lock = threading.Lock()
+        self._flusher: Optional[WriteBehindFlusher] = None
+        
+        if write_behind and not file_handler.supports_append:
+            self._flusher = WriteBehindFlusher(self._snapshot,
+                                               lambda data: self.file_handler.save_data(data),
+                                               flush_interval, flush_threshold)
+            self._flusher.start()
+        
+        if not lazy_load:
+            self._account = self._load_account()
+    
+    @property
+    def account(self) -> Account:
+        """Conta carregada (a carga é feita no primeiro acesso, se adiada)."""
+        if self._account is None:
+            self._account = self._load_account()
+        return self._account
     
+    @instrumented
     def _load_account(self) -> Account:
         """
         Carrega a conta do arquivo ou cria uma nova se não existir.
         
+        Também constrói os índices (por data, tipo e categoria) e os totais
+        materializados das transações carregadas.
+        
         Returns:
             Instância de Account carregada ou nova
         """
-        data = self.file_handler.load_data()
+        if self.pushdown:
+            account = Account()
+            account.balance_cents = self.file_handler.load_balance_cents()
+            return account
+        
+        account = self.file_handler.load_account(columnar=self.columnar, trusted=self.trusted_load)
         
-        if data:
-            return Account.from_dict(data)
+        self.date_index = DateIndex.from_ordinals(account.date_ordinals())
+        self._text_index = None
+        self._balance_index = None
+        self._build_value_indexes(account.get_transactions())
+        self.aggregates = TransactionAggregates.build(account.get_transactions())
+        return account
+    
+    def _build_value_indexes(self, transactions: Sequence[Transaction]) -> None:
+        """
+        Constrói os índices por tipo e por categoria.
+        
+        Para armazenamentos compactos, lê as linhas via iter_rows, sem
+        criar objetos Transaction.
+        """
+        if hasattr(transactions, 'iter_rows'):
+            types = map(itemgetter(0), transactions.iter_rows())
+            categories = map(itemgetter(3), transactions.iter_rows())
         else:
-            return Account()
+            types = map(attrgetter('transaction_type'), transactions)
+            categories = map(attrgetter('category'), transactions)
+        
+        self.type_index = ValueIndex.from_values(types)
+        self.category_index = ValueIndex.from_values(categories)
+    
+    @property
+    def text_index(self) -> TextIndex:
+        """
+        Índice invertido das palavras da descrição e da categoria.
+        
+        É construído na primeira busca por texto (e não na carga, para não
+        atrasar a inicialização) e mantido a cada transação adicionada.
+        """
+        if self._text_index is None:
+            self._text_index = TextIndex.from_transactions(self.account.get_transactions())
+        return self._text_index
+    
+    @property
+    def balance_index(self) -> BalanceIndex:
+        """
+        Árvore de Fenwick com a variação do saldo em cada dia.
+        
+        Como o text_index, é construída na primeira consulta de saldo por
+        data e mantida a cada transação adicionada (inclusive retroativa).
+        """
+        if self._balance_index is None:
+            transactions = self.account.get_transactions()
+            if hasattr(transactions, 'iter_rows'):
+                rows = transactions.iter_rows()
+            else:
+                rows = ((t.transaction_type, t.amount_cents, date_to_ordinal(t.date))
+                        for t in transactions)
+            self._balance_index = BalanceIndex.from_rows(rows)
+        return self._balance_index
+    
+    def _snapshot(self) -> Dict[str, Any]:
+        """Copia a conta para gravação, sem transações registradas pela metade."""
+        with self._lock:
+            return self.account.to_dict()
     
     def _save_account(self) -> None:
         """Salva a conta atual no arquivo."""
+        if self.pushdown:
+            # As transações não estão em memória; o backend já está atualizado
+            return
+        
+        if self._flusher is not None:
+            # Passa pelo gravador para não concorrer com a thread de fundo
+            self._flusher.mark_dirty()
+            self._flusher.flush()
+            return
+        
         self.file_handler.save_data(self.account.to_dict())
     
+    def flush(self) -> None:
+        """
+        Grava imediatamente as alterações pendentes do modo write-behind.
+        
+        Raises:
+            OSError (ou outra exceção da gravação) se os dados não puderem
+            ser gravados; as alterações continuam pendentes
+        """
+        if self._flusher is not None:
+            self._flusher.flush()
+    
+    def close(self) -> None:
+        """
+        Encerra a thread de gravação, gravando as alterações pendentes.
+        
+        Depois de close, as transações voltam a ser gravadas na hora.
+        
+        Raises:
+            Exceção da gravação final, se ela falhar
+        """
+        if self._flusher is not None:
+            # Em caso de falha o gravador é mantido, e close pode ser chamado de novo
+            self._flusher.stop()
+            self._flusher = None
+    
+    @property
+    def pending_writes(self) -> int:
+        """Quantidade de transações ainda não gravadas pelo modo write-behind."""
+        return self._flusher.pending if self._flusher is not None else 0
+    
+    def pop_flush_error(self) -> Optional[BaseException]:
+        """
+        Obtém (e esquece) a última falha de gravação em segundo plano.
+        
+        Returns:
+            Exceção da gravação, ou None se não houve falha
+        """
+        if self._flusher is None:
+            return None
+        
+        error, self._flusher.error = self._flusher.error, None
+        return error
+    
+    def verify(self) -> List[str]:
+        """
+        Verifica a integridade dos dados persistidos.
+        
+        Relê o armazenamento e valida cada transação com as mesmas regras do
+        construtor de Transaction, que são puladas na carga confiável.
+        
+        Returns:
+            Lista de problemas encontrados (vazia se estiver tudo certo)
+        """
+        data = self.file_handler.load_data()
+        
+        if not data:
+            return []
+        
+        problems = []
+        
+        if not isinstance(data.get('balance'), (int, float)):
+            problems.append("Saldo ausente ou inválido")
+        
+        transactions = data.get('transactions')
+        if not isinstance(transactions, list):
+            problems.append("Lista de transações ausente ou inválida")
+            return problems
+        
+        for position, transaction_data in enumerate(transactions, start=1):
+            try:
+                Transaction.from_dict(transaction_data)
+            except KeyError as e:
+                problems.append(f"Transação {position}: campo ausente {e}")
+            except (TypeError, ValueError) as e:
+                problems.append(f"Transação {position}: {e}")
+        
+        return problems
+    
     def add_transaction(self, transaction: Transaction) -> None:
         """
         Adiciona uma nova transação.
@@ -42,8 +315,266 @@ class TransactionService:
         Args:
             transaction: Transação a ser adicionada
         """
-        self.account.add_transaction(transaction)
-        self._save_account()
+        if self._can_skip_load():
+            self._persist_new_transactions([transaction])
+            self._notify_listeners([transaction])
+            return
+        
+        self._register_transactions([transaction])
+        self._persist_new_transactions([transaction])
+        self._notify_listeners([transaction])
+        self._compact_if_needed()
+    
+    def add_transactions(self, transactions: Iterable[Union[Transaction, Dict[str, Any]]]) -> int:
+        """
+        Adiciona um lote de transações com uma única gravação.
+        
+        O lote inteiro é validado antes de qualquer alteração. Se alguma
+        transação for inválida ou a gravação falhar, nada é adicionado e o
+        arquivo de dados permanece como estava.
+        
+        Args:
+            transactions: Transações (instâncias ou dicionários) a serem adicionadas
+            
+        Returns:
+            Quantidade de transações adicionadas
+        """
+        batch = []
+        
+        for position, item in enumerate(transactions, start=1):
+            try:
+                if isinstance(item, Transaction):
+                    batch.append(item)
+                elif isinstance(item, dict):
+                    batch.append(Transaction.from_dict(item))
+                else:
+                    raise ValueError(f"tipo não suportado: {type(item).__name__}")
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Transação {position} do lote inválida: {e}") from e
+        
+        if not batch:
+            return 0
+        
+        if self._can_skip_load():
+            self._persist_new_transactions(batch)
+            self._notify_listeners(batch)
+            return len(batch)
+        
+        previous_balance_cents = self.account.balance_cents
+        previous_count = len(self.account.transactions)
+        
+        self._register_transactions(batch)
+        
+        try:
+            self._persist_new_transactions(batch)
+        except BaseException:
+            self._unregister_transactions(previous_count, previous_balance_cents)
+            raise
+        
+        self._notify_listeners(batch)
+        self._compact_if_needed()
+        return len(batch)
+    
+    def add_listener(self, listener: Callable[[List[Transaction]], None]) -> None:
+        """
+        Registra uma função chamada sempre que transações forem adicionadas.
+        
+        A função recebe a lista de transações do lote, depois que elas foram
+        registradas e persistidas (lotes que falham não são notificados).
+        Usado, por exemplo, para invalidar relatórios em cache.
+        
+        Args:
+            listener: Função que recebe as transações adicionadas
+        """
+        self._listeners.append(listener)
+    
+    def _notify_listeners(self, transactions: List[Transaction]) -> None:
+        """Avisa os listeners sobre transações adicionadas."""
+        for listener in self._listeners:
+            listener(transactions)
+    
+    def add_reload_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Registra uma função chamada quando os dados mudam sem que se saiba quais
+        transações foram adicionadas (ver refresh).
+        
+        Args:
+            listener: Função sem argumentos (ex: limpar um cache)
+        """
+        self._reload_listeners.append(listener)
+    
+    def refresh(self) -> bool:
+        """
+        Incorpora as transações gravadas por outros processos no mesmo armazenamento.
+        
+        A detecção é barata (o backend compara a versão gravada com a da
+        última sincronização, sem ler os dados). Quando possível, só as
+        transações novas são lidas e registradas, e os listeners de
+        add_listener são avisados sobre elas; caso contrário a conta é
+        recarregada e os listeners de add_reload_listener são avisados.
+        
+        Returns:
+            True se os dados em memória mudaram
+        """
+        if self._account is None and not self.pushdown:
+            # Nada em memória: a carga adiada já lerá os dados atuais
+            return False
+        
+        if not self.file_handler.has_changed():
+            return False
+        
+        # As alterações pendentes do write-behind são gravadas (e mescladas) antes
+        self.flush()
+        changes = self.file_handler.load_changes()
+        
+        if changes is None:
+            if self.pushdown:
+                # As transações estão no backend; só o saldo fica em memória
+                if self._account is not None:
+                    self._account.balance_cents = self.file_handler.load_balance_cents()
+            else:
+                account = self._load_account()
+                with self._lock:
+                    self._account = account
+            
+            for listener in self._reload_listeners:
+                listener()
+            return True
+        
+        if changes:
+            transactions = [Transaction.from_dict(row, trusted=self.trusted_load) for row in changes]
+            self._register_transactions(transactions)
+            self._notify_listeners(transactions)
+        
+        return bool(changes)
+    
+    def _can_skip_load(self) -> bool:
+        """
+        Indica se transações novas podem ser gravadas sem carregar a conta.
+        
+        Vale para a carga adiada em backends com gravação incremental: a
+        conta, quando for carregada, já incluirá as transações gravadas.
+        """
+        return self._account is None and self.file_handler.supports_append
+    
+    def _register_transactions(self, transactions: List[Transaction]) -> None:
+        """
+        Registra transações novas na conta em memória.
+        
+        Args:
+            transactions: Transações a serem registradas
+        """
+        if self.pushdown:
+            self.account.update_balance(transactions)
+            return
+        
+        with self._lock:
+            first_position = len(self.account.transactions)
+            self.account.add_transactions(transactions)
+        
+        for position, transaction in enumerate(transactions, start=first_position):
+            self.date_index.insert(transaction.date, position)
+            self.type_index.insert(transaction.transaction_type, position)
+            self.category_index.insert(transaction.category, position)
+            if self._text_index is not None:
+                self._text_index.insert(transaction, position)
+            if self._balance_index is not None:
+                amount_cents = transaction.amount_cents
+                if transaction.transaction_type == 'despesa':
+                    amount_cents = -amount_cents
+                self._balance_index.add(date_to_ordinal(transaction.date), amount_cents)
+            self.aggregates.add(transaction)
+    
+    def _unregister_transactions(self, previous_count: int, previous_balance_cents: int) -> None:
+        """
+        Desfaz o registro de transações que não puderam ser persistidas.
+        
+        Args:
+            previous_count: Quantidade de transações antes do registro
+            previous_balance_cents: Saldo (em centavos) antes do registro
+        """
+        with self._lock:
+            del self.account.transactions[previous_count:]
+            self.account.balance_cents = previous_balance_cents
+        self.date_index.discard_from(previous_count)
+        self.type_index.discard_from(previous_count)
+        self.category_index.discard_from(previous_count)
+        if self._text_index is not None:
+            self._text_index.discard_from(previous_count)
+        self._balance_index = None
+        self.aggregates = TransactionAggregates.build(self.account.get_transactions())
+    
+    def _query(self, **filters: Any) -> List[Transaction]:
+        """
+        Executa uma consulta filtrada diretamente no backend.
+        
+        Args:
+            filters: Filtros aceitos por query_transactions do backend
+            
+        Returns:
+            Lista de transações encontradas
+        """
+        return [
+            Transaction.from_dict(row, trusted=self.trusted_load)
+            for row in self.file_handler.query_transactions(**filters)
+        ]
+    
+    def _persist_new_transactions(self, transactions: List[Transaction]) -> None:
+        """
+        Persiste transações recém-adicionadas à conta.
+        
+        Backends com gravação incremental recebem apenas as transações novas;
+        os demais regravam a conta inteira.
+        
+        Args:
+            transactions: Transações que acabaram de ser adicionadas
+        """
+        if self.file_handler.supports_append:
+            self.file_handler.append_transactions([t.to_dict() for t in transactions])
+        elif self._deferred_writes:
+            self._unsaved_changes = True
+        elif self._flusher is not None:
+            self._flusher.mark_dirty(len(transactions))
+        else:
+            self._save_account()
+    
+    def _compact_if_needed(self) -> None:
+        """Grava um snapshot completo quando o backend pedir compactação."""
+        if self._deferred_writes:
+            return
+        
+        if self.file_handler.needs_compaction():
+            self._save_account()
+    
+    @contextmanager
+    def deferred_writes(self) -> Iterator[None]:
+        """
+        Adia as gravações completas do arquivo até o fim do bloco.
+        
+        Usado em importações e outras cargas em lote: backends sem gravação
+        incremental regravam a conta uma única vez no final, em vez de a cada
+        lote, e a compactação do journal também fica para o final. As
+        transações aceitas dentro do bloco são gravadas mesmo que o bloco
+        termine com erro.
+        
+        Exemplo:
+            with service.deferred_writes():
+                for chunk in chunks:
+                    service.add_transactions(chunk)
+        """
+        self._deferred_writes += 1
+        
+        try:
+            yield
+        finally:
+            self._deferred_writes -= 1
+            
+            if not self._deferred_writes:
+                if self._unsaved_changes:
+                    self._unsaved_changes = False
+                    self._save_account()
+                else:
+                    self._compact_if_needed()
     
     def get_balance(self) -> float:
         """
@@ -52,8 +583,96 @@ class TransactionService:
         Returns:
             Saldo atual da conta
         """
+        if self._account is None:
+            # Carga adiada: o saldo é lido sem carregar as transações
+            return from_cents(self.file_handler.load_balance_cents())
+        
         return self.account.get_balance()
     
+    def _balance_index_after(self, ordinal: int) -> BalanceIndex:
+        """
+        Obtém um índice que cobre ao menos as transações posteriores a um dia.
+        
+        Nos backends consultáveis, as transações não estão em memória: o
+        índice é montado só com as transações a partir do dia seguinte.
+        """
+        if not self.pushdown:
+            return self.balance_index
+        
+        start_date = date.fromordinal(ordinal + 1).isoformat()
+        rows = ((row['type'], to_cents(row['amount']), date_to_ordinal(row['date']))
+                for row in self.file_handler.iter_transactions(start_date=start_date))
+        return BalanceIndex.from_rows(rows)
+    
+    def get_balance_cents_at(self, date_str: str) -> int:
+        """
+        Obtém o saldo ao final de um dia, em centavos.
+        
+        O saldo é o atual menos a variação dos dias posteriores, obtida com
+        uma soma de prefixo no balance_index, em O(log d).
+        
+        Args:
+            date_str: Data (formato: YYYY-MM-DD)
+            
+        Returns:
+            Saldo ao final do dia, incluindo as transações da data
+        """
+        ordinal = datetime.strptime(date_str, "%Y-%m-%d").toordinal()
+        if ordinal == date.max.toordinal():
+            # Não há dias posteriores (nem um dia seguinte para consultar)
+            return self.account.balance_cents
+        
+        index = self._balance_index_after(ordinal)
+        return self.account.balance_cents - (index.total - index.prefix(ordinal))
+    
+    def get_balance_at(self, date_str: str) -> float:
+        """
+        Obtém o saldo ao final de um dia.
+        
+        Args:
+            date_str: Data (formato: YYYY-MM-DD)
+            
+        Returns:
+            Saldo ao final do dia, incluindo as transações da data
+        """
+        return from_cents(self.get_balance_cents_at(date_str))
+    
+    @instrumented
+    def get_balance_series(self, start_date: str, end_date: str,
+                           step_days: int = 1) -> List[Tuple[str, float]]:
+        """
+        Obtém a evolução do saldo em um período (ex: para gráficos).
+        
+        Cada ponto custa uma soma de prefixo, em O(log d), sem percorrer
+        as transações do período.
+        
+        Args:
+            start_date: Data inicial (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+            step_days: Intervalo, em dias, entre os pontos da série
+            
+        Returns:
+            Lista de pares (data, saldo ao final do dia)
+            
+        Raises:
+            ValueError: Se o período ou o intervalo forem inválidos
+        """
+        start = datetime.strptime(start_date, "%Y-%m-%d").toordinal()
+        end = datetime.strptime(end_date, "%Y-%m-%d").toordinal()
+        
+        if start > end:
+            raise ValueError("A data inicial deve ser anterior ou igual à data final")
+        if step_days < 1:
+            raise ValueError("O intervalo entre os pontos deve ser de pelo menos 1 dia")
+        
+        index = self._balance_index_after(start - 1)
+        # Saldo atual menos tudo o que a árvore contém; somado ao prefixo de cada dia
+        base_cents = self.account.balance_cents - index.total
+        
+        return [(date.fromordinal(ordinal).isoformat(), from_cents(base_cents + index.prefix(ordinal)))
+                for ordinal in range(start, end + 1, step_days)]
+    
+    @instrumented
     def get_all_transactions(self) -> List[Transaction]:
         """
         Obtém todas as transações.
@@ -61,8 +680,159 @@ class TransactionService:
         Returns:
             Lista de todas as transações
         """
+        if self.pushdown:
+            return self._query()
+        
         return self.account.get_transactions()
     
+    def plan_query(self, query: TransactionQuery) -> QueryPlan:
+        """
+        Obtém o plano de execução de uma consulta (índice escolhido e
+        filtros restantes), sem executá-la.
+        
+        Args:
+            query: Consulta a ser planejada
+            
+        Returns:
+            Plano de execução
+        """
+        if self.pushdown:
+            return QueryPlan('backend', None, None, query.predicate(skip=BACKEND_FILTERS))
+        
+        text_index = self.text_index if query.text is not None else None
+        return plan_query(query, len(self.account.transactions), self.date_index,
+                          self.type_index, self.category_index, text_index)
+    
+    def iter_query(self, query: TransactionQuery) -> Iterator[Transaction]:
+        """
+        Percorre as transações que atendem a uma consulta, uma por vez.
+        
+        Em memória, o planejador lê as candidatas do índice mais seletivo e
+        verifica os demais filtros em uma única passada. Nos backends
+        consultáveis, período, tipo e categoria são filtrados no banco e as
+        linhas são lidas à medida que são consumidas.
+        
+        Args:
+            query: Consulta a ser executada
+            
+        Yields:
+            Transações na ordem de inserção
+        """
+        plan = self.plan_query(query)
+        
+        if self.pushdown:
+            for row in self.file_handler.iter_transactions(**query.backend_filters()):
+                transaction = Transaction.from_dict(row, trusted=self.trusted_load)
+                if plan.predicate is None or plan.predicate(transaction):
+                    yield transaction
+            return
+        
+        transactions = self.account.get_transactions()
+        for position in plan.positions(transactions):
+            yield transactions[position]
+    
+    @instrumented
+    def find_transactions(self, query: TransactionQuery) -> List[Transaction]:
+        """
+        Obtém as transações que atendem a uma consulta.
+        
+        Args:
+            query: Consulta a ser executada
+            
+        Returns:
+            Lista de transações encontradas, na ordem de inserção
+        """
+        return list(self.iter_query(query))
+    
+    def select_query(self, query: TransactionQuery) -> TransactionSelection:
+        """
+        Seleciona as transações que atendem a uma consulta, para leitura por páginas.
+        
+        A quantidade total vem das posições encontradas pelo plano (ou de
+        uma contagem no backend) e os objetos Transaction só são criados para
+        as páginas lidas.
+        
+        Args:
+            query: Consulta a ser executada
+            
+        Returns:
+            Seleção com a quantidade total e acesso às páginas
+        """
+        plan = self.plan_query(query)
+        
+        if self.pushdown:
+            if plan.predicate is not None:
+                # Filtros de valor e texto: as linhas são verificadas em Python
+                return TransactionSelection(
+                    lambda: sum(1 for _ in self.iter_query(query)),
+                    lambda offset, limit: list(islice(self.iter_query(query),
+                                                      offset, offset + limit))
+                )
+            
+            filters = query.backend_filters()
+            
+            def fetch(offset: int, limit: int) -> List[Transaction]:
+                rows = self.file_handler.iter_transactions(offset=offset, limit=limit, **filters)
+                return [Transaction.from_dict(row, trusted=self.trusted_load) for row in rows]
+            
+            return TransactionSelection(lambda: self.file_handler.count_transactions(**filters),
+                                        fetch)
+        
+        transactions = self.account.get_transactions()
+        
+        if plan.candidates is None and plan.predicate is None:
+            return TransactionSelection.from_sequence(transactions)
+        
+        if plan.predicate is None:
+            # As candidatas do índice já são o resultado (sem percorrê-las)
+            positions = plan.candidates
+        else:
+            positions = list(plan.positions(transactions))
+        
+        return TransactionSelection(
+            lambda: len(positions),
+            lambda offset, limit: [transactions[p] for p in positions[offset:offset + limit]]
+        )
+    
+    def iter_transactions(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                          transaction_type: Optional[str] = None,
+                          category: Optional[str] = None) -> Iterator[Transaction]:
+        """
+        Percorre as transações que atendem aos filtros, uma por vez.
+        
+        Ao contrário dos métodos get_*, não monta uma lista com o resultado
+        (ver iter_query). Usado em exportações.
+        
+        Args:
+            start_date: Data inicial inclusiva (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+            transaction_type: Tipo de transação ('receita' ou 'despesa')
+            category: Categoria das transações
+            
+        Returns:
+            Iterador das transações na ordem de inserção
+        """
+        return self.iter_query(TransactionQuery(start_date, end_date, transaction_type, category))
+    
+    def select_transactions(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                            transaction_type: Optional[str] = None,
+                            category: Optional[str] = None) -> TransactionSelection:
+        """
+        Seleciona as transações que atendem aos filtros, para leitura por páginas
+        (ver select_query).
+        
+        Args:
+            start_date: Data inicial inclusiva (formato: YYYY-MM-DD)
+            end_date: Data final inclusiva (formato: YYYY-MM-DD)
+            transaction_type: Tipo de transação ('receita' ou 'despesa')
+            category: Categoria das transações
+            
+        Returns:
+            Seleção com a quantidade total e acesso às páginas
+        """
+        return self.select_query(TransactionQuery(start_date, end_date, transaction_type, category))
+    
+    @instrumented
     def get_transactions_by_period(self, start_date: str, end_date: str) -> List[Transaction]:
         """
         Obtém transações em um período específico.
@@ -77,11 +847,55 @@ class TransactionService:
         start = datetime.strptime(start_date, "%Y-%m-%d")
         end = datetime.strptime(end_date, "%Y-%m-%d")
         
-        return [
-            transaction for transaction in self.account.get_transactions()
-            if start <= datetime.strptime(transaction.date, "%Y-%m-%d") <= end
-        ]
+        if self.pushdown:
+            return self._query(start_date=start.strftime("%Y-%m-%d"), end_date=end.strftime("%Y-%m-%d"))
+        
+        transactions = self.account.get_transactions()
+        positions = self.date_index.range(start.toordinal(), end.toordinal())
+        return [transactions[position] for position in positions]
+    
+    @instrumented
+    def get_transactions_by_month(self, start_year: int, start_month: int, end_year: int,
+                                  end_month: int) -> Dict[Tuple[int, int], List[Transaction]]:
+        """
+        Obtém as transações de um intervalo de meses, agrupadas por mês.
+        
+        Cada mês é lido do índice por data (ou, nos backends consultáveis,
+        com uma consulta restrita ao mês, que usa o índice do banco ou abre
+        só a partição do mês).
+        
+        Args:
+            start_year: Ano do primeiro mês
+            start_month: Primeiro mês (1-12)
+            end_year: Ano do último mês
+            end_month: Último mês (1-12), inclusivo
+            
+        Returns:
+            Dicionário (ano, mês) -> transações, com todos os meses do
+            intervalo em ordem cronológica
+        """
+        months = {}
+        year, month = start_year, start_month
+        while (year, month) <= (end_year, end_month):
+            months[(year, month)] = []
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        
+        transactions = None if self.pushdown else self.account.get_transactions()
+        
+        for year, month in months:
+            first = date(year, month, 1)
+            last = date(year, month, calendar.monthrange(year, month)[1])
+            
+            if self.pushdown:
+                months[(year, month)] = self._query(start_date=first.isoformat(),
+                                                    end_date=last.isoformat())
+            else:
+                positions = self.date_index.range(first.toordinal(), last.toordinal())
+                months[(year, month)] = [transactions[p] for p in positions]
+        
+        return months
     
+    @instrumented
     def get_transactions_by_type(self, transaction_type: str) -> List[Transaction]:
         """
         Obtém transações de um tipo específico.
@@ -92,11 +906,9 @@ class TransactionService:
         Returns:
             Lista de transações do tipo especificado
         """
-        return [
-            transaction for transaction in self.account.get_transactions()
-            if transaction.transaction_type == transaction_type
-        ]
+        return list(self.iter_query(TransactionQuery(transaction_type=transaction_type)))
     
+    @instrumented
     def get_transactions_by_category(self, category: str) -> List[Transaction]:
         """
         Obtém transações de uma categoria específica.
@@ -107,7 +919,74 @@ class TransactionService:
         Returns:
             Lista de transações da categoria especificada
         """
-        return [
-            transaction for transaction in self.account.get_transactions()
-            if transaction.category == category
-        ]
\ No newline at end of file
+        return list(self.iter_query(TransactionQuery(category=category)))
+    
+    @instrumented
+    def search_transactions(self, text: str, prefix: bool = False) -> List[Transaction]:
+        """
+        Busca transações pela descrição ou pela categoria.
+        
+        A busca não diferencia maiúsculas, minúsculas e acentos, e cada
+        palavra procurada pode aparecer dentro de uma palavra da transação:
+        'mercado' encontra 'Mercado' e 'Supermercado Extra'.
+        
+        Args:
+            text: Texto procurado
+            prefix: Se True, as palavras procuradas precisam ser o início de
+                uma palavra da transação
+            
+        Returns:
+            Lista de transações encontradas, na ordem de inserção
+        """
+        return list(self.iter_query(TransactionQuery(text=text, prefix=prefix)))
+    
+    @instrumented
+    def get_category_totals_cents(self, transaction_type: str, year: Optional[int] = None,
+                                  month: Optional[int] = None) -> Dict[str, int]:
+        """
+        Obtém os totais por categoria de um tipo de transação, em centavos.
+        
+        Usa os totais materializados (ou a agregação do backend, quando as
+        transações não estão em memória), sem percorrer as transações.
+        
+        Args:
+            transaction_type: Tipo de transação ('receita' ou 'despesa')
+            year: Ano (informe junto com o mês para restringir a um mês)
+            month: Mês (1-12)
+            
+        Returns:
+            Dicionário com categorias e seus valores totais (em centavos)
+        """
+        if not self.pushdown:
+            # Garante que a conta (e os totais) foram carregados
+            self.account
+            return self.aggregates.category_totals(transaction_type, year, month)
+        
+        start_date = end_date = None
+        if year is not None and month is not None:
+            start_date = f"{year}-{month:02d}-01"
+            end_date = f"{year}-{month:02d}-{calendar.monthrange(year, month)[1]:02d}"
+        
+        totals = {}
+        for category, amount_cents in self.file_handler.sum_by_category(
+                transaction_type, start_date, end_date).items():
+            category = category or UNCATEGORIZED
+            totals[category] = totals.get(category, 0) + amount_cents
+        
+        return totals
+    
+    def get_category_totals(self, transaction_type: str, year: Optional[int] = None,
+                            month: Optional[int] = None) -> Dict[str, float]:
+        """
+        Obtém os totais por categoria de um tipo de transação, em reais.
+        
+        Args:
+            transaction_type: Tipo de transação ('receita' ou 'despesa')
+            year: Ano (informe junto com o mês para restringir a um mês)
+            month: Mês (1-12)
+            
+        Returns:
+            Dicionário com categorias e seus valores totais
+        """
+        totals = self.get_category_totals_cents(transaction_type, year, month)
+        return {category: from_cents(cents) for category, cents in totals.items()}
\ No newline at end of file
@@ -0,0 +1,88 @@
+from bisect import bisect_left
+from typing import Dict, Hashable, Iterable, List
+
+
+class ValueIndex:
+    """
+    Índice das transações por valor exato de um campo (tipo ou categoria).
+
+    Guarda, para cada valor, a lista das posições das transações na conta.
+    Como as transações só são acrescentadas ao final da conta, cada lista
+    já fica em ordem de inserção, sem ordenação.
+    """
+
+    def __init__(self):
+        """Inicializa um índice vazio."""
+        self.positions: Dict[Hashable, List[int]] = {}
+
+    @classmethod
+    def from_values(cls, values: Iterable[Hashable]) -> 'ValueIndex':
+        """
+        Constrói o índice a partir dos valores do campo, na ordem da conta.
+
+        Args:
+            values: Valor do campo de cada transação
+
+        Returns:
+            Índice construído
+        """
+        index = cls()
+        positions = index.positions
+
+        for position, value in enumerate(values):
+            bucket = positions.get(value)
+            if bucket is None:
+                positions[value] = [position]
+            else:
+                bucket.append(position)
+
+        return index
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def insert(self, value: Hashable, position: int) -> None:
+        """
+        Insere uma transação no índice.
+
+        Args:
+            value: Valor do campo da transação
+            position: Posição da transação na lista da conta
+        """
+        self.positions.setdefault(value, []).append(position)
+
+    def discard_from(self, position: int) -> None:
+        """
+        Remove do índice as transações a partir de uma posição da conta.
+
+        Args:
+            position: Primeira posição removida
+        """
+        for value, bucket in list(self.positions.items()):
+            del bucket[bisect_left(bucket, position):]
+            if not bucket:
+                del self.positions[value]
+
+    def count(self, value: Hashable) -> int:
+        """
+        Conta as transações com um valor, sem copiar as posições.
+
+        Args:
+            value: Valor procurado
+
+        Returns:
+            Quantidade de transações
+        """
+        return len(self.positions.get(value, ()))
+
+    def lookup(self, value: Hashable) -> List[int]:
+        """
+        Obtém as posições das transações com um valor.
+
+        Args:
+            value: Valor procurado
+
+        Returns:
+            Posições das transações, na ordem de inserção (não modificar)
+        """
+        return self.positions.get(value, [])
@@ -0,0 +1,137 @@
+import atexit
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+class WriteBehindFlusher:
+    """
+    Gravação adiada (write-behind) em uma thread de fundo.
+
+    As alterações são apenas marcadas como pendentes; a thread agrupa as
+    pendências e grava um snapshot quando o intervalo desde a primeira
+    pendência termina ou quando a quantidade de pendências atinge o limite.
+    As gravações são serializadas: um snapshot nunca sobrescreve outro mais
+    recente. Falhas ficam guardadas em 'error' (as pendências são mantidas
+    para uma nova tentativa) e são relançadas por flush() e stop().
+    """
+
+    def __init__(self, snapshot: Callable[[], Any], write: Callable[[Any], None],
+                 interval: float = 2.0, max_pending: int = 100):
+        """
+        Inicializa o gravador (a thread só começa com start()).
+
+        Args:
+            snapshot: Função que copia os dados a gravar (chamada com a
+                garantia de que nenhuma outra gravação está em andamento)
+            write: Função que grava o snapshot
+            interval: Segundos entre a primeira pendência e a gravação
+            max_pending: Quantidade de pendências que dispara a gravação imediata
+        """
+        self.snapshot = snapshot
+        self.write = write
+        self.interval = interval
+        self.max_pending = max(1, max_pending)
+        self.error: Optional[BaseException] = None
+        self._pending = 0
+        self._first_pending = 0.0
+        self._stopping = False
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> int:
+        """Quantidade de alterações ainda não gravadas."""
+        return self._pending
+
+    def start(self) -> None:
+        """Inicia a thread de gravação e registra a gravação final na saída do programa."""
+        if self._thread is not None:
+            return
+
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def mark_dirty(self, count: int = 1) -> None:
+        """
+        Registra alterações pendentes de gravação.
+
+        Args:
+            count: Quantidade de alterações
+        """
+        with self._condition:
+            if not self._pending:
+                self._first_pending = time.monotonic()
+            self._pending += count
+            self._condition.notify()
+
+    def flush(self) -> None:
+        """
+        Grava imediatamente as alterações pendentes (na thread atual).
+
+        Raises:
+            Exceção lançada pela gravação (as pendências são mantidas)
+        """
+        with self._flush_lock:
+            with self._condition:
+                pending = self._pending
+                self._pending = 0
+
+            if not pending:
+                return
+
+            try:
+                self.write(self.snapshot())
+            except BaseException as e:
+                with self._condition:
+                    if not self._pending:
+                        self._first_pending = time.monotonic()
+                    self._pending += pending
+                    self.error = e
+                raise
+
+    def _run(self) -> None:
+        """Laço da thread: espera pendências, agrupa e grava."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+
+                # Agrupa as alterações até o fim do intervalo ou até o limite
+                while not self._stopping and self._pending < self.max_pending:
+                    remaining = self._first_pending + self.interval - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                if self._stopping:
+                    return
+
+            try:
+                self.flush()
+            except Exception:
+                # A falha fica em self.error; espera o intervalo antes de tentar de novo
+                with self._condition:
+                    if not self._stopping:
+                        self._condition.wait(self.interval)
+
+    def stop(self) -> None:
+        """
+        Encerra a thread e grava as alterações pendentes (na thread atual).
+
+        Raises:
+            Exceção lançada pela gravação final
+        """
+        if self._thread is not None:
+            with self._condition:
+                self._stopping = True
+                self._condition.notify()
+            self._thread.join()
+            self._thread = None
+
+        # Se a gravação falhar, a chamada na saída do programa tenta de novo
+        self.flush()
+        atexit.unregister(self.stop)
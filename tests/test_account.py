@@ -1,4 +1,5 @@
 import unittest
+from datetime import datetime
 from models.account import Account
 from models.transaction import Transaction
 
@@ -52,6 +53,72 @@ class TestAccount(unittest.TestCase):
         self.assertEqual(len(account.transactions), 1)
         self.assertEqual(account.transactions[0], transaction)
 
+    
+    def test_add_transactions_batch(self):
+        """Testa a adição de um lote de transações."""
+        account = Account(initial_balance=1000.0)
+        
+        account.add_transactions([
+            Transaction(transaction_type='receita', amount=500.0, date='2025-01-01'),
+            Transaction(transaction_type='despesa', amount=200.0, date='2025-01-02'),
+        ])
+        
+        self.assertEqual(account.balance, 1300.0)
+        self.assertEqual(len(account.transactions), 2)
+
+    
+    def test_balance_is_exact(self):
+        """Testa que o saldo não acumula erro de ponto flutuante."""
+        account = Account()
+        
+        account.add_transactions([Transaction('receita', 0.1, '2025-01-01') for _ in range(10)])
+        account.add_transaction(Transaction('despesa', 0.3, '2025-01-01'))
+        
+        self.assertEqual(account.balance_cents, 70)
+        self.assertEqual(account.balance, 0.7)
+    
+    def test_from_dict_rounds_legacy_balance(self):
+        """Testa a migração de saldos gravados com resíduo de ponto flutuante."""
+        account = Account.from_dict({'balance': 0.30000000000000004, 'transactions': []})
+        
+        self.assertEqual(account.balance_cents, 30)
+        self.assertEqual(account.to_dict()['balance'], 0.3)
+    
+    def test_columnar_account(self):
+        """Testa a conta com armazenamento colunar."""
+        account = Account(columnar=True)
+        
+        account.add_transactions([
+            Transaction('receita', 500.0, '2025-01-01', 'Salário', 'Pagamento mensal'),
+            Transaction('despesa', 200.0, '2025-01-02', 'Mercado', 'Compras'),
+            Transaction('despesa', 50.0, '2025-01-03', 'Mercado', 'Feira'),
+        ])
+        
+        transactions = account.get_transactions()
+        
+        self.assertEqual(account.balance, 250.0)
+        self.assertEqual(len(transactions), 3)
+        self.assertEqual(transactions[1].to_dict(), {
+            'type': 'despesa', 'amount': 200.0, 'date': '2025-01-02',
+            'category': 'Mercado', 'description': 'Compras'
+        })
+        self.assertEqual([t.description for t in transactions], ['Pagamento mensal', 'Compras', 'Feira'])
+        self.assertEqual(transactions.categories, ['Salário', 'Mercado'])
+        self.assertEqual(list(account.date_ordinals()), [t.toordinal() for t in (
+            datetime(2025, 1, 1), datetime(2025, 1, 2), datetime(2025, 1, 3))])
+    
+    def test_columnar_account_round_trip(self):
+        """Testa a conversão da conta colunar para dicionário e de volta."""
+        account = Account(columnar=True)
+        account.add_transaction(Transaction('receita', 500.0, '2025-01-01', 'Salário', ''))
+        
+        restored = Account.from_dict(account.to_dict(), columnar=True)
+        
+        self.assertEqual(restored.to_dict(), account.to_dict())
+        
+        del restored.transactions[0:]
+        self.assertEqual(len(restored.transactions), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
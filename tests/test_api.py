@@ -0,0 +1,185 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from api.server import ApiServer
+from models.transaction import Transaction
+from services.file_handler import FileHandler
+from services.recurring_service import RecurringService
+from services.report_service import ReportService
+from services.transaction_service import TransactionService
+
+
+class TestApiServer(unittest.TestCase):
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_file = os.path.join(self.temp_dir.name, 'test_data.json')
+
+        self.transaction_service = TransactionService(FileHandler(self.temp_file))
+        self.transaction_service.add_transactions([
+            Transaction('receita', 1000.0, '2025-01-15', 'Salário', 'Pagamento mensal'),
+            Transaction('despesa', 300.0, '2025-01-20', 'Aluguel', 'Aluguel mensal'),
+            Transaction('despesa', 150.0, '2025-02-25', 'Alimentação', 'Compras do mês'),
+        ])
+        self.report_service = ReportService(self.transaction_service)
+        self.server = ApiServer(self.transaction_service, self.report_service)
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def test_balance(self):
+        """Testa a consulta do saldo."""
+        self.assertEqual(self.server.dispatch('GET', '/balance'), (200, {'balance': 550.0}))
+
+    def test_balance_at_date_and_series(self):
+        """Testa o saldo em uma data e a evolução do saldo."""
+        self.assertEqual(self.server.dispatch('GET', '/balance?at=2025-01-19'),
+                         (200, {'date': '2025-01-19', 'balance': 1000.0}))
+
+        status, series = self.server.dispatch(
+            'GET', '/balance/series?start=2025-01-01&end=2025-03-01&step=30')
+        self.assertEqual(status, 200)
+        self.assertEqual(series, [{'date': '2025-01-01', 'balance': 0.0},
+                                  {'date': '2025-01-31', 'balance': 700.0}])
+
+        self.assertEqual(self.server.dispatch('GET', '/balance/series?start=2025-01-01')[0], 400)
+        self.assertEqual(self.server.dispatch(
+            'GET', '/balance/series?start=1900-01-01&end=2025-01-01')[0], 400)
+
+    def test_recurring(self):
+        """Testa as regras recorrentes e as projeções pela API."""
+        self.assertEqual(self.server.dispatch('GET', '/recurring')[0], 404)
+
+        recurring_service = RecurringService(self.transaction_service,
+                                             os.path.join(self.temp_dir.name, 'recurring.json'))
+        server = ApiServer(self.transaction_service,
+                           ReportService(self.transaction_service, recurring_service=recurring_service))
+
+        body = json.dumps({'type': 'despesa', 'amount': 40.0, 'start_date': '2100-01-10',
+                           'category': 'Streaming'}).encode('utf-8')
+        status, payload = server.dispatch('POST', '/recurring', body)
+        self.assertEqual(status, 201)
+        self.assertEqual((payload['rule']['id'], payload['posted']), (1, 0))
+        self.assertEqual(server.dispatch('POST', '/recurring', b'{"type": "despesa"}')[0], 400)
+
+        status, rules = server.dispatch('GET', '/recurring')
+        self.assertEqual([rule['category'] for rule in rules], ['Streaming'])
+
+        status, report = server.dispatch('GET', '/reports/monthly/2100/2')
+        self.assertEqual(report['total_expense'], 40.0)
+        self.assertEqual(report['projected_transactions'][0]['date'], '2100-02-10')
+
+        self.assertEqual(server.dispatch('GET', '/balance?at=2100-03-31&projected=1'),
+                         (200, {'date': '2100-03-31', 'balance': 430.0}))
+
+    def test_transactions_with_filters_and_pages(self):
+        """Testa a listagem com filtros combinados e paginação."""
+        status, payload = self.server.dispatch('GET', '/transactions?type=despesa&min=100')
+
+        self.assertEqual(status, 200)
+        self.assertEqual(payload['total'], 2)
+        self.assertEqual([t['amount'] for t in payload['transactions']], [300.0, 150.0])
+
+        status, payload = self.server.dispatch('GET', '/transactions?offset=1&limit=1')
+        self.assertEqual(payload['total'], 3)
+        self.assertEqual([t['category'] for t in payload['transactions']], ['Aluguel'])
+
+        status, payload = self.server.dispatch('GET', '/transactions?text=mes&prefix=0')
+        self.assertEqual([t['category'] for t in payload['transactions']], ['Alimentação'])
+
+    def test_add_transactions(self):
+        """Testa o registro de uma transação e de um lote atômico."""
+        body = json.dumps({'type': 'despesa', 'amount': 50.0, 'date': '2025-01-22',
+                           'category': 'Lazer'}).encode('utf-8')
+        self.assertEqual(self.server.dispatch('POST', '/transactions', body),
+                         (201, {'added': 1, 'balance': 500.0}))
+
+        # O relatório em cache é invalidado pela transação nova
+        status, report = self.server.dispatch('GET', '/reports/monthly/2025/1')
+        self.assertEqual(report['expense_by_category'], {'Aluguel': 300.0, 'Lazer': 50.0})
+
+        batch = json.dumps([{'type': 'receita', 'amount': 10.0, 'date': '2025-03-01'},
+                            {'type': 'despesa', 'amount': -5.0, 'date': '2025-03-02'}])
+        status, payload = self.server.dispatch('POST', '/transactions', batch.encode('utf-8'))
+
+        self.assertEqual(status, 400)
+        self.assertIn('Transação 2', payload['error'])
+        self.assertEqual(self.transaction_service.get_balance(), 500.0)
+
+    def test_reports(self):
+        """Testa os relatórios mensal, por intervalo e por categoria."""
+        status, report = self.server.dispatch('GET', '/reports/monthly/2025/1')
+        self.assertEqual(status, 200)
+        self.assertEqual(report['total_income'], 1000.0)
+        self.assertEqual(len(report['transactions']), 2)
+
+        status, reports = self.server.dispatch('GET', '/reports/range?start=2025-01&end=2025-02')
+        self.assertEqual([r['period'] for r in reports], ['2025-01', '2025-02'])
+
+        status, report = self.server.dispatch('GET', '/reports/monthly/2025/2?transactions=0')
+        self.assertNotIn('transactions', report)
+        self.assertEqual(report['expense_by_category'], {'Alimentação': 150.0})
+
+        self.assertEqual(self.server.dispatch('GET', '/reports/category/despesa'),
+                         (200, {'Aluguel': 300.0, 'Alimentação': 150.0}))
+
+    def test_errors(self):
+        """Testa as respostas de erro."""
+        self.assertEqual(self.server.dispatch('GET', '/nada')[0], 404)
+        self.assertEqual(self.server.dispatch('DELETE', '/transactions')[0], 405)
+        self.assertEqual(self.server.dispatch('GET', '/reports/monthly/2025/13')[0], 400)
+        self.assertEqual(self.server.dispatch('GET', '/reports/category/outro')[0], 404)
+        self.assertEqual(self.server.dispatch('GET', '/transactions?start=2025-99-01')[0], 400)
+        self.assertEqual(self.server.dispatch('POST', '/transactions', b'{')[0], 400)
+
+    def test_picks_up_other_writers(self):
+        """Testa que as respostas incluem o que outro processo gravou."""
+        TransactionService(FileHandler(self.temp_file)).add_transaction(
+            Transaction('receita', 50.0, '2025-01-25', 'Extra'))
+
+        self.assertEqual(self.server.dispatch('GET', '/balance'), (200, {'balance': 600.0}))
+
+    def test_http_keep_alive(self):
+        """Testa várias requisições HTTP na mesma conexão."""
+        async def scenario():
+            listener = await self.server.start('127.0.0.1', 0)
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            responses = []
+
+            body = json.dumps({'type': 'receita', 'amount': 25.0, 'date': '2025-02-01'}).encode('utf-8')
+            requests = [
+                b'GET /balance HTTP/1.1\r\nHost: localhost\r\n\r\n',
+                b'POST /transactions HTTP/1.1\r\nHost: localhost\r\nContent-Length: '
+                + str(len(body)).encode('ascii') + b'\r\n\r\n' + body,
+                b'GET /balance HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n',
+            ]
+
+            for request in requests:
+                writer.write(request)
+                head = await reader.readuntil(b'\r\n\r\n')
+                length = int(head.split(b'Content-Length: ')[1].split(b'\r\n')[0])
+                responses.append((head.split(b' ')[1], json.loads(await reader.readexactly(length))))
+
+            closed = await reader.read()
+            writer.close()
+            listener.close()
+            await listener.wait_closed()
+            return responses, closed
+
+        responses, closed = asyncio.run(scenario())
+
+        self.assertEqual(responses, [
+            (b'200', {'balance': 550.0}),
+            (b'201', {'added': 1, 'balance': 575.0}),
+            (b'200', {'balance': 575.0}),
+        ])
+        self.assertEqual(closed, b'')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from collections import Counter
+
+from benchmarks.generator import generate_transactions, generate_account_data, DEFAULT_CATEGORIES
+from benchmarks.run import run_benchmark
+from models.account import Account
+
+
+class TestBenchmarkGenerator(unittest.TestCase):
+    def test_generator_is_deterministic(self):
+        """Testa que a mesma semente gera os mesmos dados."""
+        first = list(generate_transactions(100, seed=7))
+        second = list(generate_transactions(100, seed=7))
+        other = list(generate_transactions(100, seed=8))
+        
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+    
+    def test_category_skew(self):
+        """Testa a distribuição das categorias."""
+        counts = Counter(t['category'] for t in generate_transactions(2000, category_skew=2.0))
+        
+        self.assertEqual(counts.most_common(1)[0][0], DEFAULT_CATEGORIES[0])
+    
+    def test_generated_data_is_valid(self):
+        """Testa que os dados gerados são aceitos pela conta com validação completa."""
+        data = generate_account_data(200, span_days=30)
+        account = Account.from_dict(data)
+        
+        self.assertEqual(len(account.transactions), 200)
+        self.assertEqual(account.balance_cents, sum(
+            t.amount_cents if t.transaction_type == 'receita' else -t.amount_cents
+            for t in account.transactions
+        ))
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    def test_run_benchmark(self):
+        """Testa a execução dos benchmarks com uma base pequena."""
+        results = run_benchmark(200, repeat=1, add_samples=1)
+        operations = {result['operation'] for result in results}
+        
+        self.assertIn('FileHandler.load_data', operations)
+        self.assertIn('ReportService.generate_category_report', operations)
+        self.assertIn('ReportService.generate_category_report (cache)', operations)
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(result['seconds'] >= 0 for result in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
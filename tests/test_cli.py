@@ -0,0 +1,144 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+from cli import run_command
+import main
+from main import parse_args
+from models.transaction import Transaction
+from services.file_handler import FileHandler
+from services.journal_file_handler import JournalFileHandler
+from services.transaction_service import TransactionService
+
+
+class TestCommandLine(unittest.TestCase):
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_file = os.path.join(self.temp_dir.name, 'test_data.json')
+
+        service = TransactionService(FileHandler(self.temp_file))
+        service.add_transactions([
+            Transaction('receita', 1000.0, '2025-01-15', 'Salário', 'Pagamento mensal'),
+            Transaction('despesa', 300.0, '2025-01-20', 'Aluguel', 'Aluguel mensal'),
+            Transaction('despesa', 150.0, '2025-02-25', 'Alimentação', 'Compras do mês'),
+        ])
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def _run(self, *argv: str, file_handler=None):
+        """Executa um subcomando e retorna (código de saída, saída padrão)."""
+        output = io.StringIO()
+        with redirect_stdout(output), redirect_stderr(io.StringIO()):
+            code = run_command(parse_args(list(argv)), file_handler or FileHandler(self.temp_file))
+        return code, output.getvalue()
+
+    def test_balance(self):
+        """Testa o saldo lido sem carregar as transações."""
+        code, output = self._run('balance', '--json')
+
+        self.assertEqual(code, 0)
+        self.assertEqual(json.loads(output), {'balance': 550.0})
+
+    def test_add_and_list(self):
+        """Testa o registro e a listagem com filtros combinados."""
+        self.assertEqual(self._run('add', 'despesa', '45.9', '--date', '2025-01-22',
+                                   '--category', 'Aluguel')[0], 0)
+
+        code, output = self._run('list', '--start', '2025-01-01', '--end', '2025-01-31',
+                                 '--category', 'Aluguel', '--json')
+
+        self.assertEqual(code, 0)
+        self.assertEqual([t['amount'] for t in json.loads(output)], [300.0, 45.9])
+        self.assertEqual(self._run('balance')[1].strip(), '504.10')
+
+        code, output = self._run('list', '--type', 'despesa', '--min', '100', '--text', 'MÊS',
+                                 '--json')
+        self.assertEqual([t['amount'] for t in json.loads(output)], [150.0])
+
+    def test_add_without_loading_history(self):
+        """Testa que backends com journal gravam sem carregar a conta."""
+        journal_file = os.path.join(self.temp_dir.name, 'journal.json')
+        TransactionService(JournalFileHandler(journal_file)).add_transaction(
+            Transaction('receita', 100.0, '2025-01-01'))
+
+        service = TransactionService(JournalFileHandler(journal_file), lazy_load=True)
+        service.add_transaction(Transaction('despesa', 30.0, '2025-01-02'))
+
+        self.assertIsNone(service._account)
+        self.assertEqual(service.get_balance(), 70.0)
+        self.assertEqual(len(TransactionService(JournalFileHandler(journal_file)).get_all_transactions()), 2)
+
+    def test_reports(self):
+        """Testa os relatórios mensal e por categoria."""
+        code, output = self._run('report', 'monthly', '2025', '1', '--json')
+        report = json.loads(output)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(report['expense_by_category'], {'Aluguel': 300.0})
+        self.assertEqual(len(report['transactions']), 2)
+
+        code, output = self._run('report', 'category', 'despesa')
+        self.assertEqual(output.splitlines(), ['Aluguel\t300.00', 'Alimentação\t150.00'])
+
+    def test_invalid_amount(self):
+        """Testa o código de saída para valores inválidos."""
+        self.assertEqual(self._run('add', 'despesa', '-5')[0], 1)
+
+    def test_verify_corrupt_data(self):
+        """Testa que --verify relata os dados corrompidos em vez de falhar na carga."""
+        with open(self.temp_file, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        del data['transactions'][0]['category']
+        data['transactions'][1]['amount'] = 'abc'
+        data['transactions'][2]['date'] = '2025-13-40'
+        with open(self.temp_file, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+
+        output = io.StringIO()
+        with mock.patch.object(main, 'DATA_FILE_PATH', self.temp_file), \
+                mock.patch.object(main, 'create_file_handler', FileHandler), \
+                redirect_stdout(output), self.assertRaises(SystemExit) as exit_info:
+            main.main(['--verify'])
+
+        self.assertEqual(exit_info.exception.code, 1)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0], "3 problema(s) encontrado(s):")
+        self.assertTrue(lines[1].startswith("  - Transação 1: campo ausente"))
+        self.assertTrue(lines[2].startswith("  - Transação 2:"))
+        self.assertTrue(lines[3].startswith("  - Transação 3:"))
+
+    def test_recurring(self):
+        """Testa o cadastro, o lançamento e a projeção de transações recorrentes."""
+        rules = ('--recurring-file', os.path.join(self.temp_dir.name, 'recurring.json'))
+
+        code, output = self._run(*rules, 'recurring', 'add', 'despesa', '100', '--start',
+                                 '2025-03-01', '--until', '2025-05-01', '--category', 'Internet')
+        self.assertEqual((code, output), (0, "1\n"))
+
+        code, output = self._run(*rules, 'balance', '--at', '2025-12-31', '--projected', '--json')
+        self.assertEqual(json.loads(output), {'balance': 250.0})
+
+        code, output = self._run(*rules, 'report', 'monthly', '2025', '4', '--projected', '--json')
+        report = json.loads(output)
+        self.assertEqual(report['expense_by_category'], {'Internet': 100.0})
+        self.assertEqual([t['date'] for t in report['projected_transactions']], ['2025-04-01'])
+
+        code, output = self._run(*rules, 'recurring', 'post', '--json')
+        self.assertEqual([t['date'] for t in json.loads(output)],
+                         ['2025-03-01', '2025-04-01', '2025-05-01'])
+        self.assertEqual(json.loads(self._run('balance', '--json')[1]), {'balance': 250.0})
+
+        self.assertEqual(self._run(*rules, 'recurring', 'remove', '1')[0], 0)
+        self.assertEqual(self._run(*rules, 'recurring', 'list', '--json')[1].strip(), '[]')
+        self.assertEqual(self._run(*rules, 'recurring', 'remove', '1')[0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,79 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from models.transaction import Transaction
+from services.export_service import ExportService
+from services.file_handler import FileHandler
+from services.import_service import ImportService
+from services.partitioned_file_handler import PartitionedFileHandler
+from services.transaction_service import TransactionService
+
+
+TRANSACTIONS = [
+    Transaction('receita', 1000.0, '2025-01-15', 'Salário', 'Pagamento mensal'),
+    Transaction('despesa', 300.0, '2025-01-20', 'Aluguel', 'Aluguel, janeiro'),
+    Transaction('despesa', 150.25, '2025-02-25', 'Alimentação', 'Compras "do mês"'),
+]
+
+
+class TestExportService(unittest.TestCase):
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_file = os.path.join(self.temp_dir.name, 'test_data.json')
+        self.transaction_service = TransactionService(FileHandler(self.temp_file))
+        self.transaction_service.add_transactions(TRANSACTIONS)
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def test_csv_round_trip(self):
+        """Testa que o CSV exportado pode ser importado de volta."""
+        path = os.path.join(self.temp_dir.name, 'export.csv')
+        count = ExportService(self.transaction_service, chunk_size=2).export_to_path(path)
+
+        target = TransactionService(FileHandler(os.path.join(self.temp_dir.name, 'copy.json')))
+        result = ImportService(target).import_csv(path)
+
+        self.assertEqual(count, 3)
+        self.assertEqual(result['rejected'], 0)
+        self.assertEqual([t.to_dict() for t in target.get_all_transactions()],
+                         [t.to_dict() for t in TRANSACTIONS])
+
+    def test_jsonl_with_filters(self):
+        """Testa a exportação em JSON Lines com filtros combinados."""
+        output = io.StringIO()
+        count = ExportService(self.transaction_service).export(
+            output, 'jsonl', start_date='2025-01-01', end_date='2025-01-31',
+            transaction_type='despesa')
+
+        self.assertEqual(count, 1)
+        self.assertEqual([json.loads(line)['category'] for line in output.getvalue().splitlines()],
+                         ['Aluguel'])
+
+    def test_partitions_are_streamed(self):
+        """Testa que a exportação não deixa as partições em memória."""
+        file_handler = PartitionedFileHandler(os.path.join(self.temp_dir.name, 'partitions'))
+        service = TransactionService(file_handler)
+        service.add_transactions(TRANSACTIONS)
+
+        output = io.StringIO()
+        count = ExportService(TransactionService(file_handler)).export(output, 'jsonl',
+                                                                       category='Alimentação')
+
+        self.assertEqual(count, 1)
+        self.assertEqual(file_handler._partitions, {})
+
+    def test_unknown_format(self):
+        """Testa a rejeição de formatos desconhecidos."""
+        with self.assertRaises(ValueError):
+            ExportService(self.transaction_service).export_to_path(
+                os.path.join(self.temp_dir.name, 'export.xml'), 'xml')
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,156 @@
+import os
+import tempfile
+import unittest
+
+from services.file_handler import FileHandler
+from services.import_service import ImportService, parse_amount, read_csv, read_ofx
+from services.journal_file_handler import JournalFileHandler
+from services.transaction_service import TransactionService
+
+
+OFX_SGML = """OFXHEADER:100
+DATA:OFXSGML
+VERSION:102
+
+<OFX>
+<BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20250110120000[-3:BRT]
+<TRNAMT>-52.30
+<MEMO>Supermercado
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>CREDIT
+<DTPOSTED>20250105
+<TRNAMT>3500.00
+<NAME>Empresa
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1>
+</OFX>
+"""
+
+
+class TestImportService(unittest.TestCase):
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_file = os.path.join(self.temp_dir.name, 'test_data.json')
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def _write(self, name: str, content: str) -> str:
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return path
+
+    def test_parse_amount(self):
+        """Testa a conversão de valores nos formatos comuns."""
+        self.assertEqual(str(parse_amount('1234.56')), '1234.56')
+        self.assertEqual(str(parse_amount('1.234,56')), '1234.56')
+        self.assertEqual(str(parse_amount('1,234.56')), '1234.56')
+        self.assertEqual(str(parse_amount('R$ -10,00')), '-10.00')
+        with self.assertRaises(ValueError):
+            parse_amount('abc')
+        for value in ('nan', 'inf', '-Infinity', 'sNaN'):
+            with self.assertRaises(ValueError):
+                parse_amount(value)
+
+    def test_bad_rows_are_reported(self):
+        """Testa que linhas inválidas são rejeitadas sem interromper a importação."""
+        path = self._write('dados.csv', (
+            "type,amount,date,category,description\n"
+            "receita,1000,2025-01-05,Salário,Pagamento\n"
+            "despesa,-5,2025-01-06,Lazer,Valor negativo\n"
+            "despesa,abc,2025-01-07,Lazer,Valor inválido\n"
+            "despesa,30.5,2025-13-01,Lazer,Data inválida\n"
+            "despesa,20,2025-01-08,Lazer,Cinema\n"
+        ))
+        service = TransactionService(FileHandler(self.temp_file))
+        result = ImportService(service, chunk_size=2).import_csv(path)
+
+        self.assertEqual(result['imported'], 2)
+        self.assertEqual(result['rejected'], 3)
+        self.assertEqual([line for line, _ in result['errors']], [3, 4, 5])
+        self.assertEqual(service.get_balance(), 980.0)
+        self.assertEqual(TransactionService(FileHandler(self.temp_file)).get_balance(), 980.0)
+
+    def test_non_finite_amounts_are_rejected(self):
+        """Testa que 'nan' e 'inf' são rejeitados como valores inválidos, linha a linha."""
+        path = self._write('dados.csv', (
+            "type,amount,date\n"
+            "receita,100,2025-01-05\n"
+            "despesa,nan,2025-01-06\n"
+            ",inf,2025-01-07\n"
+            "despesa,40,2025-01-08\n"
+        ))
+        service = TransactionService(FileHandler(self.temp_file))
+        result = ImportService(service, chunk_size=1).import_csv(path)
+
+        self.assertEqual((result['imported'], result['rejected']), (2, 2))
+        self.assertEqual([line for line, _ in result['errors']], [3, 4])
+        self.assertEqual(service.get_balance(), 60.0)
+
+    def test_column_mapping_and_signed_amounts(self):
+        """Testa o mapeamento de colunas e o tipo deduzido pelo sinal."""
+        path = self._write('banco.csv', (
+            "Data;Valor;Histórico\n"
+            "05/01/2025;3.500,00;Salário\n"
+            "10/01/2025;-52,30;Supermercado\n"
+        ))
+        rows = list(read_csv(path, columns={'date': 'Data', 'amount': 'Valor',
+                                            'description': 'Histórico'},
+                             delimiter=';', date_format='%d/%m/%Y'))
+
+        self.assertEqual(rows[1][1]['type'], 'despesa')
+        self.assertEqual(rows[1][1]['date'], '2025-01-10')
+
+        service = TransactionService(FileHandler(self.temp_file))
+        result = ImportService(service).import_rows(rows)
+
+        self.assertEqual(result['imported'], 2)
+        self.assertEqual(service.get_balance(), 3447.7)
+
+    def test_ofx(self):
+        """Testa a leitura de um extrato OFX (SGML)."""
+        path = self._write('extrato.ofx', OFX_SGML)
+        rows = [fields for _, fields in read_ofx(path)]
+
+        self.assertEqual([(r['type'], r['date'], r['description']) for r in rows], [
+            ('despesa', '2025-01-10', 'Supermercado'),
+            ('receita', '2025-01-05', 'Empresa'),
+        ])
+
+    def test_single_rewrite_per_import(self):
+        """Testa que o arquivo JSON é regravado uma única vez por importação."""
+        path = self._write('muitas.csv', "type,amount,date\n" + "".join(
+            f"despesa,{i + 1},2025-01-{i % 28 + 1:02d}\n" for i in range(50)
+        ))
+        file_handler = FileHandler(self.temp_file)
+        service = TransactionService(file_handler)
+        saves = []
+        original_save = file_handler.save_data
+        file_handler.save_data = lambda data: (saves.append(1), original_save(data))
+
+        result = ImportService(service, chunk_size=10).import_csv(path)
+
+        self.assertEqual(result['imported'], 50)
+        self.assertEqual(len(saves), 1)
+
+    def test_journal_import_without_loading(self):
+        """Testa a importação em backends com journal sem carregar a conta."""
+        path = self._write('dados.csv', "type,amount,date\n" + "receita,10,2025-01-01\n" * 3)
+        file_handler = JournalFileHandler(self.temp_file, compact_threshold=100)
+        service = TransactionService(file_handler, lazy_load=True)
+
+        ImportService(service, chunk_size=2).import_csv(path)
+
+        self.assertIsNone(service._account)
+        self.assertEqual(service.get_balance(), 30.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,88 @@
+import io
+import unittest
+from unittest.mock import patch
+
+from models.transaction import Transaction
+from services.transaction_service import TransactionSelection
+from ui.pager import TransactionPager
+
+
+class TestTransactionPager(unittest.TestCase):
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.transactions = [
+            Transaction(transaction_type='despesa', amount=1.0 + i, date='2025-01-01',
+                        description=f"item {i}")
+            for i in range(45)
+        ]
+        self.fetched = []
+        
+        def fetch(offset, limit):
+            self.fetched.append((offset, limit))
+            return self.transactions[offset:offset + limit]
+        
+        self.selection = TransactionSelection(lambda: len(self.transactions), fetch)
+        self.output = io.StringIO()
+        self.pager = TransactionPager(self.selection, "TESTE", page_size=20, output=self.output)
+    
+    def test_render_reads_only_current_page(self):
+        """Testa que só a página exibida é lida da seleção."""
+        text = self.pager.render_page()
+        
+        self.assertEqual(self.fetched, [(0, 20)])
+        self.assertIn("item 19", text)
+        self.assertNotIn("item 20", text)
+        self.assertIn("Página 1 de 3 (transações 1 a 20) - Total: 45 transação(ões)", text)
+    
+    def test_navigation(self):
+        """Testa os comandos de navegação."""
+        self.assertTrue(self.pager.handle_command(''))
+        self.assertEqual(self.pager.page, 1)
+        
+        self.pager.handle_command('n')
+        self.pager.handle_command('n')
+        self.assertEqual(self.pager.page, 2)
+        self.assertIn("transações 41 a 45", self.pager.render_page())
+        
+        self.pager.handle_command('p')
+        self.assertEqual(self.pager.page, 1)
+        
+        self.pager.handle_command('i 1')
+        self.assertEqual(self.pager.page, 0)
+        
+        self.pager.handle_command('x')
+        self.assertIn("Comando inválido.", self.output.getvalue())
+        
+        self.assertFalse(self.pager.handle_command('0'))
+    
+    def test_set_page_size_keeps_position(self):
+        """Testa que mudar o tamanho da página mantém a primeira transação visível."""
+        self.pager.go_to(2)
+        self.pager.handle_command('t 10')
+        
+        self.assertEqual(self.pager.page_size, 10)
+        self.assertEqual(self.pager.page, 4)
+        self.assertEqual(self.pager.page_count, 5)
+    
+    def test_empty_selection(self):
+        """Testa a exibição de uma seleção vazia, sem pedir comandos."""
+        pager = TransactionPager(TransactionSelection.from_sequence([]), "VAZIO",
+                                 output=self.output)
+        
+        with patch('builtins.input') as mock_input:
+            pager.run()
+        
+        mock_input.assert_not_called()
+        self.assertIn("Nenhuma transação encontrada.", self.output.getvalue())
+    
+    def test_run(self):
+        """Testa o laço de navegação até o usuário sair."""
+        with patch('builtins.input', side_effect=['', 'n', '0']):
+            self.pager.run()
+        
+        self.assertEqual(self.fetched, [(0, 20), (20, 20), (40, 20)])
+        self.assertEqual(self.output.getvalue().count("===== TESTE ====="), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+import os
+import tempfile
+import unittest
+
+from models.transaction import Transaction
+from services.file_handler import FileHandler
+from services.partitioned_file_handler import PartitionedFileHandler
+from services.query import TransactionQuery
+from services.sqlite_handler import SQLiteHandler
+from services.text_index import TextIndex, normalize
+from services.transaction_service import TransactionService
+from services.value_index import ValueIndex
+
+
+def _sample_transactions():
+    """Cria 120 transações variadas, fora de ordem cronológica."""
+    categories = ['Mercado', 'Aluguel', 'Lazer', '']
+    return [
+        Transaction(
+            transaction_type='receita' if i % 5 == 0 else 'despesa',
+            amount=10.0 + (i * 7) % 300,
+            date=f"2025-{(i * 5) % 12 + 1:02d}-{i % 28 + 1:02d}",
+            category=categories[i % 4],
+            description=f"Compra {i} no Açougue" if i % 6 == 0 else f"Lançamento {i}"
+        )
+        for i in range(120)
+    ]
+
+
+class TestTransactionQuery(unittest.TestCase):
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.transactions = _sample_transactions()
+        self.service = TransactionService(
+            FileHandler(os.path.join(self.temp_dir.name, 'test_data.json')))
+        self.service.add_transactions(self.transactions)
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def _expected(self, query):
+        """Filtra as transações por força bruta, verificando todos os filtros."""
+        predicate = query.predicate()
+        return [t.to_dict() for t in self.transactions if predicate is None or predicate(t)]
+
+    def _queries(self):
+        return [
+            TransactionQuery(),
+            TransactionQuery('2025-05-01', '2025-05-31'),
+            TransactionQuery(transaction_type='despesa', category='Mercado'),
+            TransactionQuery('2025-03-01', '2025-08-31', 'despesa', 'Lazer'),
+            TransactionQuery(min_amount=100, max_amount=150.5),
+            TransactionQuery(end_date='2025-06-30', text='açougue'),
+            TransactionQuery(category='', min_amount=200),
+            TransactionQuery(category='Inexistente'),
+            TransactionQuery(text='LANÇA 1'),
+            TransactionQuery(transaction_type='receita', text='comp', prefix=True),
+            TransactionQuery(text='ompra', prefix=True),
+        ]
+
+    def test_invalid_queries(self):
+        """Testa a validação dos filtros."""
+        with self.assertRaises(ValueError):
+            TransactionQuery(transaction_type='investimento')
+        with self.assertRaises(ValueError):
+            TransactionQuery(min_amount=50, max_amount=10)
+        with self.assertRaises(ValueError):
+            TransactionQuery(start_date='2025-13-01')
+
+    def test_planner_picks_most_selective_index(self):
+        """Testa a escolha do índice com menos candidatas."""
+        plan = self.service.plan_query(TransactionQuery('2025-05-01', '2025-05-03', 'despesa'))
+        self.assertEqual(plan.index, 'date')
+        self.assertIsNotNone(plan.predicate)
+
+        plan = self.service.plan_query(TransactionQuery('2025-01-01', '2025-12-31', 'despesa',
+                                                        'Aluguel'))
+        self.assertEqual(plan.index, 'category')
+        self.assertEqual(plan.estimated_rows, 30)
+
+        plan = self.service.plan_query(TransactionQuery(transaction_type='receita'))
+        self.assertEqual((plan.index, plan.estimated_rows, plan.predicate), ('type', 24, None))
+
+        self.assertEqual(self.service.plan_query(TransactionQuery(min_amount=5)).index, 'scan')
+        self.assertEqual(self.service.plan_query(TransactionQuery(text='acougue')).index, 'text')
+
+    def test_results_match_full_scan(self):
+        """Testa que o resultado não depende do índice escolhido."""
+        for query in self._queries():
+            with self.subTest(plan=self.service.plan_query(query)):
+                found = [t.to_dict() for t in self.service.find_transactions(query)]
+                self.assertEqual(found, self._expected(query))
+                self.assertEqual(len(self.service.select_query(query)), len(found))
+
+    def test_indexes_follow_new_transactions(self):
+        """Testa que os índices incluem transações adicionadas depois da carga."""
+        self.service.add_transaction(Transaction('despesa', 42.0, '2025-05-02', 'Mercado', 'Feira'))
+        query = TransactionQuery('2025-05-01', '2025-05-31', 'despesa', 'Mercado')
+
+        self.assertEqual(self.service.find_transactions(query)[-1].description, 'Feira')
+
+    def test_columnar_and_backends(self):
+        """Testa as mesmas consultas no armazenamento colunar e nos backends consultáveis."""
+        sqlite_handler = SQLiteHandler(os.path.join(self.temp_dir.name, 'test_data.sqlite3'))
+        self.addCleanup(sqlite_handler.close)
+        services = [
+            TransactionService(FileHandler(os.path.join(self.temp_dir.name, 'test_data.json')),
+                               columnar=True),
+            TransactionService(sqlite_handler),
+            TransactionService(PartitionedFileHandler(os.path.join(self.temp_dir.name, 'parts'))),
+        ]
+        services[1].add_transactions(self.transactions)
+        services[2].add_transactions(self.transactions)
+
+        for service in services:
+            for query in self._queries():
+                with self.subTest(service=type(service.file_handler).__name__,
+                                  plan=service.plan_query(query)):
+                    # Os backends devolvem as transações em ordem de inserção
+                    found = [t.to_dict() for t in service.find_transactions(query)]
+                    self.assertEqual(found, self._expected(query))
+
+                    selection = service.select_query(query)
+                    self.assertEqual(len(selection), len(found))
+                    self.assertEqual([t.to_dict() for t in selection.page(2, 3)], found[2:5])
+
+    def test_search_transactions(self):
+        """Testa a busca sem diferenciar maiúsculas e acentos, por trecho e por prefixo."""
+        self.service.add_transactions([
+            Transaction('despesa', 80.0, '2025-05-03', 'Mercado', 'Compras da semana'),
+            Transaction('despesa', 35.0, '2025-05-04', 'Alimentação', 'Supermercado Extra'),
+            Transaction('despesa', 12.0, '2025-05-05', 'Lazer', 'Cinema'),
+        ])
+
+        found = self.service.search_transactions('MERCADO')
+        self.assertEqual([t.description for t in found][-2:],
+                         ['Compras da semana', 'Supermercado Extra'])
+        self.assertEqual(len(found), 32)
+
+        found = self.service.search_transactions('mercado', prefix=True)
+        self.assertNotIn('Supermercado Extra', [t.description for t in found])
+
+        found = self.service.search_transactions('alimentacao extra')
+        self.assertEqual([t.description for t in found], ['Supermercado Extra'])
+
+        self.assertEqual(self.service.search_transactions('!!'),
+                         self.service.get_all_transactions())
+
+
+class TestTextIndex(unittest.TestCase):
+    def test_normalize(self):
+        """Testa a remoção de acentos e de maiúsculas."""
+        self.assertEqual(normalize('Açaí na PRAÇA'), 'acai na praca')
+        self.assertEqual(normalize('Feira'), 'feira')
+
+    def test_insert_and_discard(self):
+        """Testa a atualização do índice e do vocabulário ordenado."""
+        index = TextIndex.from_transactions([
+            Transaction('despesa', 10.0, '2025-01-01', 'Mercado', 'Feira'),
+            Transaction('despesa', 10.0, '2025-01-02', 'Saúde', 'Farmácia'),
+        ])
+        index.insert(Transaction('despesa', 10.0, '2025-01-03', 'Mercado', 'Fármacos'), 2)
+
+        self.assertEqual(index.search('farma', prefix=True), [1, 2])
+        self.assertEqual(index.vocabulary, sorted(index.vocabulary))
+
+        index.discard_from(2)
+        self.assertEqual(index.search('farma'), [1])
+        self.assertNotIn('farmacos', index.vocabulary)
+
+
+class TestValueIndex(unittest.TestCase):
+    def test_lookup_and_discard(self):
+        """Testa a consulta e a remoção das posições finais."""
+        index = ValueIndex.from_values(['a', 'b', 'a', 'c', 'a'])
+
+        self.assertEqual(index.lookup('a'), [0, 2, 4])
+        self.assertEqual(index.count('z'), 0)
+
+        index.discard_from(3)
+        self.assertEqual(index.lookup('a'), [0, 2])
+        self.assertEqual(index.count('c'), 0)
+
+        index.insert('c', 3)
+        self.assertEqual(index.lookup('c'), [3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+import os
+import tempfile
+import unittest
+from itertools import islice
+from unittest import mock
+
+from models.recurring import RecurringRule
+from models.transaction import Transaction
+from services.file_handler import FileHandler
+from services.recurring_service import RecurringService
+from services.report_service import ReportService
+from services.transaction_service import TransactionService
+
+
+class TestRecurringRule(unittest.TestCase):
+    def test_monthly_occurrences(self):
+        """Testa as ocorrências mensais, inclusive nos meses mais curtos."""
+        rule = RecurringRule('despesa', 100.0, '2024-01-31', end_date='2024-05-31')
+
+        self.assertEqual(list(rule.occurrences()),
+                         ['2024-01-31', '2024-02-29', '2024-03-31', '2024-04-30', '2024-05-31'])
+        self.assertEqual(list(rule.occurrences('2024-03-01', '2024-04-15')), ['2024-03-31'])
+
+        quarterly = RecurringRule('receita', 10.0, '2024-01-10', 'monthly', interval=3)
+        self.assertEqual(list(quarterly.occurrences('2024-04-11', '2025-01-10')),
+                         ['2024-07-10', '2024-10-10', '2025-01-10'])
+
+    def test_daily_and_weekly_occurrences(self):
+        """Testa as ocorrências a cada N dias e semanais."""
+        every_ten_days = RecurringRule('despesa', 5.0, '2025-01-01', 'daily', interval=10)
+        weekly = RecurringRule('despesa', 5.0, '2025-01-06', 'weekly', end_date='2025-01-27')
+
+        self.assertEqual(list(every_ten_days.occurrences('2025-01-05', '2025-02-01')),
+                         ['2025-01-11', '2025-01-21', '2025-01-31'])
+        self.assertEqual(list(weekly.occurrences('2025-01-01')),
+                         ['2025-01-06', '2025-01-13', '2025-01-20', '2025-01-27'])
+
+    def test_occurrences_are_lazy(self):
+        """Testa que só as ocorrências do período são geradas."""
+        rule = RecurringRule('despesa', 1.0, '1950-01-01', 'daily')
+
+        # A primeira ocorrência do período é calculada sem percorrer 75 anos
+        self.assertEqual(len(list(rule.occurrences('2025-03-01', '2025-03-31'))), 31)
+        # Sem data final, o gerador é infinito
+        self.assertEqual(list(islice(rule.occurrences('2025-12-31'), 2)), ['2025-12-31', '2026-01-01'])
+
+    def test_pending_skips_posted(self):
+        """Testa que as ocorrências já lançadas não são geradas de novo."""
+        rule = RecurringRule('despesa', 1.0, '2025-01-05', posted_until='2025-02-05')
+
+        self.assertEqual(list(rule.pending(end_date='2025-04-30')), ['2025-03-05', '2025-04-05'])
+        self.assertEqual(list(rule.pending('2025-04-01', '2025-04-30')), ['2025-04-05'])
+
+    def test_validation(self):
+        """Testa as validações da regra."""
+        with self.assertRaises(ValueError):
+            RecurringRule('investimento', 1.0, '2025-01-01')
+        with self.assertRaises(ValueError):
+            RecurringRule('despesa', 1.0, '2025-01-01', frequency='yearly')
+        with self.assertRaises(ValueError):
+            RecurringRule('despesa', 1.0, '2025-01-01', interval=0)
+        with self.assertRaises(ValueError):
+            RecurringRule('despesa', 1.0, '2025-01-01', end_date='2024-12-31')
+
+    def test_to_dict_and_from_dict(self):
+        """Testa a conversão de e para dicionário."""
+        rule = RecurringRule('receita', 3500.0, '2025-01-05', 'weekly', 2, '2025-12-31',
+                             'Salário', 'Pagamento', rule_id=4, posted_until='2025-01-19')
+
+        self.assertEqual(RecurringRule.from_dict(rule.to_dict()).to_dict(), rule.to_dict())
+
+
+class TestRecurringService(unittest.TestCase):
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_file = os.path.join(self.temp_dir.name, 'test_data.json')
+        self.rules_file = os.path.join(self.temp_dir.name, 'recurring.json')
+
+        self.transaction_service = TransactionService(FileHandler(self.temp_file))
+        self.transaction_service.add_transaction(Transaction('receita', 1000.0, '2025-01-02'))
+        self.recurring_service = RecurringService(self.transaction_service, self.rules_file)
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def test_post_due_posts_each_occurrence_once(self):
+        """Testa o lançamento das ocorrências vencidas, uma única vez cada."""
+        self.recurring_service.add_rule(RecurringRule('despesa', 300.0, '2025-01-05',
+                                                      category='Moradia', description='Aluguel'))
+
+        posted = self.recurring_service.post_due('2025-03-10')
+
+        self.assertEqual([t.date for t in posted], ['2025-01-05', '2025-02-05', '2025-03-05'])
+        self.assertEqual(self.transaction_service.get_balance(), 100.0)
+        self.assertEqual(self.recurring_service.post_due('2025-03-10'), [])
+
+        # Outra instância (ex: outro processo) vê as ocorrências já lançadas
+        other = RecurringService(TransactionService(FileHandler(self.temp_file)), self.rules_file)
+        self.assertEqual([t.date for t in other.post_due('2025-04-05')], ['2025-04-05'])
+        self.assertEqual(other.transaction_service.get_balance(), -200.0)
+
+    def test_post_due_survives_failures(self):
+        """Testa que uma falha ao gravar as regras ou as transações não duplica lançamentos."""
+        self.recurring_service.add_rule(RecurringRule('despesa', 300.0, '2025-01-05'))
+
+        with mock.patch.object(RecurringService, '_save', side_effect=OSError("disco cheio")):
+            with self.assertRaises(OSError):
+                self.recurring_service.post_due('2025-02-10')
+
+        self.assertEqual(self.transaction_service.get_balance(), 1000.0)
+
+        with mock.patch.object(self.transaction_service, 'add_transactions',
+                               side_effect=OSError("disco cheio")):
+            with self.assertRaises(OSError):
+                self.recurring_service.post_due('2025-02-10')
+
+        reloaded = RecurringService(self.transaction_service, self.rules_file)
+        self.assertIsNone(reloaded.get_rules()[0].posted_until)
+
+        posted = reloaded.post_due('2025-02-10')
+        self.assertEqual([t.date for t in posted], ['2025-01-05', '2025-02-05'])
+        self.assertEqual(reloaded.post_due('2025-02-10'), [])
+        self.assertEqual(self.transaction_service.get_balance(), 400.0)
+
+    def test_add_and_remove_rules(self):
+        """Testa o cadastro e a remoção de regras."""
+        first = self.recurring_service.add_rule(RecurringRule('despesa', 10.0, '2025-01-01'))
+        second = self.recurring_service.add_rule(RecurringRule('receita', 20.0, '2025-01-01'))
+
+        self.assertEqual((first.rule_id, second.rule_id), (1, 2))
+
+        self.recurring_service.remove_rule(1)
+        reloaded = RecurringService(self.transaction_service, self.rules_file)
+        self.assertEqual([rule.rule_id for rule in reloaded.get_rules()], [2])
+
+        with self.assertRaises(ValueError):
+            reloaded.remove_rule(1)
+
+    def test_projected_reports(self):
+        """Testa os relatórios com as ocorrências previstas do mês."""
+        report_service = ReportService(self.transaction_service,
+                                       recurring_service=self.recurring_service)
+        empty = report_service.generate_monthly_report(2025, 6)
+        self.assertEqual(empty['projected_transactions'], [])
+
+        # Cadastrar uma regra esvazia o cache de relatórios
+        self.recurring_service.add_rule(RecurringRule('despesa', 300.0, '2025-01-05',
+                                                      category='Moradia'))
+        self.recurring_service.add_rule(RecurringRule('despesa', 20.0, '2025-06-01', 'weekly'))
+        self.recurring_service.post_due('2025-01-31')
+
+        report = report_service.generate_monthly_report(2025, 6)
+
+        self.assertEqual(report['total_expense'], 400.0)
+        self.assertEqual(report['expense_by_category'], {'Moradia': 300.0, 'Sem categoria': 100.0})
+        self.assertEqual(report['transactions'], [])
+        self.assertEqual([t.date for t in report['projected_transactions']],
+                         ['2025-06-01', '2025-06-05', '2025-06-08', '2025-06-15', '2025-06-22',
+                          '2025-06-29'])
+
+        # Ocorrências lançadas saem das previstas e entram nas transações
+        january = report_service.generate_monthly_report(2025, 1)
+        self.assertEqual(january['total_expense'], 300.0)
+        self.assertEqual(january['projected_transactions'], [])
+
+    def test_projected_balance(self):
+        """Testa o saldo previsto em uma data e a sua evolução."""
+        self.recurring_service.add_rule(RecurringRule('despesa', 300.0, '2025-01-05'))
+        self.recurring_service.add_rule(RecurringRule('receita', 50.0, '2025-01-01', 'daily',
+                                                      interval=10, end_date='2025-01-31'))
+        self.recurring_service.post_due('2025-01-05')
+
+        # Lançadas: 01/01 (+50) e 05/01 (-300); previstas: 11, 21 e 31/01 (+50 cada) e 05/02
+        self.assertEqual(self.transaction_service.get_balance(), 750.0)
+        self.assertEqual(self.recurring_service.get_projected_balance('2025-01-31'), 900.0)
+        self.assertEqual(self.recurring_service.get_projected_balance('2025-03-05'), 300.0)
+
+        series = self.recurring_service.get_projected_series('2025-01-01', '2025-02-10', step_days=10)
+        self.assertEqual(series, [('2025-01-01', 50.0), ('2025-01-11', 800.0),
+                                  ('2025-01-21', 850.0), ('2025-01-31', 900.0),
+                                  ('2025-02-10', 600.0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
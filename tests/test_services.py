@@ -1,12 +1,18 @@
 import unittest
 import os
+import json
 import tempfile
+import time
 from datetime import datetime
+from unittest.mock import patch
 
 from models.transaction import Transaction
+from services.balance_index import BalanceIndex
 from services.file_handler import FileHandler
 from services.transaction_service import TransactionService
 from services.report_service import ReportService
+from services.profiler import profiler
+from services.sqlite_handler import SQLiteHandler
 
 
 class TestFileHandler(unittest.TestCase):
@@ -115,6 +121,141 @@ class TestTransactionService(unittest.TestCase):
         self.assertEqual(transactions[0].date, '2025-01-01')
         self.assertEqual(transactions[1].date, '2025-02-01')
     
+    def test_get_transactions_by_period_backdated(self):
+        """Testa a consulta por período com transações retroativas."""
+        for date in ['2025-03-10', '2025-01-05', '2025-02-20', '2024-12-31', '2025-02-01']:
+            self.transaction_service.add_transaction(Transaction(
+                transaction_type='despesa',
+                amount=10.0,
+                date=date
+            ))
+        
+        transactions = self.transaction_service.get_transactions_by_period(
+            '2025-01-01', '2025-02-20'
+        )
+        
+        # Resultado na ordem de inserção
+        self.assertEqual([t.date for t in transactions], ['2025-01-05', '2025-02-20', '2025-02-01'])
+        
+        # Índice reconstruído na carga continua consistente
+        reloaded = TransactionService(FileHandler(self.temp_file))
+        transactions = reloaded.get_transactions_by_period('2024-12-31', '2025-01-31')
+        self.assertEqual([t.date for t in transactions], ['2025-01-05', '2024-12-31'])
+    
+    def test_verify(self):
+        """Testa a verificação dos dados armazenados."""
+        self.transaction_service.add_transaction(Transaction(
+            transaction_type='receita',
+            amount=100.0,
+            date='2025-01-01'
+        ))
+        self.assertEqual(self.transaction_service.verify(), [])
+        
+        data = self.file_handler.load_data()
+        data['transactions'].append({'type': 'receita', 'amount': -5.0, 'date': '2025-01-02',
+                                     'category': '', 'description': ''})
+        data['transactions'].append({'type': 'investimento', 'amount': 5.0, 'date': '2025-01-02',
+                                     'category': '', 'description': ''})
+        self.file_handler.save_data(data)
+        
+        # A carga confiável não revalida; a verificação aponta os problemas
+        service = TransactionService(FileHandler(self.temp_file))
+        problems = service.verify()
+        
+        self.assertEqual(len(service.get_all_transactions()), 3)
+        self.assertEqual(len(problems), 2)
+        self.assertTrue(problems[0].startswith("Transação 2:"))
+        self.assertTrue(problems[1].startswith("Transação 3:"))
+    
+    def test_columnar_service(self):
+        """Testa o serviço com armazenamento colunar em memória."""
+        self.transaction_service.add_transactions([
+            Transaction(transaction_type='receita', amount=100.0, date='2025-01-10'),
+            Transaction(transaction_type='despesa', amount=40.0, date='2025-02-10'),
+        ])
+        
+        service = TransactionService(FileHandler(self.temp_file), columnar=True)
+        service.add_transaction(Transaction(transaction_type='receita', amount=5.0, date='2025-01-20'))
+        
+        transactions = service.get_transactions_by_period('2025-01-01', '2025-01-31')
+        self.assertEqual([t.amount for t in transactions], [100.0, 5.0])
+        self.assertEqual(service.get_balance(), 65.0)
+    
+    def test_balance_at_date(self):
+        """Testa o saldo ao final de um dia, com transações retroativas."""
+        self.transaction_service.add_transactions([
+            Transaction(transaction_type='receita', amount=1000.0, date='2025-01-15'),
+            Transaction(transaction_type='despesa', amount=300.0, date='2025-01-20'),
+        ])
+        
+        self.assertEqual(self.transaction_service.get_balance_at('2025-01-14'), 0.0)
+        self.assertEqual(self.transaction_service.get_balance_at('2025-01-15'), 1000.0)
+        self.assertEqual(self.transaction_service.get_balance_at('2025-03-01'), 700.0)
+        
+        # Transações retroativas e fora da faixa já coberta pelo índice
+        self.transaction_service.add_transaction(Transaction(
+            transaction_type='despesa', amount=50.0, date='2025-01-16'))
+        self.transaction_service.add_transaction(Transaction(
+            transaction_type='receita', amount=20.0, date='2023-06-01'))
+        
+        self.assertEqual(self.transaction_service.get_balance_at('2024-12-31'), 20.0)
+        self.assertEqual(self.transaction_service.get_balance_at('2025-01-16'), 970.0)
+        self.assertEqual(self.transaction_service.get_balance_at('2025-01-20'), 670.0)
+        
+        # O índice é reconstruído na carga (também no armazenamento colunar)
+        for columnar in (False, True):
+            reloaded = TransactionService(FileHandler(self.temp_file), columnar=columnar)
+            self.assertEqual(reloaded.get_balance_at('2025-01-16'), 970.0)
+    
+    def test_balance_series(self):
+        """Testa a evolução do saldo em um período."""
+        self.transaction_service.add_transactions([
+            Transaction(transaction_type='receita', amount=100.0, date='2025-01-02'),
+            Transaction(transaction_type='despesa', amount=30.0, date='2025-01-04'),
+        ])
+        
+        series = self.transaction_service.get_balance_series('2025-01-01', '2025-01-05', step_days=2)
+        
+        self.assertEqual(series, [('2025-01-01', 0.0), ('2025-01-03', 100.0), ('2025-01-05', 70.0)])
+        
+        with self.assertRaises(ValueError):
+            self.transaction_service.get_balance_series('2025-01-05', '2025-01-01')
+        with self.assertRaises(ValueError):
+            self.transaction_service.get_balance_series('2025-01-01', '2025-01-05', step_days=0)
+    
+    def test_balance_index(self):
+        """Testa as somas de prefixo da árvore de Fenwick."""
+        index = BalanceIndex.from_deltas({10: 5, 12: -2, 13: 7})
+        
+        self.assertEqual([index.prefix(day) for day in range(9, 15)], [0, 5, 5, 3, 10, 10])
+        
+        index.add(11, 1)
+        index.add(3, 100)
+        index.add(40, -10)
+        
+        self.assertEqual(index.daily_deltas(), {3: 100, 10: 5, 11: 1, 12: -2, 13: 7, 40: -10})
+        self.assertEqual([index.prefix(day) for day in (2, 3, 11, 13, 39, 40, 100)],
+                         [0, 100, 106, 111, 111, 101, 101])
+        self.assertEqual(index.total, 101)
+    
+    def test_balance_index_growth_is_amortized(self):
+        """Testa que datas cada vez mais antigas ou mais novas reconstroem a árvore poucas vezes."""
+        index = BalanceIndex.from_deltas({5000: 1})
+        
+        with patch.object(BalanceIndex, '_rebuild', autospec=True,
+                          side_effect=BalanceIndex._rebuild) as rebuild:
+            for day in range(4999, 3999, -1):
+                index.add(day, 1)
+            for day in range(5001, 6001):
+                index.add(day, 2)
+        
+        self.assertLessEqual(rebuild.call_count, 12)
+        self.assertEqual(index.prefix(3999), 0)
+        self.assertEqual(index.prefix(4499), 500)
+        self.assertEqual(index.prefix(5000), 1001)
+        self.assertEqual(index.prefix(6000), 3001)
+        self.assertEqual(index.total, 3001)
+    
     def test_get_transactions_by_type(self):
         """Testa a obtenção de transações por tipo."""
         # Adiciona transações de diferentes tipos
@@ -144,6 +285,147 @@ class TestTransactionService(unittest.TestCase):
         # Obtém despesas
         despesas = self.transaction_service.get_transactions_by_type('despesa')
         self.assertEqual(len(despesas), 1)
+    
+    def test_add_transactions_batch(self):
+        """Testa a adição de um lote de transações com uma única gravação."""
+        batch = [
+            Transaction(transaction_type='receita', amount=100.0, date='2025-01-01'),
+            {'type': 'despesa', 'amount': 30.0, 'date': '2025-01-02',
+             'category': 'Mercado', 'description': ''},
+        ]
+        
+        with patch.object(self.file_handler, 'save_data', wraps=self.file_handler.save_data) as save:
+            added = self.transaction_service.add_transactions(batch)
+        
+        self.assertEqual(added, 2)
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual(self.transaction_service.get_balance(), 70.0)
+        self.assertEqual(len(self.file_handler.load_data()['transactions']), 2)
+    
+    def test_add_transactions_invalid_batch(self):
+        """Testa que um lote com transação inválida não altera nada."""
+        batch = [
+            Transaction(transaction_type='receita', amount=100.0, date='2025-01-01'),
+            {'type': 'investimento', 'amount': 30.0, 'date': '2025-01-02',
+             'category': '', 'description': ''},
+        ]
+        
+        with self.assertRaises(ValueError):
+            self.transaction_service.add_transactions(batch)
+        
+        self.assertEqual(self.transaction_service.get_balance(), 0.0)
+        self.assertEqual(self.transaction_service.get_all_transactions(), [])
+        self.assertEqual(self.file_handler.load_data(), {})
+    
+    def test_add_transactions_rollback_on_save_error(self):
+        """Testa que uma falha na gravação desfaz o lote em memória."""
+        batch = [Transaction(transaction_type='receita', amount=100.0, date='2025-01-01')]
+        
+        with patch.object(self.file_handler, 'save_data', side_effect=OSError("disco cheio")):
+            with self.assertRaises(OSError):
+                self.transaction_service.add_transactions(batch)
+        
+        self.assertEqual(self.transaction_service.get_balance(), 0.0)
+        self.assertEqual(self.transaction_service.get_all_transactions(), [])
+    
+    def test_select_transactions(self):
+        """Testa a seleção paginada com filtros, em memória e no SQLite."""
+        batch = [
+            Transaction(transaction_type='despesa' if i % 3 else 'receita', amount=10.0 + i,
+                        date=f"2025-01-{i + 1:02d}", category='Mercado' if i % 2 else 'Outros')
+            for i in range(25)
+        ]
+        sqlite_handler = SQLiteHandler(os.path.join(self.temp_dir.name, 'test_data.sqlite3'))
+        self.addCleanup(sqlite_handler.close)
+        
+        for service in (self.transaction_service, TransactionService(sqlite_handler, lazy_load=True)):
+            service.add_transactions(batch)
+            
+            selection = service.select_transactions(transaction_type='despesa')
+            expected = service.get_transactions_by_type('despesa')
+            self.assertEqual(len(selection), len(expected))
+            self.assertEqual([t.to_dict() for t in selection.page(5, 5)],
+                             [t.to_dict() for t in expected[5:10]])
+            
+            selection = service.select_transactions('2025-01-10', '2025-01-20', category='Mercado')
+            self.assertEqual([t.date for t in selection.page(0, 100)],
+                             [f"2025-01-{d}" for d in (10, 12, 14, 16, 18, 20)])
+            self.assertEqual(len(selection), 6)
+            self.assertEqual(selection.page(10, 5), [])
+            
+            self.assertEqual(len(service.select_transactions()), 25)
+
+
+
+class TestWriteBehind(unittest.TestCase):
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_file = os.path.join(self.temp_dir.name, 'test_data.json')
+        self.file_handler = FileHandler(self.temp_file)
+    
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+    
+    def _service(self, **options):
+        service = TransactionService(self.file_handler, write_behind=True, **options)
+        self.addCleanup(service.close)
+        return service
+    
+    def _wait_for_flush(self, service):
+        """Espera a thread de fundo gravar as transações pendentes."""
+        deadline = time.monotonic() + 5
+        while service.pending_writes and time.monotonic() < deadline:
+            time.sleep(0.01)
+    
+    def _stored_count(self):
+        return len(self.file_handler.load_data().get('transactions', []))
+    
+    def test_writes_are_deferred_until_flush(self):
+        """Testa que as transações só são gravadas no flush."""
+        service = self._service(flush_interval=60)
+        service.add_transaction(Transaction('receita', 100.0, '2025-01-01'))
+        service.add_transactions([Transaction('despesa', 30.0, '2025-01-02')])
+        
+        self.assertEqual(service.pending_writes, 2)
+        self.assertEqual(service.get_balance(), 70.0)
+        self.assertEqual(self._stored_count(), 0)
+        
+        service.flush()
+        self.assertEqual(service.pending_writes, 0)
+        self.assertEqual(self.file_handler.load_data()['balance'], 70.0)
+    
+    def test_background_flush(self):
+        """Testa a gravação pela thread de fundo, por limite e por intervalo."""
+        service = self._service(flush_interval=60, flush_threshold=3)
+        for day in (1, 2, 3):
+            service.add_transaction(Transaction('receita', 10.0, f"2025-01-0{day}"))
+        
+        self._wait_for_flush(service)
+        self.assertEqual(self._stored_count(), 3)
+        
+        service = self._service(flush_interval=0.05)
+        service.add_transaction(Transaction('receita', 10.0, '2025-01-04'))
+        
+        self._wait_for_flush(service)
+        self.assertEqual(self._stored_count(), 4)
+    
+    def test_flush_failure_is_reported(self):
+        """Testa que uma falha de gravação é informada e as pendências mantidas."""
+        service = self._service(flush_interval=60)
+        service.add_transaction(Transaction('receita', 100.0, '2025-01-01'))
+        
+        with patch.object(self.file_handler, 'save_data', side_effect=OSError("disco cheio")):
+            with self.assertRaises(OSError):
+                service.close()
+        
+        self.assertIsInstance(service.pop_flush_error(), OSError)
+        self.assertIsNone(service.pop_flush_error())
+        self.assertEqual(service.pending_writes, 1)
+        
+        service.close()
+        self.assertEqual(self._stored_count(), 1)
 
 
 class TestReportService(unittest.TestCase):
@@ -210,6 +492,20 @@ class TestReportService(unittest.TestCase):
         # Verifica as transações incluídas
         self.assertEqual(len(report['transactions']), 3)
     
+    def test_monthly_report_excludes_next_month(self):
+        """Testa que o relatório mensal não inclui o primeiro dia do mês seguinte."""
+        self.transaction_service.add_transaction(Transaction(
+            transaction_type='despesa',
+            amount=80.0,
+            date='2025-02-01',
+            category='Aluguel'
+        ))
+        
+        report = self.report_service.generate_monthly_report(2025, 1)
+        
+        self.assertEqual(report['total_expense'], 450.0)
+        self.assertEqual(len(report['transactions']), 3)
+    
     def test_generate_category_report(self):
         """Testa a geração de relatório por categoria."""
         # Gera relatório de despesas por categoria
@@ -218,6 +514,147 @@ class TestReportService(unittest.TestCase):
         # Verifica as categorias
         self.assertEqual(report, {'Aluguel': 300.0, 'Alimentação': 150.0})
 
+    
+    def test_generate_range_report(self):
+        """Testa a geração dos relatórios de um intervalo de meses."""
+        reports = self.report_service.generate_range_report('2024-12', '2025-03')
+        
+        self.assertEqual([r['period'] for r in reports], ['2024-12', '2025-01', '2025-02', '2025-03'])
+        self.assertEqual(reports[0]['transactions'], [])
+        self.assertEqual(reports[1]['total_expense'], 450.0)
+        self.assertEqual(reports[2]['income_by_category'], {'Freelance': 500.0})
+        
+        # Cada mês é igual ao relatório mensal correspondente
+        for report in reports:
+            year, month = (int(part) for part in report['period'].split('-'))
+            monthly = self.report_service.generate_monthly_report(year, month)
+            self.assertEqual(report['balance'], monthly['balance'])
+            self.assertEqual(report['transactions'], monthly['transactions'])
+        
+        with self.assertRaises(ValueError):
+            self.report_service.generate_range_report('2025-03', '2025-01')
+    
+    def test_reports_follow_new_transactions(self):
+        """Testa que os totais agregados acompanham as novas transações."""
+        self.transaction_service.add_transaction(Transaction(
+            transaction_type='despesa',
+            amount=20.0,
+            date='2025-01-03'
+        ))
+        self.transaction_service.add_transaction(Transaction(
+            transaction_type='despesa',
+            amount=30.0,
+            date='2025-01-28',
+            category='Aluguel'
+        ))
+        
+        report = self.report_service.generate_monthly_report(2025, 1)
+        self.assertEqual(report['expense_by_category'],
+                         {'Aluguel': 330.0, 'Alimentação': 150.0, 'Sem categoria': 20.0})
+        self.assertEqual(report['total_expense'], 500.0)
+        
+        # Os totais reconstruídos na carga são iguais aos mantidos incrementalmente
+        for columnar in (False, True):
+            reloaded = TransactionService(FileHandler(self.temp_file), columnar=columnar)
+            self.assertEqual(reloaded.aggregates.monthly, self.transaction_service.aggregates.monthly)
+            self.assertEqual(reloaded.aggregates.by_type, self.transaction_service.aggregates.by_type)
+    
+    def test_report_cache(self):
+        """Testa o cache de relatórios e a invalidação apenas dos relatórios afetados."""
+        january = self.report_service.generate_monthly_report(2025, 1)
+        february = self.report_service.generate_monthly_report(2025, 2)
+        self.report_service.generate_range_report('2025-01', '2025-02')
+        self.report_service.generate_range_report('2025-02', '2025-03')
+        self.report_service.generate_category_report('receita')
+        self.report_service.generate_category_report('despesa')
+        
+        self.assertIs(self.report_service.generate_monthly_report(2025, 1), january)
+        self.assertEqual(self.report_service.cache_stats()['hits'], 1)
+        self.assertEqual(self.report_service.cache_stats()['misses'], 6)
+        
+        self.transaction_service.add_transaction(Transaction('despesa', 50.0, '2025-01-10'))
+        
+        # Só o mês de janeiro, o intervalo que o inclui e as despesas são recalculados
+        self.assertIs(self.report_service.generate_monthly_report(2025, 2), february)
+        self.assertNotIn(('monthly', 2025, 1), self.report_service.cache)
+        self.assertNotIn(('range', (2025, 1), (2025, 2)), self.report_service.cache)
+        self.assertIn(('range', (2025, 2), (2025, 3)), self.report_service.cache)
+        self.assertIn(('category', 'receita'), self.report_service.cache)
+        self.assertNotIn(('category', 'despesa'), self.report_service.cache)
+        
+        report = self.report_service.generate_monthly_report(2025, 1)
+        self.assertEqual(report['total_expense'], 500.0)
+        self.assertEqual(self.report_service.generate_category_report('despesa')['Sem categoria'], 50.0)
+        self.assertEqual(self.report_service.cache_stats()['invalidations'], 3)
+    
+    def test_report_cache_lru(self):
+        """Testa o descarte do relatório usado há mais tempo e a desativação do cache."""
+        report_service = ReportService(self.transaction_service, cache_size=2)
+        report_service.generate_monthly_report(2025, 1)
+        report_service.generate_monthly_report(2025, 2)
+        report_service.generate_monthly_report(2025, 1)
+        report_service.generate_monthly_report(2025, 3)
+        
+        self.assertIn(('monthly', 2025, 1), report_service.cache)
+        self.assertNotIn(('monthly', 2025, 2), report_service.cache)
+        self.assertEqual(report_service.cache_stats()['evictions'], 1)
+        
+        report_service = ReportService(self.transaction_service, cache_size=0)
+        report_service.generate_monthly_report(2025, 1)
+        report_service.generate_monthly_report(2025, 1)
+        self.assertEqual(report_service.cache_stats()['hits'], 0)
+        self.assertEqual(len(report_service.cache), 0)
+
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_file = os.path.join(self.temp_dir.name, 'test_data.json')
+        profiler.reset()
+        profiler.enable()
+    
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        profiler.disable()
+        profiler.reset()
+        self.temp_dir.cleanup()
+    
+    def test_instrumented_operations(self):
+        """Testa a coleta de chamadas, tempo e memória das operações instrumentadas."""
+        transaction_service = TransactionService(FileHandler(self.temp_file))
+        report_service = ReportService(transaction_service)
+        transaction_service.add_transaction(Transaction('receita', 100.0, '2025-01-01'))
+        report_service.generate_monthly_report(2025, 1)
+        report_service.generate_monthly_report(2025, 2)
+        
+        stats = profiler.snapshot()
+        
+        self.assertEqual(stats['ReportService.generate_monthly_report']['calls'], 2)
+        self.assertEqual(stats['TransactionService.get_transactions_by_period']['calls'], 2)
+        # Criação do arquivo vazio + gravação da transação
+        self.assertEqual(stats['FileHandler.save_data']['calls'], 2)
+        self.assertGreater(stats['TransactionService._load_account']['total_seconds'], 0)
+        self.assertIn('ReportService.generate_monthly_report', profiler.format_report())
+    
+    def test_dump(self):
+        """Testa a gravação das estatísticas em arquivo."""
+        TransactionService(FileHandler(self.temp_file))
+        output = os.path.join(self.temp_dir.name, 'profile.json')
+        
+        profiler.dump(output)
+        
+        with open(output, 'r', encoding='utf-8') as file:
+            self.assertIn('FileHandler.load_data', json.load(file))
+    
+    def test_disabled_records_nothing(self):
+        """Testa que nada é registrado com o profiler desabilitado."""
+        profiler.disable()
+        TransactionService(FileHandler(self.temp_file))
+        
+        self.assertEqual(profiler.snapshot(), {})
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
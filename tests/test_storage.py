@@ -0,0 +1,531 @@
+import unittest
+import os
+import json
+import multiprocessing
+import sqlite3
+import tempfile
+from unittest import mock
+
+from models.transaction import Transaction
+from services.binary_file_handler import BinaryFileHandler, MappedTransactions
+from services.file_handler import FileHandler
+from services.journal_file_handler import JournalFileHandler
+from services.partitioned_file_handler import PartitionedFileHandler
+from services.sqlite_handler import SQLiteHandler
+from services.storage import create_file_handler
+from services.transaction_service import TransactionService
+from services.report_service import ReportService
+
+
+class TestJournalFileHandler(unittest.TestCase):
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_file = os.path.join(self.temp_dir.name, 'test_data.json')
+        self.file_handler = JournalFileHandler(self.temp_file, compact_threshold=3)
+        self.transaction_service = TransactionService(self.file_handler)
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def _add(self, transaction_type: str, amount: float) -> None:
+        self.transaction_service.add_transaction(Transaction(
+            transaction_type=transaction_type,
+            amount=amount,
+            date='2025-01-01',
+            category='Teste'
+        ))
+
+    def test_add_transaction_appends_to_journal(self):
+        """Testa que novas transações vão para o journal sem regravar o snapshot."""
+        self._add('receita', 100.0)
+        self._add('despesa', 30.0)
+
+        with open(self.temp_file, 'r', encoding='utf-8') as file:
+            snapshot = json.load(file)
+
+        self.assertNotIn('transactions', snapshot)
+        self.assertEqual(self.file_handler.pending_entries, 2)
+
+    def test_reload_replays_journal(self):
+        """Testa a reconstrução da conta a partir do snapshot e do journal."""
+        self._add('receita', 100.0)
+        self._add('despesa', 30.0)
+
+        reloaded = TransactionService(JournalFileHandler(self.temp_file, compact_threshold=3))
+
+        self.assertEqual(reloaded.get_balance(), 70.0)
+        self.assertEqual(len(reloaded.get_all_transactions()), 2)
+
+    def test_compaction_writes_snapshot(self):
+        """Testa a compactação do journal ao atingir o limite."""
+        for _ in range(4):
+            self._add('receita', 10.0)
+
+        self.assertEqual(self.file_handler.pending_entries, 1)
+
+        reloaded = TransactionService(JournalFileHandler(self.temp_file, compact_threshold=3))
+        self.assertEqual(reloaded.get_balance(), 40.0)
+        self.assertEqual(len(reloaded.get_all_transactions()), 4)
+
+    def test_stale_journal_is_ignored(self):
+        """Testa que um journal de geração anterior não é reaplicado."""
+        self._add('receita', 10.0)
+        stale_header = json.dumps({'generation': self.file_handler.generation - 1})
+
+        with open(self.file_handler.journal_path, 'w', encoding='utf-8') as file:
+            file.write(stale_header + '\n')
+            file.write(json.dumps(Transaction('receita', 10.0, '2025-01-01').to_dict()) + '\n')
+
+        reloaded = TransactionService(JournalFileHandler(self.temp_file, compact_threshold=3))
+        self.assertEqual(len(reloaded.get_all_transactions()), 0)
+
+    def test_append_after_crash_before_journal_reset(self):
+        """Testa que acréscimos depois de uma queda entre o snapshot e o journal não se perdem."""
+        self._add('receita', 10.0)
+        self._add('receita', 20.0)
+
+        # Queda logo após gravar o snapshot: o journal fica com a geração anterior
+        with mock.patch.object(JournalFileHandler, '_reset_journal'):
+            self.file_handler.save_data(self.file_handler.load_data())
+
+        service = TransactionService(JournalFileHandler(self.temp_file, compact_threshold=100))
+        self.assertEqual(service.get_balance(), 30.0)
+        service.add_transaction(Transaction('receita', 5.0, '2025-01-02'))
+
+        reloaded = TransactionService(JournalFileHandler(self.temp_file, compact_threshold=100))
+        self.assertEqual(len(reloaded.get_all_transactions()), 3)
+        self.assertEqual(reloaded.get_balance(), 35.0)
+
+    def test_append_after_torn_tail(self):
+        """Testa que uma linha incompleta no fim do journal não esconde os acréscimos seguintes."""
+        service = TransactionService(JournalFileHandler(self.temp_file, compact_threshold=100))
+        service.add_transaction(Transaction('receita', 10.0, '2025-01-01'))
+
+        # Simula uma queda no meio da escrita de um lançamento
+        with open(self.file_handler.journal_path, 'a', encoding='utf-8') as file:
+            file.write('{"type": "receita", "amo')
+
+        service.add_transaction(Transaction('receita', 20.0, '2025-01-02'))
+        service.add_transaction(Transaction('receita', 30.0, '2025-01-03'))
+
+        reloaded = TransactionService(JournalFileHandler(self.temp_file, compact_threshold=100))
+        self.assertEqual(len(reloaded.get_all_transactions()), 3)
+        self.assertEqual(reloaded.get_balance(), 60.0)
+
+
+class TestBinaryFileHandler(unittest.TestCase):
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_file = os.path.join(self.temp_dir.name, 'test_data.bin')
+        self.file_handler = BinaryFileHandler(self.temp_file, compact_threshold=2)
+        self.transaction_service = TransactionService(self.file_handler)
+
+        self.transaction_service.add_transactions([
+            Transaction('receita', 1000.0, '2025-01-15', 'Salário', 'Pagamento mensal'),
+            Transaction('despesa', 300.5, '2025-01-20', 'Aluguel', 'Aluguel mensal'),
+            Transaction('despesa', 150.25, '2025-02-25', 'Alimentação', 'Compras do mês ção'),
+        ])
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def _reload(self) -> TransactionService:
+        return TransactionService(BinaryFileHandler(self.temp_file, compact_threshold=2))
+
+    def test_snapshot_is_mapped(self):
+        """Testa a carga do snapshot mapeado em memória, sem desserializar linhas."""
+        service = self._reload()
+        transactions = service.get_all_transactions()
+
+        self.assertIsInstance(transactions, MappedTransactions)
+        self.assertIsInstance(transactions.amount_cents, memoryview)
+        self.assertEqual(list(transactions.amount_cents), [100000, 30050, 15025])
+        self.assertEqual(transactions[2].description, 'Compras do mês ção')
+        self.assertEqual(service.get_balance(), 549.25)
+
+    def test_journal_on_top_of_snapshot(self):
+        """Testa transações novas gravadas no journal e reaplicadas na carga."""
+        self.transaction_service.add_transaction(Transaction('receita', 0.75, '2024-12-31', 'Extra'))
+
+        service = self._reload()
+        report = ReportService(service).generate_monthly_report(2025, 1)
+
+        self.assertEqual(len(service.get_all_transactions()), 4)
+        self.assertEqual(service.get_all_transactions()[3].category, 'Extra')
+        self.assertEqual(service.get_balance(), 550.0)
+        self.assertEqual(report['expense_by_category'], {'Aluguel': 300.5})
+        self.assertEqual(len(service.get_transactions_by_period('2024-12-01', '2024-12-31')), 1)
+
+    def test_load_data_compatibility(self):
+        """Testa a leitura no formato de dicionário do FileHandler."""
+        data = self.file_handler.load_data()
+
+        self.assertEqual(data['balance'], 549.25)
+        self.assertEqual(data['transactions'][1], {
+            'type': 'despesa', 'amount': 300.5, 'date': '2025-01-20',
+            'category': 'Aluguel', 'description': 'Aluguel mensal'
+        })
+        self.assertEqual(self.transaction_service.verify(), [])
+
+
+class TestSQLiteHandler(unittest.TestCase):
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_file = os.path.join(self.temp_dir.name, 'test_data.sqlite3')
+        self.file_handler = SQLiteHandler(self.temp_file)
+        self.transaction_service = TransactionService(self.file_handler)
+
+        self.transaction_service.add_transactions([
+            Transaction('receita', 1000.0, '2025-01-15', 'Salário', 'Pagamento mensal'),
+            Transaction('despesa', 300.0, '2025-01-20', 'Aluguel', 'Aluguel mensal'),
+            Transaction('despesa', 150.0, '2025-02-25', 'Alimentação', 'Compras do mês'),
+        ])
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.file_handler.close()
+        self.temp_dir.cleanup()
+
+    def test_transactions_stay_in_database(self):
+        """Testa que as transações não são mantidas em memória."""
+        self.assertEqual(self.transaction_service.account.transactions, [])
+        self.assertEqual(len(self.transaction_service.get_all_transactions()), 3)
+        self.assertEqual(self.transaction_service.get_balance(), 550.0)
+
+    def test_filters_are_pushed_down(self):
+        """Testa os filtros executados no banco."""
+        by_period = self.transaction_service.get_transactions_by_period('2025-01-01', '2025-01-31')
+        by_type = self.transaction_service.get_transactions_by_type('despesa')
+        by_category = self.transaction_service.get_transactions_by_category('Aluguel')
+
+        self.assertEqual([t.amount for t in by_period], [1000.0, 300.0])
+        self.assertEqual([t.amount for t in by_type], [300.0, 150.0])
+        self.assertEqual([t.description for t in by_category], ['Aluguel mensal'])
+
+    def test_reload_and_reports(self):
+        """Testa a reabertura do banco e a geração de relatórios."""
+        self.file_handler.close()
+        self.file_handler = SQLiteHandler(self.temp_file)
+        service = TransactionService(self.file_handler)
+        report = ReportService(service).generate_monthly_report(2025, 1)
+
+        self.assertEqual(service.get_balance(), 550.0)
+        self.assertEqual(report['total_income'], 1000.0)
+        self.assertEqual(report['expense_by_category'], {'Aluguel': 300.0})
+
+    def test_balance_at_date(self):
+        """Testa o saldo por data lendo do banco só as transações posteriores."""
+        self.assertEqual(self.transaction_service.get_balance_at('2025-01-19'), 1000.0)
+        self.assertEqual(self.transaction_service.get_balance_at('9999-12-31'), 550.0)
+        self.assertEqual(self.transaction_service.get_balance_series('2025-02-24', '2025-02-25'),
+                         [('2025-02-24', 700.0), ('2025-02-25', 550.0)])
+
+    def test_migrates_float_schema(self):
+        """Testa a migração de bancos que guardavam valores em reais."""
+        legacy_file = os.path.join(self.temp_dir.name, 'legacy.sqlite3')
+        connection = sqlite3.connect(legacy_file)
+        connection.executescript("""
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE transactions (
+                id INTEGER PRIMARY KEY, type TEXT NOT NULL, amount REAL NOT NULL,
+                date TEXT NOT NULL, category TEXT NOT NULL, description TEXT NOT NULL
+            );
+            INSERT INTO meta VALUES ('balance', '19.990000000000002');
+            INSERT INTO transactions VALUES (1, 'receita', 19.99, '2025-01-01', 'Venda', '');
+        """)
+        connection.close()
+
+        handler = SQLiteHandler(legacy_file)
+        try:
+            self.assertEqual(handler.load_balance_cents(), 1999)
+            self.assertEqual(handler.query_transactions()[0]['amount'], 19.99)
+        finally:
+            handler.close()
+
+    def test_dates_without_leading_zeros(self):
+        """Testa que datas sem zeros à esquerda entram nos filtros de todos os backends."""
+        for backend in ('json', 'journal', 'binary', 'sqlite', 'partitioned'):
+            with self.subTest(backend=backend):
+                path = os.path.join(self.temp_dir.name, backend, 'data.json')
+                handler = create_file_handler(path, backend)
+                service = TransactionService(handler)
+                service.add_transactions([
+                    Transaction('despesa', 5.0, '2025-01-20', 'Mercado'),
+                    Transaction('despesa', 10.0, '2025-1-5', 'Mercado'),
+                ])
+
+                by_period = service.get_transactions_by_period('2025-01-01', '2025-01-31')
+                report = ReportService(service).generate_monthly_report(2025, 1)
+
+                self.assertEqual(len(by_period), 2)
+                self.assertEqual(report['total_expense'], 15.0)
+                self.assertEqual(service.get_category_totals('despesa', 2025, 1), {'Mercado': 15.0})
+
+                if backend == 'sqlite':
+                    handler.close()
+
+    def test_migrates_unpadded_dates(self):
+        """Testa a migração de bancos que guardavam as datas como digitadas."""
+        self.file_handler.connection.executescript("""
+            INSERT INTO transactions (type, amount_cents, date, category, description)
+            VALUES ('despesa', 1000, '2025-1-5', 'Mercado', '');
+            PRAGMA user_version = 2;
+        """)
+        self.file_handler.close()
+
+        self.file_handler = SQLiteHandler(self.temp_file)
+        found = self.file_handler.query_transactions('2025-01-01', '2025-01-10')
+
+        self.assertEqual([row['date'] for row in found], ['2025-01-05'])
+
+    def test_query_uses_index(self):
+        """Testa que as consultas por data usam o índice."""
+        plan = self.file_handler.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM transactions WHERE date >= ? AND date <= ?",
+            ('2025-01-01', '2025-01-31')
+        ).fetchall()
+
+        self.assertTrue(any('idx_transactions_date' in row[-1] for row in plan))
+
+
+class TestPartitionedFileHandler(unittest.TestCase):
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.temp_dir.name, 'transactions')
+        self.file_handler = PartitionedFileHandler(self.directory)
+        self.transaction_service = TransactionService(self.file_handler)
+
+        self.transaction_service.add_transactions([
+            Transaction('receita', 1000.0, '2025-01-15', 'Salário', 'Pagamento mensal'),
+            Transaction('despesa', 150.0, '2025-02-25', 'Alimentação', 'Compras do mês'),
+            Transaction('despesa', 300.0, '2025-01-20', 'Aluguel', 'Aluguel mensal'),
+        ])
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def _reopen(self) -> TransactionService:
+        self.file_handler = PartitionedFileHandler(self.directory)
+        return TransactionService(self.file_handler)
+
+    def test_one_file_per_month(self):
+        """Testa que cada mês fica em uma partição própria."""
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         ['2025-01.jsonl', '2025-02.jsonl', 'manifest.json'])
+
+    def test_balance_comes_from_manifest(self):
+        """Testa que o saldo é lido sem abrir nenhuma partição."""
+        service = self._reopen()
+
+        self.assertEqual(service.get_balance(), 550.0)
+        self.assertEqual(self.file_handler._partitions, {})
+
+    def test_period_opens_only_overlapping_partitions(self):
+        """Testa que a consulta por período lê apenas os meses do intervalo."""
+        service = self._reopen()
+        transactions = service.get_transactions_by_period('2025-01-16', '2025-01-31')
+
+        self.assertEqual([t.amount for t in transactions], [300.0])
+        self.assertEqual(list(self.file_handler._partitions), ['2025-01'])
+
+    def test_monthly_report(self):
+        """Testa o relatório mensal com os totais do manifesto."""
+        report = ReportService(self._reopen()).generate_monthly_report(2025, 1)
+
+        self.assertEqual(report['total_income'], 1000.0)
+        self.assertEqual(report['expense_by_category'], {'Aluguel': 300.0})
+        self.assertEqual(len(report['transactions']), 2)
+
+    def test_range_report(self):
+        """Testa os relatórios de um intervalo com uma única consulta."""
+        reports = ReportService(self._reopen()).generate_range_report('2025-01', '2025-03')
+
+        self.assertEqual([len(r['transactions']) for r in reports], [2, 1, 0])
+        self.assertEqual([r['total_expense'] for r in reports], [300.0, 150.0, 0.0])
+
+    def test_insertion_order_across_partitions(self):
+        """Testa que as consultas mantêm a ordem de inserção."""
+        service = self._reopen()
+
+        self.assertEqual([t.amount for t in service.get_all_transactions()],
+                         [1000.0, 150.0, 300.0])
+        self.assertEqual([t.amount for t in service.get_transactions_by_type('despesa')],
+                         [150.0, 300.0])
+
+    def test_interrupted_append_is_discarded(self):
+        """Testa que linhas gravadas sem atualizar o manifesto são ignoradas."""
+        with open(os.path.join(self.directory, '2025-01.jsonl'), 'a', encoding='utf-8') as file:
+            file.write('{"type": "receita", "amount": 99.0, "da')
+
+        service = self._reopen()
+        self.assertEqual(len(service.get_transactions_by_period('2025-01-01', '2025-01-31')), 2)
+
+        service.add_transaction(Transaction('receita', 50.0, '2025-01-28', 'Extra', ''))
+        service = self._reopen()
+
+        self.assertEqual([t.amount for t in service.get_transactions_by_period('2025-01-01', '2025-01-31')],
+                         [1000.0, 300.0, 50.0])
+        self.assertEqual(service.get_balance(), 600.0)
+
+    def test_load_and_save_data(self):
+        """Testa a compatibilidade com load_data/save_data."""
+        data = self.file_handler.load_data()
+        self.file_handler.save_data(data)
+
+        self.assertEqual(self._reopen().file_handler.load_data(), data)
+
+
+def _add_from_process(file_path: str, backend_class: type, worker: int, count: int) -> None:
+    """Adiciona transações a partir de um processo separado (ver TestConcurrentAccess)."""
+    service = TransactionService(backend_class(file_path))
+    for number in range(count):
+        service.add_transaction(Transaction('receita', 1.0, '2025-03-01', f'Processo {worker}',
+                                            f'Lançamento {number}'))
+
+
+class TestConcurrentAccess(unittest.TestCase):
+    def setUp(self):
+        """Configuração para cada teste."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_file = os.path.join(self.temp_dir.name, 'test_data.json')
+
+    def tearDown(self):
+        """Limpeza após cada teste."""
+        self.temp_dir.cleanup()
+
+    def test_stale_writer_merges_instead_of_overwriting(self):
+        """Testa que uma gravação sobre dados desatualizados não perde as transações do outro."""
+        first = TransactionService(FileHandler(self.temp_file))
+        second = TransactionService(FileHandler(self.temp_file))
+
+        first.add_transaction(Transaction('receita', 100.0, '2025-01-10', 'Salário'))
+        second.add_transaction(Transaction('despesa', 30.0, '2025-01-11', 'Mercado'))
+
+        reloaded = TransactionService(FileHandler(self.temp_file))
+        self.assertEqual(reloaded.get_balance(), 70.0)
+        self.assertEqual([t.category for t in reloaded.get_all_transactions()],
+                         ['Salário', 'Mercado'])
+
+        # O segundo processo ainda não conhece a receita do primeiro
+        self.assertTrue(second.file_handler.has_changed())
+        self.assertTrue(second.refresh())
+        self.assertEqual(second.get_balance(), 70.0)
+        self.assertEqual(len(second.get_transactions_by_type('receita')), 1)
+        self.assertFalse(second.file_handler.has_changed())
+
+    def test_refresh_picks_up_only_new_transactions(self):
+        """Testa a leitura incremental das transações de outro processo."""
+        writer = TransactionService(FileHandler(self.temp_file))
+        reader = TransactionService(FileHandler(self.temp_file))
+        reports = ReportService(reader)
+
+        writer.add_transaction(Transaction('receita', 100.0, '2025-01-10', 'Salário'))
+        january = reports.generate_monthly_report(2025, 1)
+        february = reports.generate_monthly_report(2025, 2)
+        self.assertEqual(january['transactions'], [])
+
+        self.assertTrue(reader.refresh())
+        self.assertFalse(reader.refresh())
+
+        writer.add_transaction(Transaction('despesa', 40.0, '2025-01-12', 'Mercado'))
+        self.assertTrue(reader.refresh())
+
+        self.assertEqual(reader.get_balance(), 60.0)
+        self.assertEqual(len(reader.get_transactions_by_period('2025-01-01', '2025-01-31')), 2)
+        self.assertEqual(len(reports.generate_monthly_report(2025, 1)['transactions']), 2)
+        # Só o relatório do mês afetado foi invalidado
+        self.assertIs(reports.generate_monthly_report(2025, 2), february)
+        self.assertIsNot(reports.generate_monthly_report(2025, 1), january)
+
+    def test_write_does_not_mark_own_changes(self):
+        """Testa que as gravações do próprio processo não contam como mudança."""
+        service = TransactionService(FileHandler(self.temp_file))
+        service.add_transaction(Transaction('receita', 10.0, '2025-01-10'))
+
+        self.assertFalse(service.file_handler.has_changed())
+        self.assertFalse(service.refresh())
+
+    def test_journal_compaction_keeps_other_writers(self):
+        """Testa que a compactação do journal não descarta lançamentos de outro processo."""
+        first = TransactionService(JournalFileHandler(self.temp_file, compact_threshold=2))
+        second = TransactionService(JournalFileHandler(self.temp_file, compact_threshold=2))
+
+        second.add_transaction(Transaction('receita', 5.0, '2025-01-01', 'Outro'))
+        # Dois lançamentos do primeiro processo disparam a compactação
+        first.add_transaction(Transaction('receita', 10.0, '2025-01-02', 'Primeiro'))
+        first.add_transaction(Transaction('receita', 20.0, '2025-01-03', 'Primeiro'))
+
+        reloaded = TransactionService(JournalFileHandler(self.temp_file))
+        self.assertEqual(reloaded.get_balance(), 35.0)
+        self.assertEqual(len(reloaded.get_all_transactions()), 3)
+
+        self.assertTrue(second.refresh())
+        self.assertEqual(second.get_balance(), 35.0)
+
+    def test_partitioned_writer_with_stale_manifest(self):
+        """Testa acréscimos nas partições a partir de um manifesto desatualizado."""
+        directory = os.path.join(self.temp_dir.name, 'transactions')
+        first = TransactionService(PartitionedFileHandler(directory))
+        second = TransactionService(PartitionedFileHandler(directory))
+
+        first.add_transaction(Transaction('receita', 100.0, '2025-01-10', 'Salário'))
+        second.add_transaction(Transaction('despesa', 30.0, '2025-01-11', 'Mercado'))
+
+        reloaded = TransactionService(PartitionedFileHandler(directory))
+        self.assertEqual(reloaded.get_balance(), 70.0)
+        self.assertEqual(len(reloaded.get_transactions_by_period('2025-01-01', '2025-01-31')), 2)
+
+        self.assertEqual(first.get_balance(), 100.0)
+        self.assertTrue(first.refresh())
+        self.assertEqual(first.get_balance(), 70.0)
+        self.assertEqual(len(first.get_transactions_by_period('2025-01-01', '2025-01-31')), 2)
+
+    def test_sqlite_balance_with_two_connections(self):
+        """Testa que o saldo no SQLite soma as gravações de duas conexões."""
+        path = os.path.join(self.temp_dir.name, 'test_data.sqlite3')
+        first = TransactionService(SQLiteHandler(path))
+        second = TransactionService(SQLiteHandler(path))
+
+        try:
+            first.add_transaction(Transaction('receita', 100.0, '2025-01-10', 'Salário'))
+            second.add_transaction(Transaction('despesa', 30.0, '2025-01-11', 'Mercado'))
+
+            self.assertEqual(first.file_handler.load_balance_cents(), 7000)
+            self.assertTrue(first.refresh())
+            self.assertEqual(first.get_balance(), 70.0)
+        finally:
+            first.file_handler.close()
+            second.file_handler.close()
+
+    def test_concurrent_processes(self):
+        """Testa vários processos adicionando transações ao mesmo arquivo ao mesmo tempo."""
+        for backend_class in (FileHandler, JournalFileHandler):
+            with self.subTest(backend=backend_class.__name__):
+                file_path = os.path.join(self.temp_dir.name, backend_class.__name__ + '.json')
+                backend_class(file_path)
+
+                processes = [
+                    multiprocessing.Process(target=_add_from_process,
+                                            args=(file_path, backend_class, worker, 15))
+                    for worker in range(4)
+                ]
+                for process in processes:
+                    process.start()
+                for process in processes:
+                    process.join(30)
+                    self.assertEqual(process.exitcode, 0)
+
+                service = TransactionService(backend_class(file_path))
+                self.assertEqual(len(service.get_all_transactions()), 60)
+                self.assertEqual(service.get_balance(), 60.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 from datetime import datetime
+from decimal import Decimal
+from models.money import to_cents
 from models.transaction import Transaction
 
 
@@ -42,6 +44,41 @@ class TestTransaction(unittest.TestCase):
                 amount=-50  # Valor inválido
             )
     
+    def test_amount_in_cents(self):
+        """Testa o armazenamento do valor em centavos inteiros."""
+        transaction = Transaction(
+            transaction_type='receita',
+            amount=19.99
+        )
+        
+        self.assertEqual(transaction.amount_cents, 1999)
+        self.assertEqual(transaction.amount, 19.99)
+        self.assertEqual(transaction.to_dict()['amount'], 19.99)
+        
+        with self.assertRaises(ValueError):
+            Transaction(
+                transaction_type='receita',
+                amount=0.001  # Menor que um centavo
+            )
+    
+    def test_to_cents_rounding(self):
+        """Testa que o arredondamento para centavos não depende do tipo do valor."""
+        for value in (0.125, 2.675, 1.005, -0.125):
+            with self.subTest(value=value):
+                self.assertEqual(to_cents(value), to_cents(repr(value)))
+                self.assertEqual(to_cents(value), to_cents(Decimal(repr(value))))
+        
+        self.assertEqual(to_cents(0.125), 13)
+        self.assertEqual(to_cents(2.675), 268)
+        self.assertEqual(to_cents(19.99), 1999)
+        
+        for value in (float('inf'), float('-inf'), float('nan')):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    to_cents(value)
+                with self.assertRaises(ValueError):
+                    Transaction(transaction_type='receita', amount=value)
+    
     def test_invalid_date_format(self):
         """Testa a validação de formato de data inválido."""
         with self.assertRaises(ValueError):
@@ -62,6 +99,36 @@ class TestTransaction(unittest.TestCase):
         today = datetime.now().strftime("%Y-%m-%d")
         self.assertEqual(transaction.date, today)
 
+    
+    def test_from_dict_trusted(self):
+        """Testa a criação confiável, sem revalidação, a partir de um dicionário."""
+        data = {
+            'type': 'despesa',
+            'amount': 50.0,
+            'date': '2025-01-01',
+            'category': 'Mercado',
+            'description': 'Compras'
+        }
+        
+        transaction = Transaction.from_dict(data, trusted=True)
+        self.assertEqual(transaction.to_dict(), data)
+        
+        # Dados inválidos não são rejeitados na carga confiável
+        data['date'] = '01/01/2025'
+        Transaction.from_dict(data, trusted=True)
+        
+        with self.assertRaises(ValueError):
+            Transaction.from_dict(data)
+    
+    def test_slots(self):
+        """Testa que a transação não mantém um __dict__ por instância."""
+        transaction = Transaction(
+            transaction_type='receita',
+            amount=100.0
+        )
+        
+        self.assertFalse(hasattr(transaction, '__dict__'))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, Any, Callable
+from typing import Optional, Any, Callable, Sequence
 
 
 def get_valid_input(prompt: str, validation_func: Callable[[str], bool], 
@@ -69,6 +69,53 @@ def get_date_input(prompt: str) -> str:
     return get_valid_input(prompt, validate, error_message)
 
 
+def get_optional_date_input(prompt: str) -> Optional[str]:
+    """
+    Obtém uma data opcional no formato YYYY-MM-DD do usuário.
+    
+    Args:
+        prompt: Mensagem a ser exibida para o usuário
+        
+    Returns:
+        Data no formato YYYY-MM-DD, ou None se a entrada ficar em branco
+    """
+    def validate(value: str) -> bool:
+        if not value.strip():
+            return True
+        try:
+            datetime.strptime(value.strip(), "%Y-%m-%d")
+            return True
+        except ValueError:
+            return False
+    
+    error_message = "Por favor, insira uma data válida no formato YYYY-MM-DD ou deixe em branco."
+    return get_valid_input(prompt, validate, error_message).strip() or None
+
+
+def get_optional_float_input(prompt: str) -> Optional[float]:
+    """
+    Obtém um valor float opcional (não negativo) do usuário.
+    
+    Args:
+        prompt: Mensagem a ser exibida para o usuário
+        
+    Returns:
+        Valor float validado, ou None se a entrada ficar em branco
+    """
+    def validate(value: str) -> bool:
+        if not value.strip():
+            return True
+        try:
+            return float(value) >= 0
+        except ValueError:
+            return False
+    
+    error_message = "Por favor, insira um número válido (não negativo) ou deixe em branco."
+    value_str = get_valid_input(prompt, validate, error_message).strip()
+    
+    return float(value_str) if value_str else None
+
+
 def get_transaction_type() -> str:
     """
     Obtém o tipo de transação do usuário.
@@ -85,12 +132,32 @@ def get_transaction_type() -> str:
     return 'receita' if option == '1' else 'despesa'
 
 
-def get_menu_option(max_option: int) -> int:
+def get_optional_transaction_type() -> Optional[str]:
+    """
+    Obtém um tipo de transação opcional do usuário.
+    
+    Returns:
+        Tipo de transação ('receita' ou 'despesa'), ou None para ambos
+    """
+    def validate(value: str) -> bool:
+        return value.strip() in ['', '1', '2']
+    
+    error_message = "Por favor, digite 1 para receita, 2 para despesa ou deixe em branco."
+    option = get_valid_input("Tipo (1 - Receita, 2 - Despesa, Enter - Ambos): ",
+                             validate, error_message).strip()
+    
+    if not option:
+        return None
+    return 'receita' if option == '1' else 'despesa'
+
+
+def get_menu_option(max_option: int, hidden_options: Sequence[int] = ()) -> int:
     """
     Obtém uma opção de menu do usuário.
     
     Args:
         max_option: Número máximo de opções no menu
+        hidden_options: Opções aceitas que não aparecem no menu
         
     Returns:
         Número da opção escolhida
@@ -98,7 +165,7 @@ def get_menu_option(max_option: int) -> int:
     def validate(value: str) -> bool:
         try:
             option = int(value)
-            return 0 <= option <= max_option
+            return 0 <= option <= max_option or option in hidden_options
         except ValueError:
             return False
     
@@ -1,26 +1,36 @@
-from typing import Dict, Any, List, Callable
+from typing import Dict, Any, List, Callable, Optional, Sequence, Union
 from datetime import datetime
 
+from config.settings import PAGE_SIZE
+from models.recurring import RecurringRule
 from models.transaction import Transaction
-from services.transaction_service import TransactionService
+from services.transaction_service import TransactionService, TransactionSelection
 from services.report_service import ReportService
+from services.recurring_service import RecurringService
+from services.profiler import profiler
+from services.query import TransactionQuery
+from ui.pager import TransactionPager
 from ui.input_handlers import (
     get_float_input, get_date_input, get_transaction_type, 
-    get_menu_option, get_valid_input
+    get_menu_option, get_valid_input, get_optional_date_input,
+    get_optional_float_input, get_optional_transaction_type
 )
 
 
 class Menu:
-    def __init__(self, transaction_service: TransactionService, report_service: ReportService):
+    def __init__(self, transaction_service: TransactionService, report_service: ReportService,
+                 recurring_service: Optional[RecurringService] = None):
         """
         Inicializa o menu com os serviços necessários.
         
         Args:
             transaction_service: Serviço de transações
             report_service: Serviço de relatórios
+            recurring_service: Serviço de transações recorrentes (opcional)
         """
         self.transaction_service = transaction_service
         self.report_service = report_service
+        self.recurring_service = recurring_service
         self.running = True
         
     def display_main_menu(self) -> None:
@@ -31,14 +41,33 @@ class Menu:
         print("2. Visualizar transações")
         print("3. Gerar relatórios")
         print("4. Consultar saldo")
+        if self.recurring_service is not None:
+            print("5. Transações recorrentes")
         print("0. Sair")
     
     def handle_main_menu(self) -> None:
         """Gerencia a interação com o menu principal."""
+        self.report_flush_error()
         self.display_main_menu()
-        option = get_menu_option(4)
+        
+        # Opção oculta 9: estatísticas de desempenho (apenas com o profiler ativo)
+        max_option = 4 if self.recurring_service is None else 5
+        option = get_menu_option(max_option, hidden_options=[9] if profiler.enabled else [])
+        
+        if option in (2, 3, 4):
+            # As consultas passam a incluir o que outros processos gravaram
+            self.refresh_data()
         
         if option == 0:
+            # Grava as transações pendentes antes de sair (modo write-behind)
+            try:
+                self.transaction_service.close()
+            except OSError as e:
+                print(f"\nErro ao gravar os dados: {e}")
+                print("As últimas transações ainda não foram salvas. "
+                      "Verifique o disco e tente sair novamente.")
+                return
+            
             self.running = False
             print("Obrigado por usar o Gestor Financeiro Pessoal. Até logo!")
         elif option == 1:
@@ -49,6 +78,24 @@ class Menu:
             self.reports_menu()
         elif option == 4:
             self.check_balance()
+        elif option == 5:
+            self.recurring_menu()
+        elif option == 9:
+            self.show_profile_stats()
+    
+    def refresh_data(self) -> None:
+        """Incorpora as transações gravadas por outros processos (ex: a CLI) no mesmo arquivo."""
+        if self.transaction_service.refresh():
+            print("\nDados atualizados com transações gravadas por outro processo.")
+    
+    def report_flush_error(self) -> None:
+        """Avisa sobre falhas na gravação dos dados em segundo plano."""
+        error = self.transaction_service.pop_flush_error()
+        
+        if error is not None:
+            print(f"\nAtenção: falha ao gravar os dados em segundo plano: {error}")
+            print(f"{self.transaction_service.pending_writes} transação(ões) ainda não "
+                  "gravada(s); uma nova tentativa será feita automaticamente.")
     
     def register_transaction(self) -> None:
         """Registra uma nova transação."""
@@ -84,6 +131,15 @@ class Menu:
             
         except ValueError as e:
             print(f"Erro ao registrar transação: {e}")
+            return
+        
+        if self.recurring_service is not None:
+            repeat = get_valid_input("Repetir esta transação automaticamente? (S/N): ",
+                                     lambda x: x.upper() in ['S', 'N'],
+                                     "Por favor, digite S ou N.")
+            if repeat.upper() == 'S':
+                # A transação registrada é a primeira ocorrência da regra
+                self.register_recurring_rule(transaction, posted=True)
     
     def view_transactions_menu(self) -> None:
         """Exibe o menu de visualização de transações."""
@@ -93,9 +149,11 @@ class Menu:
         print("3. Receitas")
         print("4. Despesas")
         print("5. Transações por categoria")
+        print("6. Filtro combinado")
+        print("7. Buscar por descrição ou categoria")
         print("0. Voltar")
         
-        option = get_menu_option(5)
+        option = get_menu_option(7)
         
         if option == 0:
             return
@@ -109,10 +167,14 @@ class Menu:
             self.view_transactions_by_type('despesa')
         elif option == 5:
             self.view_transactions_by_category()
+        elif option == 6:
+            self.view_filtered_transactions()
+        elif option == 7:
+            self.search_transactions()
     
     def view_all_transactions(self) -> None:
         """Exibe todas as transações."""
-        transactions = self.transaction_service.get_all_transactions()
+        transactions = self.transaction_service.select_transactions()
         self._display_transactions(transactions, "TODAS AS TRANSAÇÕES")
     
     def view_transactions_by_period(self) -> None:
@@ -121,7 +183,7 @@ class Menu:
         start_date = get_date_input("Data inicial (YYYY-MM-DD): ")
         end_date = get_date_input("Data final (YYYY-MM-DD): ")
         
-        transactions = self.transaction_service.get_transactions_by_period(start_date, end_date)
+        transactions = self.transaction_service.select_transactions(start_date, end_date)
         self._display_transactions(transactions, f"TRANSAÇÕES DE {start_date} A {end_date}")
     
     def view_transactions_by_type(self, transaction_type: str) -> None:
@@ -131,49 +193,71 @@ class Menu:
         Args:
             transaction_type: Tipo de transação ('receita' ou 'despesa')
         """
-        transactions = self.transaction_service.get_transactions_by_type(transaction_type)
+        transactions = self.transaction_service.select_transactions(transaction_type=transaction_type)
         title = "RECEITAS" if transaction_type == 'receita' else "DESPESAS"
         self._display_transactions(transactions, title)
     
     def view_transactions_by_category(self) -> None:
         """Exibe transações de uma categoria específica."""
         category = input("\nInforme a categoria: ")
-        transactions = self.transaction_service.get_transactions_by_category(category)
+        transactions = self.transaction_service.select_transactions(category=category)
         self._display_transactions(transactions, f"TRANSAÇÕES DA CATEGORIA: {category}")
     
-    def _display_transactions(self, transactions: List[Transaction], title: str) -> None:
-        """
-        Exibe uma lista de transações.
+    def view_filtered_transactions(self) -> None:
+        """Exibe transações que atendem a uma combinação de filtros."""
+        print("\nInforme os filtros (deixe em branco para ignorar):")
+        start_date = get_optional_date_input("Data inicial (YYYY-MM-DD): ")
+        end_date = get_optional_date_input("Data final (YYYY-MM-DD): ")
+        transaction_type = get_optional_transaction_type()
+        category = input("Categoria: ").strip() or None
+        min_amount = get_optional_float_input("Valor mínimo: ")
+        max_amount = get_optional_float_input("Valor máximo: ")
+        text = input("Texto na descrição ou categoria: ").strip() or None
         
-        Args:
-            transactions: Lista de transações a serem exibidas
-            title: Título da listagem
-        """
-        print(f"\n===== {title} =====")
+        try:
+            query = TransactionQuery(start_date, end_date, transaction_type, category,
+                                     min_amount, max_amount, text)
+        except ValueError as e:
+            print(f"\nErro: {e}")
+            return
+        
+        transactions = self.transaction_service.select_query(query)
+        self._display_transactions(transactions, "TRANSAÇÕES FILTRADAS")
+    
+    def search_transactions(self) -> None:
+        """Exibe as transações cuja descrição ou categoria contém um texto."""
+        text = input("\nTexto procurado (sem diferenciar maiúsculas e acentos): ").strip()
         
-        if not transactions:
-            print("Nenhuma transação encontrada.")
+        if not text:
+            print("\nInforme um texto para a busca.")
             return
         
-        print(f"{'TIPO':<10} {'DATA':<12} {'VALOR (R$)':<12} {'CATEGORIA':<15} {'DESCRIÇÃO':<30}")
-        print("-" * 80)
+        transactions = self.transaction_service.select_query(TransactionQuery(text=text))
+        self._display_transactions(transactions, f"BUSCA: {text}")
+    
+    def _display_transactions(self, transactions: Union[TransactionSelection, Sequence[Transaction]],
+                              title: str) -> None:
+        """
+        Exibe transações em páginas.
         
-        for transaction in transactions:
-            transaction_type = "RECEITA" if transaction.transaction_type == 'receita' else "DESPESA"
-            print(f"{transaction_type:<10} {transaction.date:<12} {transaction.amount:<12.2f} "
-                  f"{transaction.category[:15]:<15} {transaction.description[:30]:<30}")
+        Args:
+            transactions: Seleção (ou lista) de transações a serem exibidas
+            title: Título da listagem
+        """
+        if not isinstance(transactions, TransactionSelection):
+            transactions = TransactionSelection.from_sequence(transactions)
         
-        print("-" * 80)
-        print(f"Total: {len(transactions)} transação(ões)")
+        TransactionPager(transactions, title, page_size=PAGE_SIZE).run()
     
     def reports_menu(self) -> None:
         """Exibe o menu de relatórios."""
         print("\n===== RELATÓRIOS =====")
         print("1. Relatório mensal")
         print("2. Relatório por categorias")
+        print("3. Evolução do saldo")
         print("0. Voltar")
         
-        option = get_menu_option(2)
+        option = get_menu_option(3)
         
         if option == 0:
             return
@@ -181,6 +265,8 @@ class Menu:
             self.monthly_report()
         elif option == 2:
             self.category_report()
+        elif option == 3:
+            self.balance_history()
     
     def monthly_report(self) -> None:
         """Gera e exibe um relatório mensal."""
@@ -227,6 +313,12 @@ class Menu:
         
         if view_transactions.upper() == 'S':
             self._display_transactions(report['transactions'], f"TRANSAÇÕES DE {report['period']}")
+        
+        if report.get('projected_transactions'):
+            print("\nPrevistas (recorrentes, ainda não lançadas), incluídas nos totais:")
+            for transaction in report['projected_transactions']:
+                print(f"  {transaction.date} - {transaction.transaction_type.capitalize()}: "
+                      f"R$ {transaction.amount:.2f} - {transaction.category or 'Sem categoria'}")
     
     def category_report(self) -> None:
         """Gera e exibe um relatório por categorias."""
@@ -257,13 +349,160 @@ class Menu:
         
         print(f"\nTotal: R$ {total:.2f}")
     
+    def balance_history(self) -> None:
+        """Exibe a evolução do saldo em um período."""
+        print("\nInforme o período:")
+        start_date = get_date_input("Data inicial (YYYY-MM-DD): ")
+        end_date = get_date_input("Data final (YYYY-MM-DD): ")
+        
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+        end = datetime.strptime(end_date, "%Y-%m-%d")
+        if start > end:
+            print("\nA data inicial deve ser anterior ou igual à data final.")
+            return
+        
+        # Até cerca de 30 linhas, com o último dia do período sempre incluído
+        step = max(1, ((end - start).days + 29) // 30)
+        if self.recurring_service is not None:
+            # Inclui as ocorrências recorrentes ainda não lançadas (projeção)
+            series = self.recurring_service.get_projected_series(start_date, end_date, step)
+            if series[-1][0] != end_date:
+                series.append((end_date, self.recurring_service.get_projected_balance(end_date)))
+        else:
+            series = self.transaction_service.get_balance_series(start_date, end_date, step)
+            if series[-1][0] != end_date:
+                series.append((end_date, self.transaction_service.get_balance_at(end_date)))
+        
+        print(f"\n===== EVOLUÇÃO DO SALDO: {start_date} a {end_date} =====")
+        for day, balance in series:
+            print(f"{day}  R$ {balance:>12.2f}")
+    
+    def recurring_menu(self) -> None:
+        """Exibe o menu de transações recorrentes."""
+        print("\n===== TRANSAÇÕES RECORRENTES =====")
+        print("1. Cadastrar regra")
+        print("2. Listar regras")
+        print("3. Remover regra")
+        print("0. Voltar")
+        
+        option = get_menu_option(3)
+        
+        if option == 0:
+            return
+        elif option == 1:
+            print("\n===== CADASTRAR REGRA RECORRENTE =====")
+            transaction_type = get_transaction_type()
+            amount = get_float_input("Valor: R$ ")
+            start_date = get_date_input("Data da primeira ocorrência (YYYY-MM-DD): ")
+            category = input("Categoria: ")
+            description = input("Descrição: ")
+            
+            try:
+                transaction = Transaction(transaction_type, amount, start_date, category, description)
+            except ValueError as e:
+                print(f"Erro ao cadastrar regra: {e}")
+                return
+            
+            self.register_recurring_rule(transaction, posted=False)
+        elif option == 2:
+            self.list_recurring_rules()
+        elif option == 3:
+            self.list_recurring_rules()
+            rule_id = get_valid_input("Número da regra a remover: ", str.isdigit,
+                                      "Por favor, digite o número da regra.")
+            try:
+                self.recurring_service.remove_rule(int(rule_id))
+                print("\nRegra removida. As transações já lançadas foram mantidas.")
+            except ValueError as e:
+                print(f"Erro ao remover regra: {e}")
+    
+    def register_recurring_rule(self, transaction: Transaction, posted: bool) -> None:
+        """
+        Cadastra uma regra recorrente a partir de uma transação.
+        
+        Args:
+            transaction: Transação com os dados e a data da primeira ocorrência
+            posted: Se True, a primeira ocorrência já foi registrada na conta
+        """
+        print("\nFrequência:")
+        print("1. Mensal")
+        print("2. Semanal")
+        print("3. A cada N dias")
+        
+        option = get_menu_option(3)
+        if option == 0:
+            return
+        
+        frequency = {1: 'monthly', 2: 'weekly', 3: 'daily'}[option]
+        interval = 1
+        if option == 3:
+            interval = int(get_valid_input("Intervalo em dias: ", lambda x: x.isdigit() and int(x) > 0,
+                                           "Por favor, digite um número inteiro positivo."))
+        
+        end_date = get_optional_date_input("Data final (YYYY-MM-DD, vazio para sem fim): ")
+        
+        try:
+            rule = RecurringRule(transaction.transaction_type, transaction.amount, transaction.date,
+                                 frequency, interval, end_date, transaction.category,
+                                 transaction.description,
+                                 posted_until=transaction.date if posted else None)
+            self.recurring_service.add_rule(rule)
+        except ValueError as e:
+            print(f"Erro ao cadastrar regra: {e}")
+            return
+        
+        print(f"\nRegra {rule.rule_id} cadastrada.")
+        self.post_recurring()
+    
+    def list_recurring_rules(self) -> None:
+        """Exibe as regras recorrentes cadastradas."""
+        rules = self.recurring_service.get_rules()
+        
+        if not rules:
+            print("\nNenhuma regra recorrente cadastrada.")
+            return
+        
+        frequencies = {'monthly': "mês(es)", 'weekly': "semana(s)", 'daily': "dia(s)"}
+        print("\n===== REGRAS RECORRENTES =====")
+        for rule in rules:
+            end = f" até {rule.end_date}" if rule.end_date else ""
+            print(f"{rule.rule_id}. {rule.transaction_type.capitalize()} de R$ {rule.amount:.2f} "
+                  f"a cada {rule.interval} {frequencies[rule.frequency]}, desde {rule.start_date}{end}"
+                  f" - {rule.category or 'Sem categoria'}: {rule.description}")
+    
+    def post_recurring(self) -> None:
+        """Lança as ocorrências vencidas das regras recorrentes."""
+        if self.recurring_service is None:
+            return
+        
+        try:
+            posted = self.recurring_service.post_due()
+        except (OSError, ValueError) as e:
+            print(f"\nErro ao lançar transações recorrentes: {e}")
+            return
+        
+        if posted:
+            print(f"\n{len(posted)} transação(ões) recorrente(s) lançada(s) até hoje.")
+    
     def check_balance(self) -> None:
         """Exibe o saldo atual."""
         balance = self.transaction_service.get_balance()
         print(f"\n===== SALDO ATUAL =====")
         print(f"R$ {balance:.2f}")
     
+    def show_profile_stats(self) -> None:
+        """Exibe as estatísticas de desempenho coletadas."""
+        print("\n===== ESTATÍSTICAS DE DESEMPENHO =====")
+        print(profiler.format_report())
+        
+        stats = self.report_service.cache_stats()
+        print(f"\nCache de relatórios: {stats['hits']} acerto(s), {stats['misses']} falha(s) "
+              f"({stats['hit_rate']:.0%}), {stats['invalidations']} invalidação(ões), "
+              f"{stats['evictions']} descarte(s), {stats['size']}/{stats['maxsize']} em uso")
+    
     def run(self) -> None:
         """Executa o loop principal do menu."""
+        self.post_recurring()
+        
         while self.running:
             self.handle_main_menu()
\ No newline at end of file
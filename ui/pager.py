@@ -0,0 +1,146 @@
+import sys
+from typing import List, Optional, TextIO
+
+from models.transaction import Transaction
+from services.transaction_service import TransactionSelection
+
+
+HEADER = f"{'TIPO':<10} {'DATA':<12} {'VALOR (R$)':<12} {'CATEGORIA':<15} {'DESCRIÇÃO':<30}\n"
+SEPARATOR = "-" * 80 + "\n"
+
+
+def format_transaction(transaction: Transaction) -> str:
+    """Formata uma transação como uma linha da listagem."""
+    transaction_type = "RECEITA" if transaction.transaction_type == 'receita' else "DESPESA"
+    return (f"{transaction_type:<10} {transaction.date:<12} {transaction.amount:<12.2f} "
+            f"{transaction.category[:15]:<15} {transaction.description[:30]:<30}\n")
+
+
+class TransactionPager:
+    """
+    Visualizador paginado de transações.
+    
+    Cada página é lida da seleção apenas quando exibida e escrita na tela
+    de uma só vez. O total vem da seleção, sem montar a lista completa.
+    """
+    
+    def __init__(self, selection: TransactionSelection, title: str, page_size: int = 20,
+                 output: Optional[TextIO] = None):
+        """
+        Inicializa o visualizador.
+        
+        Args:
+            selection: Transações a serem exibidas
+            title: Título da listagem
+            page_size: Quantidade de transações por página
+            output: Saída dos textos (padrão: sys.stdout)
+        """
+        self.selection = selection
+        self.title = title
+        self.page_size = max(1, page_size)
+        self.page = 0
+        self.output = output or sys.stdout
+    
+    @property
+    def page_count(self) -> int:
+        """Quantidade de páginas."""
+        return max(1, -(-len(self.selection) // self.page_size))
+    
+    def render_page(self) -> str:
+        """
+        Monta o texto da página atual.
+        
+        Returns:
+            Texto completo da página (cabeçalho, linhas e rodapé)
+        """
+        total = len(self.selection)
+        parts: List[str] = [f"\n===== {self.title} =====\n"]
+        
+        if not total:
+            parts.append("Nenhuma transação encontrada.\n")
+            return "".join(parts)
+        
+        offset = self.page * self.page_size
+        transactions = self.selection.page(offset, self.page_size)
+        
+        parts.append(HEADER)
+        parts.append(SEPARATOR)
+        parts.extend(format_transaction(t) for t in transactions)
+        parts.append(SEPARATOR)
+        
+        if self.page_count > 1:
+            parts.append(f"Página {self.page + 1} de {self.page_count} "
+                         f"(transações {offset + 1} a {offset + len(transactions)}) - ")
+        parts.append(f"Total: {total} transação(ões)\n")
+        
+        return "".join(parts)
+    
+    def show(self) -> None:
+        """Escreve a página atual na saída, com uma única escrita."""
+        self.output.write(self.render_page())
+        self.output.flush()
+    
+    def go_to(self, page: int) -> None:
+        """
+        Muda para uma página (limitada ao intervalo válido).
+        
+        Args:
+            page: Número da página, começando em 0
+        """
+        self.page = min(max(page, 0), self.page_count - 1)
+    
+    def set_page_size(self, page_size: int) -> None:
+        """
+        Altera a quantidade de transações por página, mantendo a primeira
+        transação visível na nova página.
+        
+        Args:
+            page_size: Nova quantidade de transações por página
+        """
+        first = self.page * self.page_size
+        self.page_size = max(1, page_size)
+        self.go_to(first // self.page_size)
+    
+    def handle_command(self, command: str) -> bool:
+        """
+        Executa um comando de navegação.
+        
+        Comandos: N (próxima), P (anterior), I <n> (ir para a página n),
+        T <n> (tamanho da página) e 0 (sair).
+        
+        Args:
+            command: Comando digitado pelo usuário
+            
+        Returns:
+            False se o usuário pediu para sair, True caso contrário
+        """
+        parts = command.strip().upper().split()
+        
+        if not parts or parts[0] == 'N':
+            self.go_to(self.page + 1)
+        elif parts[0] == 'P':
+            self.go_to(self.page - 1)
+        elif parts[0] == '0':
+            return False
+        elif parts[0] in ('I', 'T') and len(parts) == 2 and parts[1].isdigit():
+            if parts[0] == 'I':
+                self.go_to(int(parts[1]) - 1)
+            else:
+                self.set_page_size(int(parts[1]))
+        else:
+            self.output.write("Comando inválido.\n")
+        
+        return True
+    
+    def run(self) -> None:
+        """Exibe as páginas até o usuário sair (uma única página é só exibida)."""
+        self.show()
+        
+        while self.page_count > 1:
+            command = input("[N] Próxima  [P] Anterior  [I n] Ir para página  "
+                            "[T n] Tamanho da página  [0] Voltar: ")
+            
+            if not self.handle_command(command):
+                break
+            
+            self.show()
\ No newline at end of file